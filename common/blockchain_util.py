@@ -1,4 +1,7 @@
+import copy
 import json
+import threading
+import time
 import uuid
 from enum import Enum
 
@@ -27,49 +30,141 @@ class ContractType(Enum):
     ConverterCGV = 'ConverterCGV'
 
 
+class Web3Registry:
+    """
+    Process-wide cache of web3 providers, parsed contract files, checksum addresses and contract objects,
+    so that warm lambda invocations reuse them instead of rebuilding them on every call.
+    """
+    _lock = threading.RLock()
+    _web3_objects = {}
+    _contract_files = {}
+    _contract_addresses = {}
+    _contract_instances = {}
+
+    @classmethod
+    def get_web3(cls, provider_type, provider_url):
+        key = (provider_type, provider_url)
+        with cls._lock:
+            if key not in cls._web3_objects:
+                cls._web3_objects[key] = Web3(cls._create_provider(provider_type, provider_url))
+            return cls._web3_objects[key]
+
+    @staticmethod
+    def _create_provider(provider_type, provider_url):
+        if provider_type == "HTTP_PROVIDER":
+            return Web3.HTTPProvider(provider_url)
+        elif provider_type == "WS_PROVIDER":
+            return LegacyWebSocketProvider(provider_url)
+        raise Exception("Only HTTP_PROVIDER and WS_PROVIDER provider type are supported.")
+
+    @classmethod
+    def get_contract_file(cls, path):
+        """ Returns the shared parsed contract file, callers must not mutate it. """
+        with cls._lock:
+            if path not in cls._contract_files:
+                with open(path) as f:
+                    cls._contract_files[path] = json.load(f)
+            return cls._contract_files[path]
+
+    @classmethod
+    def get_contract_address(cls, path, net_id, token_name, stage, key):
+        cache_key = (path, str(net_id), token_name, stage, key)
+        with cls._lock:
+            if cache_key not in cls._contract_addresses:
+                contract = cls.get_contract_file(path)
+                cls._contract_addresses[cache_key] = Web3.to_checksum_address(
+                    contract[str(net_id)][token_name][stage][key])
+            return cls._contract_addresses[cache_key]
+
+    @classmethod
+    def get_contract_instance(cls, key, factory):
+        with cls._lock:
+            if key not in cls._contract_instances:
+                cls._contract_instances[key] = factory()
+            return cls._contract_instances[key]
+
+    @classmethod
+    def invalidate_provider(cls, provider_type, provider_url):
+        """ Drops the cached provider and every contract object bound to it. """
+        with cls._lock:
+            cls._web3_objects.pop((provider_type, provider_url), None)
+            for key in [key for key in cls._contract_instances if key[:2] == (provider_type, provider_url)]:
+                del cls._contract_instances[key]
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._web3_objects.clear()
+            cls._contract_files.clear()
+            cls._contract_addresses.clear()
+            cls._contract_instances.clear()
+
+
+class BlockNumberOracle:
+    """
+    Serves the latest block number from memory until it is older than the allowed staleness window,
+    which is the smaller of max_staleness_seconds and max_staleness_blocks * block_time_seconds.
+    """
+
+    def __init__(self, blockchain_util, max_staleness_seconds, max_staleness_blocks=None, block_time_seconds=None):
+        self._blockchain_util = blockchain_util
+        self._ttl = max_staleness_seconds
+        if max_staleness_blocks is not None and block_time_seconds is not None:
+            self._ttl = min(self._ttl, max_staleness_blocks * block_time_seconds)
+        self._lock = threading.Lock()
+        self._block_number = None
+        self._fetched_at = 0.0
+
+    def get_block_number(self):
+        return self.get_block_number_and_age()[0]
+
+    def get_block_number_and_age(self):
+        """ Returns the block number and the seconds since it was fetched. """
+        with self._lock:
+            if self._block_number is None or time.monotonic() - self._fetched_at >= self._ttl:
+                self._block_number = self._blockchain_util.get_current_block_no()
+                self._fetched_at = time.monotonic()
+            return self._block_number, time.monotonic() - self._fetched_at
+
+    def invalidate(self):
+        with self._lock:
+            self._block_number = None
+
+
 class BlockChainUtil(object):
 
     def __init__(self, provider_type, provider):
         self._provider_type = provider_type
         self._provider_url = provider
 
-        if self._provider_type == "HTTP_PROVIDER":
-            self.provider = Web3.HTTPProvider(self._provider_url)
-        elif self._provider_type == "WS_PROVIDER":
-            self.provider = LegacyWebSocketProvider(self._provider_url)
-        else:
-            raise Exception("Only HTTP_PROVIDER and WS_PROVIDER provider type are supported.")
-
-        self.web3_object = Web3(self.provider)
+        self.web3_object = Web3Registry.get_web3(self._provider_type, self._provider_url)
+        self.provider = self.web3_object.provider
 
     @staticmethod
     def load_contract(path):
-        with open(path) as f:
-            contract = json.load(f)
-        return contract
+        """ Returns a private copy of the cached contract file, so callers can mutate it safely. """
+        return copy.deepcopy(Web3Registry.get_contract_file(path))
 
     def read_contract_address(self, net_id, path, token_name, stage, key='address'):
-        contract = self.load_contract(path)
-        logger.info("contract: {}".format(contract))
-        return Web3.to_checksum_address(contract[str(net_id)][token_name][stage][key])
+        return Web3Registry.get_contract_address(path=path, net_id=net_id, token_name=token_name, stage=stage,
+                                                 key=key)
 
     def contract_instance(self, contract_abi, address):
-        if self._provider_type == "HTTP_PROVIDER":
-            self.provider = Web3.HTTPProvider(self._provider_url)
-        elif self._provider_type == "WS_PROVIDER":
-            self.provider = LegacyWebSocketProvider(self._provider_url)
-        web3_object = Web3(self.provider)
-        self.web3_object = web3_object
-        return web3_object.eth.contract(abi=contract_abi, address=address)
+        return self.web3_object.eth.contract(abi=contract_abi, address=address)
 
     def get_contract_instance(self, base_path, contract_name, net_id, token_name, stage):
+        key = (self._provider_type, self._provider_url, base_path, contract_name, str(net_id), token_name, stage)
+        return Web3Registry.get_contract_instance(
+            key, lambda: self._create_contract_instance(base_path, contract_name, net_id, token_name, stage))
+
+    def _create_contract_instance(self, base_path, contract_name, net_id, token_name, stage):
         contract_network_path, contract_abi_path = self.get_contract_file_paths(base_path, contract_name)
 
         contract_address = self.read_contract_address(net_id=net_id,
                                                       path=contract_network_path,
                                                       token_name=token_name,
                                                       stage=stage)
-        contract_abi = self.load_contract(contract_abi_path)
+        contract_abi = Web3Registry.get_contract_file(contract_abi_path)
         logger.debug(f"contract address is {contract_address}")
         contract_instance = self.contract_instance(contract_abi=contract_abi, address=contract_address)
 
@@ -98,7 +193,7 @@ class BlockChainUtil(object):
     def create_transaction_object(self, *positional_inputs, method_name, address, contract_path, contract_address_path,
                                   net_id, token_name, stage, gas=None):
         nonce = self.get_nonce(address=address)
-        contract = self.load_contract(path=contract_path)
+        contract = Web3Registry.get_contract_file(contract_path)
         contract_address = self.read_contract_address(net_id=net_id, path=contract_address_path,
                                                       token_name=token_name,
                                                       stage=stage)
@@ -182,9 +277,6 @@ class BlockChainUtil(object):
         return result
 
     def reset_web3_connection(self):
-        if self._provider_type == "HTTP_PROVIDER":
-            self.provider = Web3.HTTPProvider(self._provider_url)
-        elif self._provider_type == "WS_PROVIDER":
-            self.provider = LegacyWebSocketProvider(self._provider_url)
-        web3_object = Web3(self.provider)
-        self.web3_object = web3_object
+        Web3Registry.invalidate_provider(self._provider_type, self._provider_url)
+        self.web3_object = Web3Registry.get_web3(self._provider_type, self._provider_url)
+        self.provider = self.web3_object.provider
@@ -1,5 +1,7 @@
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
 from urllib.parse import urlparse
 
@@ -11,11 +13,24 @@ from common.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Objects copied in parallel by move_s3_objects
+S3_MOVE_MAX_WORKERS = 16
+# Most keys a single S3 DeleteObjects request accepts
+S3_DELETE_BATCH_SIZE = 1000
+
 
 class BotoUtils:
+    # Creating clients from the default boto3 session is not thread safe
+    _client_lock = threading.Lock()
+
     def __init__(self, region_name):
         self.region_name = region_name
 
+    @classmethod
+    def _create_client(cls, *args, **kwargs):
+        with cls._client_lock:
+            return boto3.client(*args, **kwargs)
+
     def get_ssm_parameter(self, parameter, config=Config(retries={'max_attempts': 1})):
         """ Format config=Config(connect_timeout=1, read_timeout=0.1, retries={'max_attempts': 1}) """
         ssm = boto3.client('ssm', region_name=self.region_name, config=config)
@@ -24,7 +39,7 @@ class BotoUtils:
 
     def invoke_lambda(self, lambda_function_arn, invocation_type, payload, config=Config(retries={'max_attempts': 1})):
         """ Format config=Config(connect_timeout=1, read_timeout=0.1, retries={'max_attempts': 1}) """
-        lambda_client = boto3.client('lambda', region_name=self.region_name, config=config)
+        lambda_client = self._create_client('lambda', region_name=self.region_name, config=config)
         lambda_response = lambda_client.invoke(FunctionName=lambda_function_arn, InvocationType=invocation_type,
                                                Payload=payload)
         if invocation_type == "Event":
@@ -122,25 +137,49 @@ class BotoUtils:
             raise e
 
     def move_s3_objects(self, source_bucket, source_key, target_bucket, target_key, clear_destination=False):
-        s3 = boto3.resource('s3')
+        s3_client = self._create_client('s3')
         source_objects = self.get_objects_from_s3(bucket=source_bucket, key=source_key)
-        dest_bucket = s3.Bucket(target_bucket)
         if clear_destination:
             destination_key = target_key[:-1] if target_key.endswith('/') else target_key
             target_objects = self.get_objects_from_s3(bucket=target_bucket, key=destination_key)
-            for key in target_objects:
-                self.delete_objects_from_s3(bucket=target_bucket, key=key['Key'], key_pattern=destination_key)
-        for source_key in source_objects:
-            copy_source = {'Bucket': source_bucket, 'Key': source_key['Key']}
-            dest_bucket.copy(copy_source, target_key + os.path.basename(source_key['Key']))
-            s3.Object(source_bucket, source_key['Key']).delete()
+            self.delete_s3_objects(
+                bucket=target_bucket,
+                keys=[obj['Key'] for obj in target_objects if destination_key in obj['Key']],
+                s3_client=s3_client
+            )
+
+        def copy_object(source_object):
+            copy_source = {'Bucket': source_bucket, 'Key': source_object['Key']}
+            s3_client.copy(copy_source, target_bucket, target_key + os.path.basename(source_object['Key']))
+
+        if source_objects:
+            with ThreadPoolExecutor(max_workers=min(S3_MOVE_MAX_WORKERS, len(source_objects))) as executor:
+                list(executor.map(copy_object, source_objects))
+        # Sources are only removed once every copy succeeded
+        self.delete_s3_objects(bucket=source_bucket, keys=[obj['Key'] for obj in source_objects],
+                               s3_client=s3_client)
+
+    @staticmethod
+    def delete_s3_objects(bucket, keys, s3_client=None):
+        """ Deletes the keys with DeleteObjects requests of up to S3_DELETE_BATCH_SIZE keys. """
+        if not keys:
+            return
+        s3_client = BotoUtils._create_client('s3') if s3_client is None else s3_client
+        for start in range(0, len(keys), S3_DELETE_BATCH_SIZE):
+            batch = keys[start:start + S3_DELETE_BATCH_SIZE]
+            response = s3_client.delete_objects(
+                Bucket=bucket, Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+            )
+            if response.get('Errors'):
+                raise Exception(f"Failed to delete objects from {bucket} :: {response['Errors']}")
 
     @staticmethod
     def clear_s3_files(bucket, key):
         try:
             to_delete_objects = BotoUtils.get_objects_from_s3(bucket = bucket, key = key)
-            for delete_obj in to_delete_objects:
-                BotoUtils.delete_objects_from_s3(bucket = bucket, key = delete_obj["Key"], key_pattern = key)
+            BotoUtils.delete_s3_objects(
+                bucket = bucket, keys = [obj["Key"] for obj in to_delete_objects if key in obj["Key"]]
+            )
         except Exception as e:
             msg = f"Error in deleting stub files :: {repr(e)}"
             logger.info(msg)
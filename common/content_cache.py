@@ -0,0 +1,184 @@
+import hashlib
+from abc import ABC, abstractmethod
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import boto3
+from botocore.exceptions import ClientError
+
+from common.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ContentCache(ABC):
+    """
+    Cache of immutable content keyed by its content identifier (IPFS/Filecoin CID),
+    so a cached value never has to be invalidated.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, cid: str) -> Optional[bytes]:
+        data = self._get(cid)
+        if data is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return data
+
+    def put(self, cid: str, data: bytes) -> None:
+        self._put(cid, data)
+
+    @property
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses}
+
+    @abstractmethod
+    def _get(self, cid: str) -> Optional[bytes]: ...
+
+    @abstractmethod
+    def _put(self, cid: str, data: bytes) -> None: ...
+
+
+class LRUContentCache(ContentCache):
+    """
+    In-process tier. Keeps the most recently used entries within max_bytes,
+    entries bigger than the whole budget are not kept at all.
+    """
+
+    def __init__(self, max_bytes: int):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, cid: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._entries.get(cid)
+            if data is not None:
+                self._entries.move_to_end(cid)
+            return data
+
+    def _put(self, cid: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(cid, None)
+            if previous is not None:
+                self.size_bytes -= len(previous)
+            self._entries[cid] = data
+            self.size_bytes += len(data)
+            while self.size_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size_bytes -= len(evicted)
+
+    @property
+    def stats(self) -> dict:
+        return {**super().stats, "entries": len(self._entries), "size_bytes": self.size_bytes}
+
+
+class DiskContentCache(ContentCache):
+    """
+    Local disk tier, e.g. /tmp of a lambda container or a volume shared by workers.
+    """
+
+    def __init__(self, directory: str):
+        super().__init__()
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, cid: str) -> str:
+        # CIDs of wrapped files look like "<cid>/<file name>"
+        return os.path.join(self.directory, hashlib.sha256(cid.encode()).hexdigest())
+
+    def _get(self, cid: str) -> Optional[bytes]:
+        try:
+            with open(self._path(cid), "rb") as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+    def _put(self, cid: str, data: bytes) -> None:
+        with tempfile.NamedTemporaryFile(dir=self.directory, delete=False) as temp_file:
+            temp_file.write(data)
+        os.replace(temp_file.name, self._path(cid))
+
+
+class S3ContentCache(ContentCache):
+    """
+    Shared tier that survives cold starts and is reused by every service reading the same CIDs.
+    """
+
+    def __init__(self, bucket: str, prefix: str = "", s3_client=None):
+        super().__init__()
+        self.bucket = bucket
+        self.prefix = prefix
+        self._s3_client = boto3.client("s3") if s3_client is None else s3_client
+
+    def _key(self, cid: str) -> str:
+        return f"{self.prefix}{cid}"
+
+    def _get(self, cid: str) -> Optional[bytes]:
+        try:
+            response = self._s3_client.get_object(Bucket=self.bucket, Key=self._key(cid))
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") not in ("NoSuchKey", "404"):
+                logger.warning(f"Unable to read {cid} from the metadata cache: {repr(e)}")
+            return None
+        return response["Body"].read()
+
+    def _put(self, cid: str, data: bytes) -> None:
+        try:
+            self._s3_client.put_object(Bucket=self.bucket, Key=self._key(cid), Body=data)
+        except ClientError as e:
+            logger.warning(f"Unable to write {cid} to the metadata cache: {repr(e)}")
+
+
+class TieredContentCache(ContentCache):
+    """
+    Looks the tiers up in order and copies a hit into the faster tiers above it.
+    """
+
+    def __init__(self, tiers: list[ContentCache]):
+        super().__init__()
+        self.tiers = tiers
+
+    def _get(self, cid: str) -> Optional[bytes]:
+        for index, tier in enumerate(self.tiers):
+            data = tier.get(cid)
+            if data is not None:
+                for upper_tier in self.tiers[:index]:
+                    upper_tier.put(cid, data)
+                return data
+        return None
+
+    def _put(self, cid: str, data: bytes) -> None:
+        for tier in self.tiers:
+            tier.put(cid, data)
+
+    @property
+    def stats(self) -> dict:
+        return {
+            **super().stats,
+            "tiers": {type(tier).__name__: tier.stats for tier in self.tiers},
+        }
+
+
+def create_content_cache(config: dict) -> TieredContentCache:
+    """
+    Builds the cache from a METADATA_CACHE config: an in-process LRU of max_bytes,
+    followed by a disk tier when directory is set and an S3 tier when s3_bucket is set.
+    """
+    tiers: list[ContentCache] = [LRUContentCache(config.get("max_bytes", 32 * 1024 * 1024))]
+    if config.get("directory"):
+        tiers.append(DiskContentCache(config["directory"]))
+    if config.get("s3_bucket"):
+        tiers.append(S3ContentCache(config["s3_bucket"], config.get("s3_prefix", "")))
+    return TieredContentCache(tiers)
@@ -0,0 +1,144 @@
+import io
+from typing import Iterable, Optional
+
+import boto3
+
+from common.constant import StatusCode
+from common.logger import get_logger
+from common.utils import generate_lambda_response, generate_lambda_text_file_response, generate_uuid
+
+logger = get_logger(__name__)
+
+# Lambda responses are limited to 6 MB and the inline file is base64 encoded (4/3 of the size)
+DEFAULT_INLINE_LIMIT_BYTES = 4 * 1024 * 1024
+# S3 requires every part except the last one to be at least 5 MiB
+DEFAULT_PART_SIZE_BYTES = 8 * 1024 * 1024
+DEFAULT_URL_EXPIRATION_SECONDS = 3600
+CONTENT_TYPE = "text/plain; charset=utf-8"
+
+
+class FileExport:
+    """
+    Text file written incrementally, e.g. by csv.writer. Small files are kept in memory and
+    returned inline, once the content outgrows inline_limit it is streamed to S3 with a
+    multipart upload and returned as a pre-signed URL, so at most part_size bytes are
+    buffered at any time.
+    """
+
+    def __init__(
+            self,
+            filename: str,
+            bucket: Optional[str] = None,
+            key_prefix: str = "",
+            inline_limit: int = DEFAULT_INLINE_LIMIT_BYTES,
+            part_size: int = DEFAULT_PART_SIZE_BYTES,
+            url_expiration: int = DEFAULT_URL_EXPIRATION_SECONDS,
+            s3_client=None
+    ):
+        self.filename = filename
+        self.size = 0
+        self.url = None
+        self._bucket = bucket
+        self._key = f"{key_prefix}{generate_uuid()}/{filename}"
+        self._inline_limit = inline_limit
+        self._part_size = part_size
+        self._url_expiration = url_expiration
+        self._s3_client = s3_client
+        self._buffer = io.BytesIO()
+        self._upload_id = None
+        self._parts = []
+
+    @property
+    def is_inline(self) -> bool:
+        return self._upload_id is None
+
+    def write(self, data: str) -> int:
+        encoded_data = data.encode("utf-8")
+        self._buffer.write(encoded_data)
+        self.size += len(encoded_data)
+
+        if self.is_inline:
+            if self._bucket and self._buffer.tell() > self._inline_limit:
+                self._start_upload()
+        if not self.is_inline and self._buffer.tell() >= self._part_size:
+            self._upload_part()
+
+        return len(data)
+
+    def write_lines(self, lines: Iterable[str], separator: str = "\n") -> None:
+        """ Writes the same content as separator.join(lines) without building it. """
+        for index, line in enumerate(lines):
+            self.write(line if index == 0 else separator + line)
+
+    def getvalue(self) -> str:
+        return self._buffer.getvalue().decode("utf-8")
+
+    def close(self) -> None:
+        if self.is_inline or self.url is not None:
+            return
+
+        if self._buffer.tell() or not self._parts:
+            self._upload_part()
+        self._s3_client.complete_multipart_upload(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": self._parts}
+        )
+        self.url = self._s3_client.generate_presigned_url(
+            "get_object",
+            Params={
+                "Bucket": self._bucket,
+                "Key": self._key,
+                "ResponseContentType": CONTENT_TYPE,
+                "ResponseContentDisposition": f'attachment; filename="{self.filename}"'
+            },
+            ExpiresIn=self._url_expiration
+        )
+        logger.info(f"Exported {self.size} bytes to s3://{self._bucket}/{self._key} in {len(self._parts)} parts")
+
+    def abort(self) -> None:
+        if self.is_inline:
+            return
+        try:
+            self._s3_client.abort_multipart_upload(Bucket=self._bucket, Key=self._key, UploadId=self._upload_id)
+        except Exception:
+            logger.exception(f"Failed to abort multipart upload of s3://{self._bucket}/{self._key}")
+
+    def to_lambda_response(self, cors_enabled: bool = False) -> dict:
+        if self.is_inline:
+            return generate_lambda_text_file_response(self.getvalue(), self.filename, cors_enabled=cors_enabled)
+        return generate_lambda_response(
+            StatusCode.OK,
+            {"status": "success", "data": {"url": self.url, "filename": self.filename}, "error": {}},
+            cors_enabled=cors_enabled
+        )
+
+    def __enter__(self) -> "FileExport":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _start_upload(self) -> None:
+        if self._s3_client is None:
+            self._s3_client = boto3.client("s3")
+        response = self._s3_client.create_multipart_upload(
+            Bucket=self._bucket, Key=self._key, ContentType=CONTENT_TYPE
+        )
+        self._upload_id = response["UploadId"]
+
+    def _upload_part(self) -> None:
+        part_number = len(self._parts) + 1
+        response = self._s3_client.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=self._buffer.getvalue()
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+        self._buffer = io.BytesIO()
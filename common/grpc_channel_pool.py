@@ -0,0 +1,146 @@
+import atexit
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlparse
+
+import grpc
+
+from common.logger import get_logger
+from resources.certificates.root_certificate import certificate
+
+logger = get_logger(__name__)
+
+# Daemons sit behind load balancers that drop idle HTTP/2 connections, so pings are only sent
+# while calls are in flight and idle channels are closed by the pool instead.
+DEFAULT_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 0),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+DEFAULT_IDLE_TIMEOUT_SECONDS = 300
+# Deadline of every daemon call made through the pooled channels
+DAEMON_GRPC_TIMEOUT_SECONDS = 10
+
+
+def parse_daemon_endpoint(daemon_endpoint: str) -> tuple[str, bool]:
+    """
+    Converts a daemon endpoint from service metadata (http(s)://host[:port]) to a grpc target
+    and whether the channel must use TLS.
+    """
+    endpoint_object = urlparse(daemon_endpoint)
+    if endpoint_object.hostname is None:
+        raise ValueError("Invalid daemon endpoint: {}".format(daemon_endpoint))
+
+    if endpoint_object.port is not None:
+        channel_endpoint = endpoint_object.hostname + ":" + str(endpoint_object.port)
+    else:
+        channel_endpoint = endpoint_object.hostname
+
+    if endpoint_object.scheme == "http":
+        return channel_endpoint, False
+    elif endpoint_object.scheme == "https":
+        return channel_endpoint, True
+    raise ValueError(
+        "Unsupported scheme in service metadata ('{}')".format(endpoint_object.scheme)
+    )
+
+
+class GrpcChannelPool:
+    """
+    Keeps one grpc channel per (target, secure) for the lifetime of the container, so calls to the
+    same daemon reuse its TLS session and HTTP/2 connection. Channels unused for idle_timeout_seconds
+    are closed on the next access.
+    """
+
+    def __init__(
+            self,
+            root_certificates: Optional[bytes] = None,
+            idle_timeout_seconds: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+            options: Optional[list] = None
+    ):
+        self._root_certificates = root_certificates
+        self._idle_timeout_seconds = idle_timeout_seconds
+        self._options = DEFAULT_CHANNEL_OPTIONS if options is None else options
+        self._channels: dict[tuple[str, bool], grpc.Channel] = {}
+        self._last_used: dict[tuple[str, bool], float] = {}
+        self._lock = threading.Lock()
+
+    def get_channel(self, target: str, secure: bool = True) -> grpc.Channel:
+        key = (target, secure)
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle_channels(now, keep=key)
+            channel = self._channels.get(key)
+            if channel is None:
+                channel = self._create_channel(target, secure)
+                self._channels[key] = channel
+            self._last_used[key] = now
+            return channel
+
+    def get_daemon_channel(self, daemon_endpoint: str) -> grpc.Channel:
+        return self.get_channel(*parse_daemon_endpoint(daemon_endpoint))
+
+    def discard_channel(self, target: str, secure: bool = True) -> None:
+        """ Closes the channel of the target, e.g. after the daemon moved, so the next call reconnects. """
+        with self._lock:
+            channel = self._channels.pop((target, secure), None)
+            self._last_used.pop((target, secure), None)
+        if channel is not None:
+            channel.close()
+
+    def close(self) -> None:
+        with self._lock:
+            channels = list(self._channels.values())
+            self._channels.clear()
+            self._last_used.clear()
+        for channel in channels:
+            channel.close()
+
+    def __len__(self) -> int:
+        return len(self._channels)
+
+    def _create_channel(self, target: str, secure: bool) -> grpc.Channel:
+        logger.debug(f"Opening grpc channel to {target}, secure: {secure}")
+        if secure:
+            return grpc.secure_channel(
+                target, grpc.ssl_channel_credentials(root_certificates=self._root_certificates), options=self._options
+            )
+        return grpc.insecure_channel(target, options=self._options)
+
+    def _evict_idle_channels(self, now: float, keep: tuple[str, bool]) -> None:
+        idle_keys = [
+            key for key, last_used in self._last_used.items()
+            if key != keep and now - last_used >= self._idle_timeout_seconds
+        ]
+        for key in idle_keys:
+            logger.debug(f"Closing idle grpc channel to {key[0]}")
+            self._channels.pop(key).close()
+            del self._last_used[key]
+
+
+_daemon_channel_pool = None
+_daemon_channel_pool_lock = threading.Lock()
+
+
+def get_daemon_channel_pool() -> GrpcChannelPool:
+    """
+    Returns the channel pool shared by all daemon clients of a warm container.
+    """
+    global _daemon_channel_pool
+    with _daemon_channel_pool_lock:
+        if _daemon_channel_pool is None:
+            _daemon_channel_pool = GrpcChannelPool(root_certificates=certificate)
+        return _daemon_channel_pool
+
+
+def close_daemon_channel_pool() -> None:
+    global _daemon_channel_pool
+    with _daemon_channel_pool_lock:
+        pool, _daemon_channel_pool = _daemon_channel_pool, None
+    if pool is not None:
+        pool.close()
+
+
+atexit.register(close_daemon_channel_pool)
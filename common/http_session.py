@@ -0,0 +1,87 @@
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from common.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (connect, read) timeouts of requests sent without an explicit timeout
+DEFAULT_TIMEOUT_SECONDS = (3.05, 30)
+DEFAULT_POOL_MAXSIZE = 10
+# Connection errors are retried for every verb since the request never reached the server,
+# read errors and these statuses only for the idempotent ones (urllib3 default allowed_methods)
+DEFAULT_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    raise_on_status=False,
+)
+
+
+class HttpSession(requests.Session):
+    """
+    Keep-alive session with a pooled adapter, default timeouts and bounded retries with backoff.
+    Requests accept an extra endpoint argument naming the endpoint in the latency metrics,
+    by default it is the method and the url without the query.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            timeout=DEFAULT_TIMEOUT_SECONDS,
+            retry: Retry = DEFAULT_RETRY,
+            pool_maxsize: int = DEFAULT_POOL_MAXSIZE
+    ):
+        super().__init__()
+        self.name = name
+        self.timeout = timeout
+        self.latency_stats: dict[str, dict] = {}
+        self._stats_lock = threading.Lock()
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def request(self, method, url, *args, endpoint: Optional[str] = None, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        if endpoint is None:
+            parsed_url = urlparse(url)
+            endpoint = f"{method.upper()} {parsed_url.netloc}{parsed_url.path}"
+
+        start = time.perf_counter()
+        status = "error"
+        try:
+            response = super().request(method, url, *args, **kwargs)
+            status = response.status_code
+            return response
+        finally:
+            self._record_latency(endpoint, status, time.perf_counter() - start)
+
+    def _record_latency(self, endpoint: str, status, elapsed_seconds: float) -> None:
+        with self._stats_lock:
+            stats = self.latency_stats.setdefault(endpoint, {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+            stats["count"] += 1
+            stats["total_seconds"] += elapsed_seconds
+            stats["max_seconds"] = max(stats["max_seconds"], elapsed_seconds)
+        logger.info(f"HTTP {self.name} {endpoint} status={status} latency_ms={elapsed_seconds * 1000:.1f}")
+
+
+_http_sessions: dict[str, HttpSession] = {}
+_http_sessions_lock = threading.Lock()
+
+
+def get_http_session(name: str, **kwargs) -> HttpSession:
+    """
+    Returns the session of the named upstream shared by all clients of a warm container,
+    kwargs are only used when the session is created.
+    """
+    with _http_sessions_lock:
+        if name not in _http_sessions:
+            _http_sessions[name] = HttpSession(name, **kwargs)
+        return _http_sessions[name]
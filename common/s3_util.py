@@ -1,6 +1,9 @@
+import threading
 from urllib.parse import urlparse
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
 
 
 # create an STS client object that represents a live connection to the
@@ -9,19 +12,30 @@ import boto3
 
 class S3Util(object):
 
+    # Multipart parts are read from the source one at a time, so a streamed upload holds
+    # at most max_concurrency parts in memory
+    STREAM_TRANSFER_CONFIG = TransferConfig(multipart_chunksize=8 * 1024 * 1024, max_concurrency=2)
+
     def __init__(self, aws_access_key, aws_secret_key):
         self.aws_access_key = aws_access_key
         self.aws_secret_key = aws_secret_key
+        self.__s3_resource = None
+        self.__lock = threading.Lock()
 
     def get_s3_resource_from_key(self):
-        s3_resource = boto3.resource(
-            's3',
-            aws_access_key_id=self.aws_access_key,
-            aws_secret_access_key=self.aws_secret_key
+        with self.__lock:
+            if self.__s3_resource is None:
+                self.__s3_resource = boto3.resource(
+                    's3',
+                    aws_access_key_id=self.aws_access_key,
+                    aws_secret_access_key=self.aws_secret_key
+                )
 
-        )
+        return self.__s3_resource
 
-        return s3_resource
+    def get_s3_client(self):
+        # Unlike the resource, the low level client can be shared between threads
+        return self.get_s3_resource_from_key().meta.client
 
     def get_s3_resource_from_assumed_role(self):
         sts_client = boto3.client('sts')
@@ -64,14 +78,33 @@ class S3Util(object):
         obj.upload_fileobj(io_bytes)
         return s3_url
 
+    def push_stream_to_s3(self, key, bucket_name, stream, metadata=None):
+        s3_url = 'https://{}.s3.amazonaws.com/{}'.format(bucket_name, key)
+        extra_args = {"Metadata": metadata} if metadata else None
+        self.get_s3_client().upload_fileobj(
+            stream, bucket_name, key, ExtraArgs=extra_args, Config=self.STREAM_TRANSFER_CONFIG
+        )
+        return s3_url
+
+    def get_object_metadata(self, bucket_name, key):
+        """
+        Returns the user metadata of the object, or None if there is no such object.
+        """
+        try:
+            response = self.get_s3_client().head_object(Bucket=bucket_name, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise e
+        return response.get("Metadata", {})
+
     def get_bucket_and_key_from_url(self, url):
         parsed_url = urlparse(url)
         return parsed_url.hostname.split(".")[0], parsed_url.path[1:]
 
     def delete_file_from_s3(self, url):
-        s3_resource = self.get_s3_resource_from_key()
         bucket, key = self.get_bucket_and_key_from_url(url)
-        result = s3_resource.Object(bucket, key).delete()
+        result = self.get_s3_client().delete_object(Bucket=bucket, Key=key)
         return result
 
     def push_file_to_s3(self, file_path, bucket, key):
@@ -0,0 +1,70 @@
+from typing import Any, Callable, Hashable, Optional
+
+from common.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def process_sqs_batch(
+        event: dict,
+        parse_record: Callable[[dict], Any],
+        get_entity_key: Callable[[Any], Optional[Hashable]],
+        process: Callable[[Any], None],
+        should_stop: Optional[Callable[[], bool]] = None
+) -> dict:
+    """
+    Processes the records of an SQS batch, keeping only the latest message per entity.
+
+    parse_record turns a record into a message, or None when the record carries nothing to process.
+    get_entity_key returns the entity a message applies to, or None when the message must not be
+    coalesced with others. The latest message of every entity is passed to process, at the position
+of the entity's first message, so an entity is still handled before the ones that followed it.
+
+    should_stop is checked before every message, once it returns True the remaining messages are
+    not processed and reported as failed, so a lambda close to its timeout hands them back to SQS
+    instead of having the whole batch retried.
+
+    Returns the SQS partial batch response: the records that could not be parsed and every record
+    coalesced into a message that failed or was not processed, so only those are retried.
+    """
+    failed_message_ids = []
+    latest_messages = {}
+    coalesced_message_ids = {}
+
+    for position, record in enumerate(event.get("Records", [])):
+        message_id = record.get("messageId")
+        try:
+            message = parse_record(record)
+            if message is None:
+                continue
+            entity_key = get_entity_key(message)
+        except Exception as e:
+            logger.exception(f"Unable to parse record {message_id}: {repr(e)}")
+            failed_message_ids.append(message_id)
+            continue
+
+        if entity_key is None:
+            entity_key = ("message", position)
+        first_position = latest_messages.get(entity_key, (position, None))[0]
+        latest_messages[entity_key] = (first_position, message)
+        coalesced_message_ids.setdefault(entity_key, []).append(message_id)
+
+    skipped_count = sum(len(message_ids) - 1 for message_ids in coalesced_message_ids.values())
+    if skipped_count:
+        logger.info(f"Skipping {skipped_count} messages superseded by a later one of the same entity")
+
+    ordered_messages = sorted(latest_messages.items(), key=lambda item: item[1][0])
+    for index, (entity_key, (_, message)) in enumerate(ordered_messages):
+        if should_stop is not None and should_stop():
+            remaining_messages = ordered_messages[index:]
+            logger.warning(f"Stopping the batch before the deadline, {len(remaining_messages)} messages left")
+            for remaining_entity_key, _ in remaining_messages:
+                failed_message_ids.extend(coalesced_message_ids[remaining_entity_key])
+            break
+        try:
+            process(message)
+        except Exception as e:
+            logger.exception(f"Unable to process message for {entity_key}: {repr(e)}")
+            failed_message_ids.extend(coalesced_message_ids[entity_key])
+
+    return {"batchItemFailures": [{"itemIdentifier": message_id} for message_id in failed_message_ids]}
@@ -1,13 +1,16 @@
+import io
+import gzip
 import json
 from enum import EnumMeta, Enum
 import os
 import tarfile
 import tempfile
-from typing import List, Tuple, Union
+from typing import BinaryIO, Iterator, List, Tuple, Union
 from zipfile import ZipFile
 
 from common.exceptions import BadRequestException
-from contract_api.config import IPFS_URL
+from contract_api.config import IPFS_URL, METADATA_CACHE
+from common.content_cache import ContentCache, create_content_cache
 from common.exceptions import LighthouseInternalException
 from common.logger import get_logger
 
@@ -16,6 +19,20 @@ from lighthouseweb3 import Lighthouse
 
 logger = get_logger(__name__)
 
+# Size up to which a tar built from a zip archive is kept in memory before spilling to disk
+TAR_SPOOL_MAX_MEMORY_BYTES = 64 * 1024 * 1024
+IPFS_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Shared by every StorageProvider of the process, the content behind a CID never changes
+_content_cache: ContentCache | None = None
+
+
+def get_content_cache() -> ContentCache:
+    global _content_cache
+    if _content_cache is None:
+        _content_cache = create_content_cache(METADATA_CACHE)
+    return _content_cache
+
 
 class MetaEnum(EnumMeta):
     def __contains__(cls, item):
@@ -44,11 +61,16 @@ def validate_storage_provider(storage_provider: str) -> StorageProviderType:
 
 
 class StorageProvider:
-    def __init__(self, lighthouse_token: Union[str, None] = "read_only_token"):
+    def __init__(
+        self,
+        lighthouse_token: Union[str, None] = "read_only_token",
+        content_cache: Union[ContentCache, None] = None,
+    ):
         if lighthouse_token is None or lighthouse_token == "":
             lighthouse_token = "read_only_token"
         self.__ipfs_util = IPFSUtil(IPFS_URL["url"], IPFS_URL["port"])
         self.__lighthouse_client = Lighthouse(lighthouse_token)
+        self.__content_cache = get_content_cache() if content_cache is None else content_cache
 
     def get(self, metadata_uri: str, to_decode: bool = True) -> Union[dict, bytes]:
         """
@@ -58,19 +80,47 @@ class StorageProvider:
         :param to_decode: bool, whether to decode the data
         """
         provider_type, hash_uri = self.uri_to_hash(metadata_uri)
-        logger.info(f"Get metadata from provider: {provider_type}, hash: {hash_uri}")
 
-        if provider_type == StorageProviderType.IPFS:
-            data_bytes = self.__ipfs_util.read_bytes_from_ipfs(hash_uri)
-        elif provider_type == StorageProviderType.FILECOIN:
-            data_bytes = self.__lighthouse_client.download(hash_uri)[0]
+        data_bytes = self.__content_cache.get(hash_uri)
+        if data_bytes is None:
+            logger.info(f"Get metadata from provider: {provider_type}, hash: {hash_uri}")
+            if provider_type == StorageProviderType.IPFS:
+                data_bytes = self.__ipfs_util.read_bytes_from_ipfs(hash_uri)
+            elif provider_type == StorageProviderType.FILECOIN:
+                data_bytes = self.__lighthouse_client.download(hash_uri)[0]
+            self.__content_cache.put(hash_uri, data_bytes)
+        else:
+            logger.info(f"Get metadata from cache, hash: {hash_uri}")
 
         if to_decode:
-            logger.info(f"Resulting data: data bytes = {data_bytes}, dict = {json.loads(data_bytes.decode('utf-8'))}")
-            return json.loads(data_bytes.decode("utf-8"))
+            data = json.loads(data_bytes.decode("utf-8"))
+            logger.info(f"Resulting data: {data}")
+            return data
         else:
             return data_bytes
  
+    def get_stream(self, file_uri: str) -> BinaryIO:
+        """
+        Open a file from provider storage as a readable stream, for files too big to be held in memory.
+        IPFS content is streamed from the node, cached content and Filecoin downloads are served from memory.
+
+        :param file_uri: str, provider storage prefix + hash
+        """
+        provider_type, hash_uri = self.uri_to_hash(file_uri)
+
+        data_bytes = self.__content_cache.get(hash_uri)
+        if data_bytes is not None:
+            return io.BytesIO(data_bytes)
+
+        logger.info(f"Stream file from provider: {provider_type}, hash: {hash_uri}")
+        if provider_type == StorageProviderType.FILECOIN:
+            return io.BytesIO(self.__lighthouse_client.download(hash_uri)[0])
+        return io.BufferedReader(IteratorStream(self.__ipfs_util.stream_bytes_from_ipfs(hash_uri)))
+
+    @property
+    def content_cache_stats(self) -> dict:
+        return self.__content_cache.stats
+
     def __upload_to_provider(self, file_path: str, provider_type: StorageProviderType) -> str:
         """
         Upload file to the specified storage provider.
@@ -102,7 +152,13 @@ class StorageProvider:
         """
         logger.info(
             f"Publishing file to storage: source = {source}, provider type = {provider_type}, zip_archive = {zip_archive}")
-        if zip_archive:
+        if zip_archive and provider_type == StorageProviderType.IPFS:
+            # IPFS accepts the tar as a stream, so it only touches the disk when it is too big for memory
+            with FileUtils.convert_zip_to_tar_spool(source, ignored_files) as tar_file:
+                hash_uri = self.hash_to_uri(self.__ipfs_util.write_fileobj_in_ipfs(tar_file), provider_type)
+            logger.info(f"hash_uri = {hash_uri}")
+            return hash_uri
+        elif zip_archive:
             try:
                 temp_tar_path = FileUtils.convert_zip_to_temp_tar(source, ignored_files)
                 logger.info(f"temp_tar_path = {temp_tar_path}")
@@ -141,6 +197,9 @@ class IPFSUtil:
     def read_bytes_from_ipfs(self, ipfs_hash: str) -> bytes:
         return self.ipfs_conn.cat(ipfs_hash)
 
+    def stream_bytes_from_ipfs(self, ipfs_hash: str) -> Iterator[bytes]:
+        return self.ipfs_conn.cat(ipfs_hash, stream=True)
+
     def write_file_in_ipfs(self, filepath: str, wrap_with_directory: bool=False) -> str:
         """
         Push a file to IPFS given its path.
@@ -156,6 +215,18 @@ class IPFSUtil:
             logger.error(f"File error {repr(err)}")
         return ""
 
+    def write_fileobj_in_ipfs(self, fileobj: BinaryIO) -> str:
+        """
+        Push the content of a file object to IPFS, reading it in chunks.
+        """
+        try:
+            # Read through a nameless stream, the client takes the upload file name from fileobj.name
+            chunks = iter(lambda: fileobj.read(IPFS_UPLOAD_CHUNK_SIZE), b"")
+            return self.ipfs_conn.add(io.BufferedReader(IteratorStream(chunks)), pin=True)["Hash"]
+        except Exception as err:
+            logger.error(f"File error {repr(err)}")
+        return ""
+
     def read_file_from_ipfs(self, ipfs_hash):
         """
         1. Get data from ipfs with ipfs_hash.
@@ -165,6 +236,30 @@ class IPFSUtil:
         return json.loads(ipfs_data.decode("utf8"))
 
 
+class IteratorStream(io.RawIOBase):
+    """
+    Read-only file object over an iterator of byte chunks, e.g. a streamed HTTP response.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self.__chunks = chunks
+        self.__pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self.__pending:
+            try:
+                self.__pending = next(self.__chunks)
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self.__pending))
+        buffer[:size] = self.__pending[:size]
+        self.__pending = self.__pending[size:]
+        return size
+
+
 class FileUtils:
     @staticmethod
     def convert_zip_to_temp_tar(
@@ -177,41 +272,96 @@ class FileUtils:
 
         :param zip_path: str, full path to the zip file
         :param exclude_files: list, files to ignore during tar creation (default is None)
+        :param include_files: list, when given only these files are added (default is None)
         :return: str, path to the temporary tar file
         """
-
-        # Validate the zip file
-        if exclude_files is None:
-            exclude_files = []
-        if include_files is None:
-            include_files = []
-
         if not os.path.isfile(zip_path):
             raise FileNotFoundError(f"Zip file '{zip_path}' does not exist.")
 
-        # Create a temporary tar file
         with tempfile.NamedTemporaryFile(delete=False, suffix=".tar.gz") as temp_tar:
             tar_path = temp_tar.name
+            try:
+                FileUtils.write_zip_as_tar(zip_path, temp_tar, exclude_files, include_files)
+            except Exception as e:
+                # Clean up the temporary tar file if something goes wrong
+                temp_tar.close()
+                os.remove(tar_path)
+                raise e
 
+        return tar_path
+
+    @staticmethod
+    def convert_zip_to_tar_spool(
+        zip_path: str,
+        exclude_files: List[str] = None,
+        include_files: List[str] = None,
+    ) -> BinaryIO:
+        """
+        Convert a zip archive into a tar file kept in memory up to TAR_SPOOL_MAX_MEMORY_BYTES
+        and spilled to disk past it. The returned file is positioned at its start.
+        """
+        if not os.path.isfile(zip_path):
+            raise FileNotFoundError(f"Zip file '{zip_path}' does not exist.")
+
+        spool = tempfile.SpooledTemporaryFile(max_size=TAR_SPOOL_MAX_MEMORY_BYTES, suffix=".tar.gz")
         try:
-            # Extract the zip archive to a temporary directory
-            with tempfile.TemporaryDirectory() as temp_dir:
-                logger.debug(f"Extracting zip file: {zip_path}")
-                with ZipFile(zip_path, 'r') as zip_obj:
-                    zip_obj.extractall(temp_dir)
-
-                # Create the tar file and write to the temporary tar path
-                with tarfile.open(tar_path, mode="w:gz") as tar:
-                    for file_path in os.scandir(temp_dir):
-                        logger.info(f"Adding file to tar: {file_path}")
-                        tar.add(file_path.path, arcname=os.path.basename(file_path), filter=FileUtils.reset)
-
-            return tar_path  # Return the path to the temporary tar file
+            FileUtils.write_zip_as_tar(zip_path, spool, exclude_files, include_files)
         except Exception as e:
-            # Clean up the temporary tar file if something goes wrong
-            if os.path.exists(tar_path):
-                os.remove(tar_path)
+            spool.close()
             raise e
+        spool.seek(0)
+        return spool
+
+    @staticmethod
+    def write_zip_as_tar(
+        zip_path: str,
+        fileobj: BinaryIO,
+        exclude_files: List[str] = None,
+        include_files: List[str] = None,
+    ) -> None:
+        """
+        Stream the members of a zip archive into a gzip tar written to fileobj, without extracting them.
+        Members are added in name order with their owner, mode and mtime reset, so the same zip always
+        gives the same tar. A member is skipped when its name or any of its path components is in
+        exclude_files, and when include_files is given, files whose name or path are not in it are skipped.
+        """
+        exclude_files = set(exclude_files or [])
+        include_files = set(include_files or [])
+        added_directories = set()
+
+        # The gzip header must not carry the current time or the file name either
+        with ZipFile(zip_path, "r") as zip_obj, \
+                gzip.GzipFile(filename="", mode="wb", fileobj=fileobj, mtime=0) as gzip_file, \
+                tarfile.open(fileobj=gzip_file, mode="w", format=tarfile.PAX_FORMAT) as tar:
+            for member in sorted(zip_obj.infolist(), key=lambda info: info.filename):
+                name = member.filename.rstrip("/")
+                parts = name.split("/")
+                if not name or exclude_files.intersection(parts):
+                    continue
+                if not member.is_dir() and include_files and not include_files.intersection((name, parts[-1])):
+                    continue
+
+                directory_depth = len(parts) if member.is_dir() else len(parts) - 1
+                for depth in range(1, directory_depth + 1):
+                    directory = "/".join(parts[:depth])
+                    if directory not in added_directories:
+                        added_directories.add(directory)
+                        tar.addfile(FileUtils._tar_info(directory, tarfile.DIRTYPE, 0o755))
+                if member.is_dir():
+                    continue
+
+                logger.debug(f"Adding file to tar: {name}")
+                tarinfo = FileUtils._tar_info(name, tarfile.REGTYPE, 0o644)
+                tarinfo.size = member.file_size
+                with zip_obj.open(member) as member_file:
+                    tar.addfile(tarinfo, member_file)
+
+    @staticmethod
+    def _tar_info(name: str, entry_type: bytes, mode: int) -> tarfile.TarInfo:
+        tarinfo = tarfile.TarInfo(name)
+        tarinfo.type = entry_type
+        tarinfo.mode = mode
+        return FileUtils.reset(tarinfo)
 
     @staticmethod
     def reset(tarinfo: tarfile.TarInfo) -> tarfile.TarInfo:
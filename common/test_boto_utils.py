@@ -0,0 +1,94 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from common.boto_utils import BotoUtils, S3_DELETE_BATCH_SIZE
+
+
+def _s3_client():
+    s3_client = MagicMock()
+    s3_client.delete_objects.return_value = {}
+    return s3_client
+
+
+class TestBotoUtilsS3Objects(unittest.TestCase):
+    @patch("common.boto_utils.BotoUtils.get_objects_from_s3")
+    @patch("common.boto_utils.BotoUtils._create_client")
+    def test_move_copies_in_parallel_then_deletes_sources(self, create_client, get_objects_from_s3):
+        s3_client = _s3_client()
+        create_client.return_value = s3_client
+        source_objects = [{"Key": f"temp/stubs/file{index}.py"} for index in range(4)]
+        get_objects_from_s3.side_effect = lambda bucket, key: (
+            source_objects if bucket == "source" else [{"Key": "output/stubs/old.py"}, {"Key": "output/other.py"}]
+        )
+        active_copies, max_active_copies = [0], [0]
+        lock = threading.Lock()
+
+        def copy(copy_source, bucket, key):
+            with lock:
+                active_copies[0] += 1
+                max_active_copies[0] = max(max_active_copies[0], active_copies[0])
+            time.sleep(0.02)
+            with lock:
+                active_copies[0] -= 1
+
+        s3_client.copy.side_effect = copy
+
+        BotoUtils("us-east-1").move_s3_objects(
+            "source", "temp/stubs", "target", "output/stubs/", clear_destination=True
+        )
+
+        self.assertGreater(max_active_copies[0], 1)
+        copied_keys = sorted(call.args[2] for call in s3_client.copy.call_args_list)
+        self.assertEqual(copied_keys, [f"output/stubs/file{index}.py" for index in range(4)])
+        target_delete, source_delete = s3_client.delete_objects.call_args_list
+        self.assertEqual(target_delete.kwargs["Bucket"], "target")
+        self.assertEqual(target_delete.kwargs["Delete"]["Objects"], [{"Key": "output/stubs/old.py"}])
+        self.assertEqual(source_delete.kwargs["Bucket"], "source")
+        self.assertEqual(source_delete.kwargs["Delete"]["Objects"], [{"Key": obj["Key"]} for obj in source_objects])
+
+    @patch("common.boto_utils.BotoUtils.get_objects_from_s3")
+    @patch("common.boto_utils.BotoUtils._create_client")
+    def test_move_keeps_sources_when_a_copy_fails(self, create_client, get_objects_from_s3):
+        s3_client = _s3_client()
+        s3_client.copy.side_effect = [None, Exception("copy failed")]
+        create_client.return_value = s3_client
+        get_objects_from_s3.return_value = [{"Key": "temp/file0.py"}, {"Key": "temp/file1.py"}]
+
+        with self.assertRaises(Exception):
+            BotoUtils("us-east-1").move_s3_objects("source", "temp", "target", "output/")
+
+        s3_client.delete_objects.assert_not_called()
+
+    def test_delete_objects_in_batches(self):
+        s3_client = _s3_client()
+        keys = [f"key{index}" for index in range(2 * S3_DELETE_BATCH_SIZE + 1)]
+
+        BotoUtils.delete_s3_objects("bucket", keys, s3_client=s3_client)
+
+        batches = [call.kwargs["Delete"]["Objects"] for call in s3_client.delete_objects.call_args_list]
+        self.assertEqual([len(batch) for batch in batches], [S3_DELETE_BATCH_SIZE, S3_DELETE_BATCH_SIZE, 1])
+        self.assertEqual([obj["Key"] for batch in batches for obj in batch], keys)
+
+    def test_delete_objects_raises_on_errors(self):
+        s3_client = _s3_client()
+        s3_client.delete_objects.return_value = {
+            "Errors": [{"Key": "key1", "Code": "AccessDenied", "Message": "Access Denied"}]
+        }
+
+        with self.assertRaises(Exception) as context:
+            BotoUtils.delete_s3_objects("bucket", ["key0", "key1"], s3_client=s3_client)
+
+        self.assertIn("AccessDenied", str(context.exception))
+
+    def test_delete_without_keys_does_nothing(self):
+        s3_client = _s3_client()
+
+        BotoUtils.delete_s3_objects("bucket", [], s3_client=s3_client)
+
+        s3_client.delete_objects.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
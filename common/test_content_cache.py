@@ -0,0 +1,47 @@
+import tempfile
+import unittest
+
+from common.content_cache import ContentCache, LRUContentCache, DiskContentCache, TieredContentCache
+
+
+class TestContentCache(unittest.TestCase):
+    def test_lru_evicts_least_recently_used_within_byte_budget(self):
+        cache = LRUContentCache(max_bytes=10)
+        cache.put("a", b"1234")
+        cache.put("b", b"1234")
+        cache.get("a")
+        cache.put("c", b"1234")
+
+        self.assertEqual(cache.get("a"), b"1234")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.size_bytes, 8)
+        cache.put("huge", b"x" * 11)
+        self.assertIsNone(cache.get("huge"))
+        self.assertEqual(cache.stats["hits"], 2)
+        self.assertEqual(cache.stats["misses"], 2)
+
+    def test_tiered_cache_promotes_hits_from_lower_tiers(self):
+        with tempfile.TemporaryDirectory() as directory:
+            DiskContentCache(directory).put("QmHash/file.json", b"{}")
+            memory_tier = LRUContentCache(max_bytes=1024)
+            cache = TieredContentCache([memory_tier, DiskContentCache(directory)])
+
+            self.assertEqual(cache.get("QmHash/file.json"), b"{}")
+            self.assertEqual(memory_tier.get("QmHash/file.json"), b"{}")
+            self.assertIsNone(cache.get("QmOther"))
+            self.assertEqual(cache.stats["hits"], 1)
+            self.assertEqual(cache.stats["misses"], 1)
+
+    def test_cache_without_storage_cannot_be_created(self):
+        class IncompleteContentCache(ContentCache):
+            def _get(self, cid):
+                return None
+
+        with self.assertRaises(TypeError):
+            ContentCache()
+        with self.assertRaises(TypeError):
+            IncompleteContentCache()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import base64
+import csv
+import unittest
+from unittest.mock import MagicMock
+
+from common.file_export import FileExport
+
+
+def _s3_client():
+    s3_client = MagicMock()
+    s3_client.create_multipart_upload.return_value = {"UploadId": "upload"}
+    s3_client.upload_part.side_effect = lambda **kwargs: {"ETag": f"etag{kwargs['PartNumber']}"}
+    s3_client.generate_presigned_url.return_value = "https://bucket.s3.amazonaws.com/export"
+    return s3_client
+
+
+class TestFileExport(unittest.TestCase):
+    def test_small_export_is_returned_inline(self):
+        s3_client = _s3_client()
+
+        with FileExport("logs.txt", bucket="bucket", s3_client=s3_client) as file_export:
+            file_export.write_lines(["line1", "line2", "line3"])
+
+        response = file_export.to_lambda_response()
+
+        self.assertTrue(file_export.is_inline)
+        self.assertEqual(base64.b64decode(response["body"]).decode(), "line1\nline2\nline3")
+        s3_client.create_multipart_upload.assert_not_called()
+
+    def test_large_export_is_uploaded_in_parts(self):
+        s3_client = _s3_client()
+
+        with FileExport(
+                "metrics.csv", bucket="bucket", key_prefix="exports/", inline_limit=100, part_size=250,
+                s3_client=s3_client
+        ) as file_export:
+            writer = csv.writer(file_export, lineterminator="\n")
+            writer.writerows(("org", "service", index) for index in range(100))
+
+        uploaded = b"".join(call.kwargs["Body"] for call in s3_client.upload_part.call_args_list)
+        expected = "".join(f"org,service,{index}\n" for index in range(100)).encode()
+        parts = s3_client.complete_multipart_upload.call_args.kwargs["MultipartUpload"]["Parts"]
+
+        self.assertFalse(file_export.is_inline)
+        self.assertEqual(uploaded, expected)
+        self.assertEqual([part["PartNumber"] for part in parts], list(range(1, len(parts) + 1)))
+        self.assertTrue(s3_client.create_multipart_upload.call_args.kwargs["Key"].startswith("exports/"))
+        self.assertEqual(file_export.to_lambda_response()["statusCode"], 200)
+        self.assertEqual(file_export.url, "https://bucket.s3.amazonaws.com/export")
+
+    def test_failed_export_aborts_upload(self):
+        s3_client = _s3_client()
+
+        with self.assertRaises(ValueError):
+            with FileExport("logs.txt", bucket="bucket", inline_limit=1, s3_client=s3_client) as file_export:
+                file_export.write("line1")
+                raise ValueError("haas error")
+
+        s3_client.abort_multipart_upload.assert_called_once()
+        s3_client.complete_multipart_upload.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
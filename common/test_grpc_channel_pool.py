@@ -0,0 +1,41 @@
+import unittest
+from unittest.mock import patch
+
+from common.grpc_channel_pool import GrpcChannelPool, parse_daemon_endpoint
+
+
+class TestGrpcChannelPool(unittest.TestCase):
+    def test_parse_daemon_endpoint(self):
+        self.assertEqual(parse_daemon_endpoint("https://daemon.example.com:8088"), ("daemon.example.com:8088", True))
+        self.assertEqual(parse_daemon_endpoint("http://daemon.example.com"), ("daemon.example.com", False))
+        with self.assertRaises(ValueError):
+            parse_daemon_endpoint("grpc://daemon.example.com:8088")
+
+    def test_channels_are_reused_per_target_and_tls_mode(self):
+        pool = GrpcChannelPool()
+
+        channel = pool.get_daemon_channel("https://daemon.example.com:8088")
+
+        self.assertIs(pool.get_channel("daemon.example.com:8088", secure=True), channel)
+        self.assertIsNot(pool.get_channel("daemon.example.com:8088", secure=False), channel)
+        self.assertEqual(len(pool), 2)
+        pool.close()
+        self.assertEqual(len(pool), 0)
+
+    @patch("common.grpc_channel_pool.time.monotonic")
+    def test_idle_channels_are_evicted(self, mock_monotonic):
+        pool = GrpcChannelPool(idle_timeout_seconds=60)
+        mock_monotonic.return_value = 0
+        idle_channel = pool.get_channel("idle.example.com:8088")
+        mock_monotonic.return_value = 30
+        active_channel = pool.get_channel("active.example.com:8088")
+
+        mock_monotonic.return_value = 70
+        self.assertIs(pool.get_channel("active.example.com:8088"), active_channel)
+        self.assertEqual(len(pool), 1)
+        self.assertIsNot(pool.get_channel("idle.example.com:8088"), idle_channel)
+        pool.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
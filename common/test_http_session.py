@@ -0,0 +1,45 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from common.http_session import DEFAULT_TIMEOUT_SECONDS, HttpSession, get_http_session
+
+
+class TestHttpSession(unittest.TestCase):
+    @patch("requests.Session.request")
+    def test_default_timeout_and_latency_stats(self, mock_request):
+        mock_request.return_value = MagicMock(status_code=200)
+        session = HttpSession("test")
+
+        session.get("https://api.example.com/items/1?tail=10")
+        session.get("https://api.example.com/items/2", timeout=1, endpoint="get_item")
+
+        self.assertEqual(mock_request.call_args_list[0].kwargs["timeout"], DEFAULT_TIMEOUT_SECONDS)
+        self.assertEqual(mock_request.call_args_list[1].kwargs["timeout"], 1)
+        self.assertNotIn("endpoint", mock_request.call_args_list[1].kwargs)
+        self.assertEqual(set(session.latency_stats), {"GET api.example.com/items/1", "get_item"})
+        self.assertEqual(session.latency_stats["get_item"]["count"], 1)
+
+    @patch("requests.Session.request")
+    def test_failed_requests_are_measured(self, mock_request):
+        mock_request.side_effect = requests.ConnectionError("connection refused")
+        session = HttpSession("test")
+
+        with self.assertRaises(requests.ConnectionError):
+            session.post("https://api.example.com/items", endpoint="create_item")
+
+        self.assertEqual(session.latency_stats["create_item"]["count"], 1)
+
+    def test_sessions_are_shared_and_retry_idempotent_verbs(self):
+        session = get_http_session("shared")
+        retry = session.get_adapter("https://api.example.com").max_retries
+
+        self.assertIs(get_http_session("shared"), session)
+        self.assertTrue(retry.is_retry("GET", 503))
+        self.assertFalse(retry.is_retry("POST", 503))
+        self.assertFalse(retry.is_retry("GET", 404))
+
+
+if __name__ == "__main__":
+    unittest.main()
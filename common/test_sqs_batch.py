@@ -0,0 +1,83 @@
+import json
+import unittest
+
+from common.sqs_batch import process_sqs_batch
+
+
+def _record(message_id, body):
+    return {"messageId": message_id, "body": json.dumps(body)}
+
+
+def _parse_record(record):
+    body = json.loads(record["body"])
+    if body.get("invalid"):
+        raise ValueError("invalid record")
+    return body
+
+
+class TestProcessSqsBatch(unittest.TestCase):
+    def test_latest_message_of_entity_is_processed_at_first_position(self):
+        event = {"Records": [
+            _record("1", {"entity": "org", "version": 1}),
+            _record("2", {"entity": "service", "version": 1}),
+            _record("3", {"entity": "org", "version": 2}),
+            _record("4", {"entity": None, "version": 1}),
+            _record("5", {"entity": None, "version": 2}),
+        ]}
+        processed = []
+
+        response = process_sqs_batch(event, _parse_record, lambda body: body["entity"], processed.append)
+
+        self.assertEqual(response, {"batchItemFailures": []})
+        self.assertEqual(processed, [
+            {"entity": "org", "version": 2},
+            {"entity": "service", "version": 1},
+            {"entity": None, "version": 1},
+            {"entity": None, "version": 2},
+        ])
+
+    def test_failures_report_only_affected_records(self):
+        event = {"Records": [
+            _record("1", {"entity": "org", "version": 1}),
+            _record("2", {"invalid": True}),
+            _record("3", {"entity": "org", "version": 2}),
+            _record("4", {"entity": "service", "version": 1}),
+        ]}
+        processed = []
+
+        def process(body):
+            if body["entity"] == "org":
+                raise Exception("processing failed")
+            processed.append(body)
+
+        response = process_sqs_batch(event, _parse_record, lambda body: body["entity"], process)
+
+        self.assertEqual(
+            response,
+            {"batchItemFailures": [{"itemIdentifier": "2"}, {"itemIdentifier": "1"}, {"itemIdentifier": "3"}]}
+        )
+        self.assertEqual(processed, [{"entity": "service", "version": 1}])
+
+    def test_remaining_messages_fail_once_stopped(self):
+        event = {"Records": [
+            _record("1", {"entity": "org", "version": 1}),
+            _record("2", {"entity": "service", "version": 1}),
+            _record("3", {"entity": "org", "version": 2}),
+            _record("4", {"entity": "other", "version": 1}),
+        ]}
+        processed = []
+
+        response = process_sqs_batch(
+            event, _parse_record, lambda body: body["entity"], processed.append,
+            should_stop=lambda: len(processed) == 1
+        )
+
+        self.assertEqual(
+            response,
+            {"batchItemFailures": [{"itemIdentifier": "2"}, {"itemIdentifier": "4"}]}
+        )
+        self.assertEqual(processed, [{"entity": "org", "version": 2}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import hashlib
+import os
+import tarfile
+import tempfile
+import unittest
+from zipfile import ZipFile
+
+from common.storage_provider import FileUtils
+
+
+class TestFileUtils(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.zip_path = os.path.join(self.temp_dir.name, "proto.zip")
+        with ZipFile(self.zip_path, "w") as zip_obj:
+            zip_obj.writestr("proto/service.proto", "syntax = \"proto3\";")
+            zip_obj.writestr("main.proto", "syntax = \"proto3\";")
+            zip_obj.writestr("__MACOSX/._main.proto", "")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_convert_zip_to_temp_tar_is_deterministic_and_filtered(self):
+        tar_paths = [FileUtils.convert_zip_to_temp_tar(self.zip_path, ["__MACOSX"]) for _ in range(2)]
+        try:
+            digests = [hashlib.sha256(open(tar_path, "rb").read()).hexdigest() for tar_path in tar_paths]
+            self.assertEqual(digests[0], digests[1])
+            with tarfile.open(tar_paths[0]) as tar:
+                members = tar.getmembers()
+            self.assertEqual([member.name for member in members], ["main.proto", "proto", "proto/service.proto"])
+            self.assertTrue(all(member.mtime == 123456781234 for member in members))
+        finally:
+            for tar_path in tar_paths:
+                os.remove(tar_path)
+
+    def test_convert_zip_to_tar_spool_with_include_files(self):
+        with FileUtils.convert_zip_to_tar_spool(self.zip_path, include_files=["service.proto"]) as tar_file:
+            with tarfile.open(fileobj=tar_file) as tar:
+                self.assertEqual(tar.getnames(), ["proto", "proto/service.proto"])
+                self.assertEqual(tar.extractfile("proto/service.proto").read(), b"syntax = \"proto3\";")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from common.blockchain_util import BlockChainUtil, Web3Registry
+
+ADDRESS = "0x5e592f9b1d303183d963635f895f0f0c48284f4e"
+CHECKSUM_ADDRESS = "0x5e592F9b1d303183d963635f895f0f0C48284f4e"
+
+
+class TestWeb3Registry(unittest.TestCase):
+    def setUp(self):
+        Web3Registry.clear()
+        self.addCleanup(Web3Registry.clear)
+        contract_file = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False)
+        json.dump({"11155111": {"FET": {"dev": {"address": ADDRESS}}}}, contract_file)
+        contract_file.close()
+        self.path = contract_file.name
+        self.addCleanup(os.remove, self.path)
+
+    def test_contract_file_is_read_once(self):
+        with patch("builtins.open", wraps=open) as mock_open:
+            BlockChainUtil.load_contract(self.path)
+            BlockChainUtil.load_contract(self.path)
+            address = Web3Registry.get_contract_address(self.path, 11155111, "FET", "dev", "address")
+
+        self.assertEqual(mock_open.call_count, 1)
+        self.assertEqual(address, CHECKSUM_ADDRESS)
+
+    def test_loaded_contract_is_a_copy(self):
+        contract = BlockChainUtil.load_contract(self.path)
+        contract["11155111"]["FET"]["dev"]["address"] = "0x0"
+        contract.pop("11155111")
+
+        self.assertEqual(BlockChainUtil.load_contract(self.path)["11155111"]["FET"]["dev"]["address"], ADDRESS)
+        self.assertEqual(Web3Registry.get_contract_address(self.path, 11155111, "FET", "dev", "address"),
+                         CHECKSUM_ADDRESS)
+
+    def test_clear_reads_contract_file_again(self):
+        BlockChainUtil.load_contract(self.path)
+        with open(self.path, "w") as f:
+            json.dump({"changed": True}, f)
+
+        self.assertIn("11155111", BlockChainUtil.load_contract(self.path))
+        Web3Registry.clear()
+        self.assertEqual(BlockChainUtil.load_contract(self.path), {"changed": True})
+
+    def test_invalidate_provider_drops_its_web3_and_contract_instances(self):
+        web3 = Web3Registry.get_web3("HTTP_PROVIDER", "http://node-a")
+        other_web3 = Web3Registry.get_web3("HTTP_PROVIDER", "http://node-b")
+        Web3Registry.get_contract_instance(("HTTP_PROVIDER", "http://node-a", "MPE"), lambda: "instance-a")
+        Web3Registry.get_contract_instance(("HTTP_PROVIDER", "http://node-b", "MPE"), lambda: "instance-b")
+
+        Web3Registry.invalidate_provider("HTTP_PROVIDER", "http://node-a")
+
+        self.assertIsNot(Web3Registry.get_web3("HTTP_PROVIDER", "http://node-a"), web3)
+        self.assertIs(Web3Registry.get_web3("HTTP_PROVIDER", "http://node-b"), other_web3)
+        self.assertEqual(
+            Web3Registry.get_contract_instance(("HTTP_PROVIDER", "http://node-a", "MPE"), lambda: "rebuilt-a"),
+            "rebuilt-a"
+        )
+        self.assertEqual(
+            Web3Registry.get_contract_instance(("HTTP_PROVIDER", "http://node-b", "MPE"), lambda: "rebuilt-b"),
+            "instance-b"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,7 @@ import re
 import shutil
 import tarfile
 import uuid
+from itertools import islice
 from typing import Generator, Iterable, TypeVar
 import zipfile
 from urllib.parse import urlparse
@@ -280,9 +281,9 @@ def chunked(items: Iterable[T], size: int) -> Generator[list[T], None, None]:
     Yields:
         Lists of size up to `size`, each containing items of type T
     """
-    items = list(items)  # support generators/iterables too
-    for i in range(0, len(items), size):
-        yield items[i:i + size]
+    iterator = iter(items)  # consumed lazily, so generators are never materialized
+    while batch := list(islice(iterator, size)):
+        yield batch
 
 
 def generate_uuid() -> str:
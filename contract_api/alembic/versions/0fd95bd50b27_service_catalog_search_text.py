@@ -0,0 +1,34 @@
+"""service_catalog_search_text
+
+Revision ID: 0fd95bd50b27
+Revises: fd6d349b547c
+Create Date: 2026-10-18 11:02:17.604981
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision = '0fd95bd50b27'
+down_revision = 'fd6d349b547c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('service_catalog', sa.Column('search_text', mysql.TEXT(), nullable=False))
+    op.execute("""
+        UPDATE service_catalog sc
+        JOIN service_metadata sm ON sm.service_row_id = sc.service_row_id
+        SET sc.search_text = CONCAT_WS(
+            ' ', sm.display_name, sm.short_description, sm.description, sc.organization_name,
+            (SELECT GROUP_CONCAT(st.tag_name) FROM service_tags st WHERE st.service_row_id = sc.service_row_id)
+        )
+    """)
+    op.create_index('idx_srvc_ctlg_search_text', 'service_catalog', ['search_text'], unique=False, mysql_prefix='FULLTEXT')
+
+
+def downgrade():
+    op.drop_index('idx_srvc_ctlg_search_text', table_name='service_catalog')
+    op.drop_column('service_catalog', 'search_text')
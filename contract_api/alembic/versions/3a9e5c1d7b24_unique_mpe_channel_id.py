@@ -0,0 +1,31 @@
+"""unique_mpe_channel_id
+
+Revision ID: 3a9e5c1d7b24
+Revises: 0fd95bd50b27
+Create Date: 2026-10-19 10:14:52.331870
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '3a9e5c1d7b24'
+down_revision = '0fd95bd50b27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keep only the latest row of channels duplicated under the old 5-column key
+    op.execute("""
+        DELETE older FROM mpe_channel older
+        JOIN mpe_channel newer ON newer.channel_id = older.channel_id AND newer.row_id > older.row_id
+    """)
+    op.drop_constraint('uq_channel', 'mpe_channel', type_='unique')
+    op.create_unique_constraint('uq_channel_id', 'mpe_channel', ['channel_id'])
+
+
+def downgrade():
+    op.drop_constraint('uq_channel_id', 'mpe_channel', type_='unique')
+    op.create_unique_constraint(
+        'uq_channel', 'mpe_channel', ['channel_id', 'sender', 'signer', 'recipient', 'groupId']
+    )
@@ -0,0 +1,76 @@
+"""service_catalog_table
+
+Revision ID: fd6d349b547c
+Revises: 5c110ac11682
+Create Date: 2026-10-18 10:12:41.218301
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision = 'fd6d349b547c'
+down_revision = '5c110ac11682'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('service_catalog',
+    sa.Column('service_row_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('org_id', sa.VARCHAR(length=128), nullable=False),
+    sa.Column('service_id', sa.VARCHAR(length=128), nullable=False),
+    sa.Column('organization_name', sa.VARCHAR(length=128), nullable=True),
+    sa.Column('display_name', sa.VARCHAR(length=256), nullable=False),
+    sa.Column('short_description', sa.VARCHAR(length=1024), nullable=True),
+    sa.Column('rating', sa.Double(), nullable=False),
+    sa.Column('number_of_ratings', sa.Integer(), nullable=False),
+    sa.Column('ranking', sa.Integer(), nullable=False),
+    sa.Column('is_available', sa.BOOLEAN(), nullable=False),
+    sa.Column('org_image_url', sa.VARCHAR(length=512), nullable=True),
+    sa.Column('service_image_url', sa.VARCHAR(length=512), nullable=True),
+    sa.Column('tags', mysql.JSON(), nullable=False),
+    sa.Column('created_on', mysql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('updated_on', mysql.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP'), nullable=False),
+    sa.ForeignKeyConstraint(['service_row_id'], ['service.row_id'], onupdate='CASCADE', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('service_row_id'),
+    sa.UniqueConstraint('org_id', 'service_id', name='uq_srvc_ctlg')
+    )
+    op.create_index(op.f('ix_service_catalog_org_id'), 'service_catalog', ['org_id'], unique=False)
+    op.create_index('idx_srvc_ctlg_display_name', 'service_catalog', ['display_name', 'service_row_id'], unique=False)
+    op.create_index('idx_srvc_ctlg_ranking', 'service_catalog', ['ranking', 'service_row_id'], unique=False)
+    op.create_index('idx_srvc_ctlg_rating', 'service_catalog', ['rating', 'service_row_id'], unique=False)
+    op.create_index('idx_srvc_ctlg_number_of_ratings', 'service_catalog', ['number_of_ratings', 'service_row_id'], unique=False)
+
+    op.execute("""
+        INSERT INTO service_catalog (
+            service_row_id, org_id, service_id, organization_name, display_name, short_description,
+            rating, number_of_ratings, ranking, is_available, org_image_url, service_image_url, tags
+        )
+        SELECT
+            s.row_id, s.org_id, s.service_id, o.organization_name,
+            COALESCE(sm.display_name, ''), sm.short_description,
+            COALESCE(CAST(JSON_UNQUOTE(JSON_EXTRACT(sm.service_rating, '$.rating')) AS DOUBLE), 0),
+            COALESCE(CAST(JSON_UNQUOTE(JSON_EXTRACT(sm.service_rating, '$.total_users_rated')) AS SIGNED), 0),
+            COALESCE(sm.ranking, 1),
+            (SELECT COALESCE(MAX(se.is_available), FALSE) FROM service_endpoint se WHERE se.service_row_id = s.row_id),
+            NULLIF(JSON_UNQUOTE(JSON_EXTRACT(o.org_assets_url, '$.hero_image')), 'null'),
+            (SELECT media.url FROM service_media media
+             WHERE media.service_row_id = s.row_id AND media.asset_type = 'hero_image'
+             ORDER BY media.row_id LIMIT 1),
+            (SELECT COALESCE(JSON_ARRAYAGG(st.tag_name), JSON_ARRAY()) FROM service_tags st WHERE st.service_row_id = s.row_id)
+        FROM service s
+        JOIN service_metadata sm ON sm.service_row_id = s.row_id
+        JOIN organization o ON o.org_id = s.org_id
+        WHERE s.is_curated = TRUE
+    """)
+
+
+def downgrade():
+    op.drop_index('idx_srvc_ctlg_number_of_ratings', table_name='service_catalog')
+    op.drop_index('idx_srvc_ctlg_rating', table_name='service_catalog')
+    op.drop_index('idx_srvc_ctlg_ranking', table_name='service_catalog')
+    op.drop_index('idx_srvc_ctlg_display_name', table_name='service_catalog')
+    op.drop_index(op.f('ix_service_catalog_org_id'), table_name='service_catalog')
+    op.drop_table('service_catalog')
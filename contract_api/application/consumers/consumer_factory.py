@@ -13,13 +13,28 @@ from contract_api.application.consumers.organization_event_consumers import (
 logger = get_logger(__name__)
 
 
-def get_registry_event_consumer(request: RegistryEventConsumerRequest):
-    if request.event_name == "ServiceCreated" or request.event_name == "ServiceMetadataModified":
-        return ServiceCreatedEventConsumer()
-    elif request.event_name == "ServiceDeleted":
-        return ServiceDeletedEventConsumer()
-    elif request.event_name == "OrganizationCreated" or request.event_name == "OrganizationModified":
-        return OrganizationCreatedEventConsumer()
-    elif request.event_name == "OrganizationDeleted":
-        return OrganizationDeletedEventConsumer()
+def get_registry_event_consumer_class(event_name: str):
+    if event_name == "ServiceCreated" or event_name == "ServiceMetadataModified":
+        return ServiceCreatedEventConsumer
+    elif event_name == "ServiceDeleted":
+        return ServiceDeletedEventConsumer
+    elif event_name == "OrganizationCreated" or event_name == "OrganizationModified":
+        return OrganizationCreatedEventConsumer
+    elif event_name == "OrganizationDeleted":
+        return OrganizationDeletedEventConsumer
     return None
+
+
+def get_registry_event_consumer(request: RegistryEventConsumerRequest, consumers: dict | None = None):
+    """
+    Returns the consumer of the request's event. When consumers is given, the consumer
+    built for an event class is kept there and reused for the rest of the batch.
+    """
+    consumer_class = get_registry_event_consumer_class(request.event_name)
+    if consumer_class is None:
+        return None
+    if consumers is None:
+        return consumer_class()
+    if consumer_class not in consumers:
+        consumers[consumer_class] = consumer_class()
+    return consumers[consumer_class]
@@ -1,5 +1,5 @@
-import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from web3.contract import Contract
 
@@ -7,6 +7,7 @@ from common.blockchain_util import BlockChainUtil
 from common.logger import get_logger
 from common.s3_util import S3Util
 from common.storage_provider import StorageProvider
+from contract_api.constant import ASSET_SYNC_MAX_WORKERS
 from contract_api.config import ASSETS_BUCKET_NAME, ASSETS_PREFIX, S3_BUCKET_ACCESS_KEY, S3_BUCKET_SECRET_KEY, NETWORKS, \
     NETWORK_ID, CONTRACT_BASE_PATH, TOKEN_NAME, STAGE
 
@@ -44,24 +45,14 @@ class EventConsumer:
         existing_assets_url = existing_assets_url or {}
         new_assets_hash = new_assets_hash or {}
 
+        # (asset_type, hash_uri) of every asset to mirror to S3, in the order of the metadata
+        assets_to_push = []
         for new_asset_type, new_asset_hash in new_assets_hash.items():
             if isinstance(new_asset_hash, list):
                 logger.info(f"New asset hash is a list: {new_asset_hash}")
-                # Handle asset types with a list of assets
-                new_urls_list = []
-
-                # Remove all existing assets from S3 for this asset type
-                if new_asset_type in existing_assets_url:
-                    for url in existing_assets_url[new_asset_type]:
-                        self._s3_util.delete_file_from_s3(url)
-
-                # Upload all new assets to S3 and store their URLs
-                for asset_hash in new_asset_hash:
-                    new_urls_list.append(
-                        self._push_asset_to_s3_using_hash(asset_hash, org_id, service_id, new_asset_type)
-                    )
-
-                assets_url_mapping[new_asset_type] = new_urls_list
+                # Handle asset types with a list of assets, all of them are pushed again
+                assets_to_push.extend((new_asset_type, asset_hash) for asset_hash in new_asset_hash)
+                assets_url_mapping[new_asset_type] = []
 
             elif isinstance(new_asset_hash, str):
                 logger.info(f"New asset hash is a string: {new_asset_hash}")
@@ -73,26 +64,63 @@ class EventConsumer:
                     # Asset is unchanged; retain the existing S3 URL
                     assets_url_mapping[new_asset_type] = existing_assets_url[new_asset_type]
                 else:
-                    # Asset is updated; remove the existing file from S3 (if it exists)
-                    if new_asset_type in existing_assets_url:
-                        self._s3_util.delete_file_from_s3(existing_assets_url[new_asset_type])
-
-                    # Push the updated asset to S3 and store its new URL
-                    assets_url_mapping[new_asset_type] = self._push_asset_to_s3_using_hash(
-                        new_asset_hash, org_id, service_id, new_asset_type
-                    )
+                    assets_to_push.append((new_asset_type, new_asset_hash))
 
             else:
                 logger.error(
                     "Unknown asset type for org_id %s, service_id %s", org_id, service_id
                 )
 
+        new_urls = self._push_assets_to_s3_using_hash(
+            [(asset_hash, asset_type) for asset_type, asset_hash in assets_to_push], org_id, service_id
+        )
+        for (asset_type, _), new_url in zip(assets_to_push, new_urls):
+            if isinstance(new_assets_hash[asset_type], list):
+                assets_url_mapping[asset_type].append(new_url)
+            else:
+                assets_url_mapping[asset_type] = new_url
+
+        # Remove the replaced assets from S3, keeping the ones the new metadata still points to.
+        # List types are always checked, an emptied list pushes nothing but its old assets are outdated
+        replaced_asset_types = {asset_type for asset_type, _ in assets_to_push}
+        replaced_asset_types.update(
+            asset_type for asset_type, asset_hash in new_assets_hash.items() if isinstance(asset_hash, list)
+        )
+        outdated_urls = []
+        for asset_type in replaced_asset_types:
+            existing_urls = existing_assets_url.get(asset_type) or []
+            if isinstance(existing_urls, str):
+                existing_urls = [existing_urls]
+            outdated_urls.extend(url for url in existing_urls if url not in new_urls)
+        self._run_asset_tasks(self._s3_util.delete_file_from_s3, outdated_urls)
+
         return assets_url_mapping
 
     # abstract method
     def on_event(self, event):
         pass
 
+    def _push_assets_to_s3_using_hash(
+            self,
+            assets: list[tuple[str, str]],
+            org_id: str,
+            service_id: str
+    ) -> list[str]:
+        """
+        Mirrors (hash_uri, asset_type) assets to S3 concurrently and returns their URLs in the same order.
+        """
+        return self._run_asset_tasks(
+            lambda asset: self._push_asset_to_s3_using_hash(asset[0], org_id, service_id, asset[1]),
+            assets
+        )
+
+    @staticmethod
+    def _run_asset_tasks(task, items: list) -> list:
+        if len(items) <= 1:
+            return [task(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(ASSET_SYNC_MAX_WORKERS, len(items))) as executor:
+            return list(executor.map(task, items))
+
     # TODO: check and change hash_uri parsing
     def _push_asset_to_s3_using_hash(
             self,
@@ -101,7 +129,6 @@ class EventConsumer:
             service_id: str,
             asset_type: str = ""
     ) -> str:
-        io_bytes = self._storage_provider.get(hash_uri, to_decode = False)
         if "://" in hash_uri:
             filename = hash_uri.split("//")[1].split("/")[0]
         else:
@@ -113,9 +140,17 @@ class EventConsumer:
         else:
             s3_filename = ASSETS_PREFIX + "/" + org_id + "/" + filename
 
-        io_bytes = io.BytesIO(io_bytes)
-        new_url = self._s3_util.push_io_bytes_to_s3(s3_filename,
-                                                    ASSETS_BUCKET_NAME, io_bytes)
+        _, cid = self._storage_provider.uri_to_hash(hash_uri)
+        existing_metadata = self._s3_util.get_object_metadata(ASSETS_BUCKET_NAME, s3_filename)
+        if existing_metadata is not None and existing_metadata.get("cid") == cid:
+            new_url = f"https://{ASSETS_BUCKET_NAME}.s3.amazonaws.com/{s3_filename}"
+            logger.info(f"Asset is already in S3: url = {new_url}, hash_uri = {hash_uri}")
+            return new_url
+
+        with self._storage_provider.get_stream(hash_uri) as stream:
+            new_url = self._s3_util.push_stream_to_s3(
+                s3_filename, ASSETS_BUCKET_NAME, stream, metadata={"cid": cid}
+            )
         logger.info(f"Pushed asset to S3: new_url = {new_url}, s3_filename = {s3_filename}, "
                     f"hash_uri = {hash_uri}, filename = {filename}")
 
@@ -1,8 +1,10 @@
 import base64
 
 from common.logger import get_logger
+from common.utils import chunked
 from contract_api.application.consumers.event_consumer import EventConsumer
 from contract_api.application.schemas.consumer_schemas import MpeEventConsumerRequest
+from contract_api.constant import MPE_CHANNEL_BATCH_SIZE
 from contract_api.domain.models.channel import NewChannelDomain
 from contract_api.infrastructure.repositories.channel_repository import ChannelRepository
 
@@ -10,6 +12,9 @@ logger = get_logger(__name__)
 
 
 class MPEEventConsumer(EventConsumer):
+    OPEN_EVENTS = ['ChannelOpen']
+    UPDATE_EVENTS = ['ChannelClaim', 'ChannelExtend', 'ChannelAddFunds']
+
     def __init__(self):
         super().__init__()
         self._channel_repo = ChannelRepository()
@@ -34,6 +39,35 @@ class MPEEventConsumer(EventConsumer):
             logger.error(str(e))
             raise Exception(f"Failed to upsert channel with id {channel_id} in mpe event consumer")
 
+    def on_events(self, requests: list[MpeEventConsumerRequest]) -> None:
+        """
+        Batched path for the events of a whole SQS batch. Every channel is written once: opened channels
+        from their event, updated ones from their current on-chain state, read for all of them in
+        JSON-RPC batches, and all of them with a single upsert.
+        """
+        opened_channels = {}
+        updated_channel_ids = []
+        for request in requests:
+            if request.event_name in self.OPEN_EVENTS:
+                opened_channels[request.channel_id] = self._convert_channel_to_domain(request)
+            elif request.event_name in self.UPDATE_EVENTS:
+                if request.channel_id not in updated_channel_ids:
+                    updated_channel_ids.append(request.channel_id)
+            else:
+                logger.info(f"Unhandled event: {request.event_name}")
+
+        # The on-chain state already includes every event of the batch, so it wins over ChannelOpen data
+        channels = {**opened_channels, **self._get_channels_data_from_blockchain(updated_channel_ids)}
+        if not channels:
+            return
+
+        try:
+            self._channel_repo.upsert_channels(list(channels.values()))
+        except Exception as e:
+            logger.error(str(e))
+            raise Exception(f"Failed to upsert channels {list(channels)} in mpe event consumer")
+        logger.info(f"Created channels {list(opened_channels)}, updated channels {updated_channel_ids}")
+
     @staticmethod
     def _convert_channel_to_domain(request_data: MpeEventConsumerRequest) -> NewChannelDomain:
         group_id = request_data.group_id
@@ -57,6 +91,26 @@ class MPEEventConsumer(EventConsumer):
     def _get_channel_data_from_blockchain(self, channel_id: int) -> NewChannelDomain:
         mpe_contract = self._get_contract("MPE")
         channel_data = mpe_contract.functions.channels(channel_id).call()
+        return self._convert_channel_data_to_domain(channel_id, channel_data)
+
+    def _get_channels_data_from_blockchain(self, channel_ids: list[int]) -> dict[int, NewChannelDomain]:
+        if not channel_ids:
+            return {}
+
+        mpe_contract = self._get_contract("MPE")
+        web3_object = self._blockchain_util.web3_object
+        channels = {}
+        for channel_ids_batch in chunked(channel_ids, MPE_CHANNEL_BATCH_SIZE):
+            with web3_object.batch_requests() as batch:
+                for channel_id in channel_ids_batch:
+                    batch.add(mpe_contract.functions.channels(channel_id))
+                channels_data = batch.execute()
+            for channel_id, channel_data in zip(channel_ids_batch, channels_data):
+                channels[channel_id] = self._convert_channel_data_to_domain(channel_id, channel_data)
+        return channels
+
+    @staticmethod
+    def _convert_channel_data_to_domain(channel_id: int, channel_data) -> NewChannelDomain:
         group_id = base64.b64encode(channel_data[4]).decode('utf8')
 
         channel = NewChannelDomain(
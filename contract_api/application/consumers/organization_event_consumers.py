@@ -9,6 +9,9 @@ from contract_api.infrastructure.db import DefaultSessionFactory, session_scope
 from contract_api.infrastructure.repositories.new_organization_repository import (
     NewOrganizationRepository,
 )
+from contract_api.infrastructure.repositories.service_catalog_repository import (
+    ServiceCatalogRepository,
+)
 
 from sqlalchemy.orm import Session
 
@@ -20,6 +23,7 @@ class OrganizationCreatedEventConsumer(EventConsumer):
     def __init__(self):
         super().__init__()
         self._organization_repository = NewOrganizationRepository()
+        self._service_catalog_repository = ServiceCatalogRepository()
         self._session_factory = DefaultSessionFactory
 
     def on_event(
@@ -70,6 +74,7 @@ class OrganizationCreatedEventConsumer(EventConsumer):
                     for group in org_metadata.get("groups", [])
                 ]
                 self._organization_repository.create_org_groups(session=session, groups=new_groups)
+                self._service_catalog_repository.refresh_organization(session, org_id)
 
     def _get_new_assets_url(self, session: Session, org_id: str, new_ipfs_data: dict):
         new_assets_hash = new_ipfs_data.get("assets", {})
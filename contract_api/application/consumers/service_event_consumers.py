@@ -36,6 +36,9 @@ from contract_api.infrastructure.repositories.new_service_repository import NewS
 from contract_api.infrastructure.repositories.new_organization_repository import (
     NewOrganizationRepository,
 )
+from contract_api.infrastructure.repositories.service_catalog_repository import (
+    ServiceCatalogRepository,
+)
 from contract_api.infrastructure.db import session_scope, DefaultSessionFactory
 
 from sqlalchemy.orm import Session
@@ -49,6 +52,7 @@ class ServiceCreatedEventConsumer(EventConsumer):
         super().__init__()
         self._service_repository = NewServiceRepository()
         self._organization_repository = NewOrganizationRepository()
+        self._service_catalog_repository = ServiceCatalogRepository()
         self._session_factory = DefaultSessionFactory
 
     def on_event(self, request: RegistryEventConsumerRequest) -> None:
@@ -141,36 +145,44 @@ class ServiceCreatedEventConsumer(EventConsumer):
         service: ServiceDomain,
         service_media: list[dict],
     ) -> None:
-        if len(service_media) > 0:
-            for service_media_item in service_media:
-                if service_media_item.get("file_type") in ["image", "video"]:
-                    url = service_media_item.get("url", "")
-                    if utils.if_external_link(link=url):
-                        updated_url = url
-                        hash_uri = ""
-                    else:
-                        updated_url = self._push_asset_to_s3_using_hash(
-                            org_id=service.org_id, service_id=service.service_id, hash_uri=url
-                        )
-                        hash_uri = service_media_item.get("url", "")
-
-                    asset_type = service_media_item.get("asset_type", "")
-                    if asset_type != "hero_image":
-                        asset_type = "media_gallery"
-                    self._service_repository.upsert_service_media(
-                        session,
-                        NewServiceMediaDomain(
-                            service_row_id=service.row_id,
-                            org_id=service.org_id,
-                            service_id=service.service_id,
-                            url=updated_url,
-                            order=service_media_item.get("order", 0),
-                            file_type=service_media_item.get("file_type", ""),
-                            asset_type=asset_type,
-                            alt_text=service_media_item.get("alt_text", ""),
-                            hash_uri=hash_uri,
-                        ),
-                    )
+        media_items = [
+            service_media_item for service_media_item in service_media
+            if service_media_item.get("file_type") in ["image", "video"]
+        ]
+        ipfs_urls = list(dict.fromkeys(
+            service_media_item.get("url", "") for service_media_item in media_items
+            if not utils.if_external_link(link=service_media_item.get("url", ""))
+        ))
+        s3_urls = dict(zip(ipfs_urls, self._push_assets_to_s3_using_hash(
+            [(url, "") for url in ipfs_urls], service.org_id, service.service_id
+        )))
+
+        for service_media_item in media_items:
+            url = service_media_item.get("url", "")
+            if url in s3_urls:
+                updated_url = s3_urls[url]
+                hash_uri = url
+            else:
+                updated_url = url
+                hash_uri = ""
+
+            asset_type = service_media_item.get("asset_type", "")
+            if asset_type != "hero_image":
+                asset_type = "media_gallery"
+            self._service_repository.upsert_service_media(
+                session,
+                NewServiceMediaDomain(
+                    service_row_id=service.row_id,
+                    org_id=service.org_id,
+                    service_id=service.service_id,
+                    url=updated_url,
+                    order=service_media_item.get("order", 0),
+                    file_type=service_media_item.get("file_type", ""),
+                    asset_type=asset_type,
+                    alt_text=service_media_item.get("alt_text", ""),
+                    hash_uri=hash_uri,
+                ),
+            )
 
     def _process_service_data(
         self, org_id: str, service_id: str, new_hash: str, new_service_metadata: dict
@@ -268,6 +280,8 @@ class ServiceCreatedEventConsumer(EventConsumer):
                     session, service_metadata
                 )
 
+            self._service_catalog_repository.refresh_service(session, org_id, service_id)
+
 
 class ServiceDeletedEventConsumer(EventConsumer):
     def __init__(self):
@@ -5,11 +5,13 @@ from common.utils import generate_lambda_response
 from contract_api.application.schemas.channel_schemas import GetChannelsRequest, UpdateConsumedBalanceRequest, \
     GetGroupChannelsRequest
 from contract_api.application.services.channel_service import ChannelService
+from contract_api.infrastructure.db import request_session_scope
 
 logger = get_logger(__name__)
 
 
 @exception_handler(logger=logger)
+@request_session_scope
 def get_channels(event, context):
     request = GetChannelsRequest.validate_event(event)
 
@@ -22,6 +24,7 @@ def get_channels(event, context):
 
 
 @exception_handler(logger=logger)
+@request_session_scope
 def get_group_channels(event, context):
     request = GetGroupChannelsRequest.validate_event(event)
 
@@ -34,6 +37,7 @@ def get_group_channels(event, context):
 
 
 @exception_handler(logger=logger)
+@request_session_scope
 def update_consumed_balance(event, context):
     request = UpdateConsumedBalanceRequest.validate_event(event)
 
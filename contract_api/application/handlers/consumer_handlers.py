@@ -2,42 +2,83 @@ from common.constant import StatusCode
 from common.logger import get_logger
 from common.utils import generate_lambda_response
 from common.exception_handler import exception_handler
+from common.sqs_batch import process_sqs_batch
 from contract_api.application.schemas.consumer_schemas import (
     MpeEventConsumerRequest, RegistryEventConsumerRequest
 )
-from contract_api.application.consumers.consumer_factory import get_registry_event_consumer
+from contract_api.application.consumers.consumer_factory import (
+    get_registry_event_consumer, get_registry_event_consumer_class
+)
 from contract_api.application.consumers.mpe_event_consumer import MPEEventConsumer
 from contract_api.application.consumers.service_event_consumers import ServiceCreatedDeploymentEventHandler
-
+from contract_api.constant import REGISTRY_EVENT_TIME_MARGIN_MS
+from contract_api.infrastructure.db import request_session_scope, ScopedSession
 
 logger = get_logger(__name__)
 
 
+@request_session_scope
 def mpe_event_consumer(event, context):
-    events = MpeEventConsumerRequest.get_events_from_queue(event)
+    failed_message_ids = []
+    requests = []
+    request_message_ids = []
+    for record in event.get("Records", []):
+        try:
+            events = MpeEventConsumerRequest.get_events_from_queue({"Records": [record]})
+            if events:
+                requests.append(MpeEventConsumerRequest.validate_event(events[0]))
+                request_message_ids.append(record.get("messageId"))
+        except Exception as e:
+            logger.exception(f"Unable to parse record {record.get('messageId')}: {repr(e)}")
+            failed_message_ids.append(record.get("messageId"))
 
-    for e in events:
-        request = MpeEventConsumerRequest.validate_event(e)
-        MPEEventConsumer().on_event(request)
+    # Channels of the batch are read and written together, so they succeed or fail together
+    try:
+        MPEEventConsumer().on_events(requests)
+    except Exception as e:
+        logger.exception(f"Unable to process mpe events: {repr(e)}")
+        failed_message_ids.extend(request_message_ids)
 
-    return {}
+    return {"batchItemFailures": [{"itemIdentifier": message_id} for message_id in failed_message_ids]}
 
 
+@request_session_scope
 def registry_event_consumer(event, context):
-    events = RegistryEventConsumerRequest.get_events_from_queue(event)
+    consumers = {}
+
+    def parse_record(record: dict) -> RegistryEventConsumerRequest | None:
+        events = RegistryEventConsumerRequest.get_events_from_queue({"Records": [record]})
+        if not events:
+            return None
+        return RegistryEventConsumerRequest.validate_event(events[0])
 
-    for e in events:
-        request = RegistryEventConsumerRequest.validate_event(e)
-        consumer = get_registry_event_consumer(request)
+    def get_entity_key(request: RegistryEventConsumerRequest) -> tuple | None:
+        # Unhandled events must not supersede a handled event of the same entity
+        if get_registry_event_consumer_class(request.event_name) is None:
+            return None
+        return request.org_id, request.service_id
+
+    def process(request: RegistryEventConsumerRequest) -> None:
+        consumer = get_registry_event_consumer(request, consumers)
         if consumer is None:
-            logger.info(f"Unhandled Registry event: {e}")
-            continue
-        consumer.on_event(request)
+            logger.info(f"Unhandled Registry event: {request}")
+            return
+        try:
+            consumer.on_event(request)
+        except Exception:
+            ScopedSession.rollback()
+            raise
+
+    get_remaining_time = getattr(context, "get_remaining_time_in_millis", None)
+
+    def should_stop() -> bool:
+        return get_remaining_time is not None and get_remaining_time() < REGISTRY_EVENT_TIME_MARGIN_MS
 
-    return {}
+    return process_sqs_batch(event, parse_record, get_entity_key, process, should_stop)
 
 
 @exception_handler(logger=logger)
+@request_session_scope
 def manage_service_deployment(event, context):
     request = RegistryEventConsumerRequest.validate_event(event)
 
@@ -6,11 +6,13 @@ from common.utils import generate_lambda_response
 from contract_api.application.schemas.dapp_build_schemas import TriggerDappBuildRequest, NotifyDeployStatusRequest
 from contract_api.application.services.dapp_build_service import DappBuildService
 
+from contract_api.infrastructure.db import request_session_scope
 
 logger = get_logger(__name__)
 
 
 @exception_handler(logger=logger)
+@request_session_scope
 def trigger_dapp_build(event, context):
     request = TriggerDappBuildRequest.validate_event(event)
 
@@ -23,6 +25,7 @@ def trigger_dapp_build(event, context):
 
 
 @exception_handler(logger=logger)
+@request_session_scope
 def notify_deploy_status(event, context):
     request = NotifyDeployStatusRequest.validate_event(event)
 
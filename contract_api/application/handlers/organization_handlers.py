@@ -5,11 +5,13 @@ from common.utils import generate_lambda_response
 from contract_api.application.schemas.organization_schemas import GetGroupRequest
 from contract_api.application.services.organization_service import OrganizationService
 
+from contract_api.infrastructure.db import request_session_scope
 
 logger = get_logger(__name__)
 
 
 @exception_handler(logger=logger)
+@request_session_scope
 def get_all_organizations(event, context):
     response = OrganizationService().get_all_organizations()
 
@@ -19,6 +21,7 @@ def get_all_organizations(event, context):
 
 
 @exception_handler(logger=logger)
+@request_session_scope
 def get_group(event, context):
     request = GetGroupRequest.validate_event(event)
 
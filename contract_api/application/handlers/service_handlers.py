@@ -12,11 +12,13 @@ from contract_api.application.schemas.service_schemas import (
 )
 from contract_api.application.services.service_service import ServiceService
 
+from contract_api.infrastructure.db import request_session_scope
 
 logger = get_logger(__name__)
 
 
 @exception_handler(logger=logger)
+@request_session_scope
 def get_service_filters(event, context):
     request = GetServiceFiltersRequest.validate_event(event)
 
@@ -28,6 +30,7 @@ def get_service_filters(event, context):
 
 
 @exception_handler(logger=logger)
+@request_session_scope
 def get_services(event, context):
     request = GetServicesRequest.validate_event(event)
 
@@ -39,6 +42,7 @@ def get_services(event, context):
 
 
 @exception_handler(logger=logger)
+@request_session_scope
 def get_service(event, context):
     request = GetServiceRequest.validate_event(event)
 
@@ -50,6 +54,7 @@ def get_service(event, context):
 
 
 @exception_handler(logger=logger)
+@request_session_scope
 def curate_service(event, context):
     request = CurateServiceRequest.validate_event(event)
 
@@ -61,6 +66,7 @@ def curate_service(event, context):
 
 
 @exception_handler(logger=logger)
+@request_session_scope
 def save_offchain_attribute(event, context):
     request = SaveOffchainAttributeRequest.validate_event(event)
 
@@ -72,6 +78,7 @@ def save_offchain_attribute(event, context):
 
 
 @exception_handler(logger=logger)
+@request_session_scope
 def get_offchain_attribute(event, context):
     request = GetServiceRequest.validate_event(event)
 
@@ -83,6 +90,7 @@ def get_offchain_attribute(event, context):
 
 
 @exception_handler(logger=logger)
+@request_session_scope
 def update_service_rating(event, context):
     request = UpdateServiceRatingRequest.validate_event(event)
 
@@ -1,12 +1,13 @@
+import base64
 import json
 
-from pydantic import BaseModel, field_validator, model_validator, Field
+from pydantic import BaseModel, field_validator, model_validator, Field, ValidationInfo
 
 from common.constant import RequestPayloadType
 from common.validation_handler import validation_handler
 from contract_api.constant import SortKeys, SortOrder, FilterKeys
 from contract_api.exceptions import InvalidSortParameter, InvalidOrderParameter, InvalidFilterParameter, \
-    InvalidCurateParameter, InvalidAttributeParameter
+    InvalidCurateParameter, InvalidCursorParameter, InvalidAttributeParameter
 
 
 class GetServiceFiltersRequest(BaseModel):
@@ -33,6 +34,7 @@ class GetServicesRequest(BaseModel):
     order: str
     filter: dict[str, bool | list[str]] = {}
     q: str = ""
+    cursor: list | None = None
 
     @classmethod
     @validation_handler([RequestPayloadType.BODY])
@@ -62,6 +64,34 @@ class GetServicesRequest(BaseModel):
                 raise InvalidFilterParameter()
         return value
 
+    @field_validator("cursor", mode="before")
+    @classmethod
+    def validate_cursor(cls, value: str | None, info: ValidationInfo):
+        if not value:
+            return None
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(value.encode()))
+        except (ValueError, TypeError, AttributeError):
+            raise InvalidCursorParameter()
+        # The cursor is the sort values and row id of the last service, relevance is sorted by score and rating
+        sort_values_count = 2 if info.data.get("sort") == SortKeys.RELEVANCE else 1
+        if not isinstance(cursor, list) or len(cursor) != sort_values_count + 1:
+            raise InvalidCursorParameter()
+        *sort_values, row_id = cursor
+        # bool is excluded as a subclass of int
+        for sort_value in sort_values:
+            if isinstance(sort_value, bool) or not isinstance(sort_value, (str, int, float)):
+                raise InvalidCursorParameter()
+        if isinstance(row_id, bool) or not isinstance(row_id, int):
+            raise InvalidCursorParameter()
+        return cursor
+
+    @staticmethod
+    def encode_cursor(cursor: list | None) -> str | None:
+        if cursor is None:
+            return None
+        return base64.urlsafe_b64encode(json.dumps(cursor).encode()).decode()
+
 
 class GetServiceRequest(BaseModel):
     org_id: str = Field(alias = "orgId")
@@ -1,15 +1,28 @@
 import json
+import os
+import threading
+import time
 from typing import Any
 
 import boto3
 
+from common.blockchain_util import BlockChainUtil, BlockNumberOracle
 from common.constant import TokenSymbol
 from contract_api.application.schemas.channel_schemas import (
     GetGroupChannelsRequest,
     GetChannelsRequest,
     UpdateConsumedBalanceRequest,
 )
-from contract_api.config import GET_STATE_SERVICE_SIGNATURE_ARN, REGION_NAME, TOKEN_NAME
+from contract_api.config import (
+    GET_STATE_SERVICE_SIGNATURE_ARN,
+    REGION_NAME,
+    TOKEN_NAME,
+    STATE_SERVICE_SIGNATURE,
+    NETWORKS,
+    NETWORK_ID,
+    CONTRACT_BASE_PATH,
+    STAGE,
+)
 from contract_api.domain.models.channel import ChannelDomain
 from contract_api.exceptions import (
     ChannelNotFoundException,
@@ -20,6 +33,29 @@ from contract_api.infrastructure.daemon_client import DaemonClient
 from contract_api.infrastructure.repositories.channel_repository import ChannelRepository
 from contract_api.infrastructure.repositories.service_repository import ServiceRepository
 
+_lambda_client = None
+# channel_id -> (signature, block number, monotonic time the block number was read at)
+_state_service_signatures: dict[int, tuple[str, int, float]] = {}
+_state_service_signatures_lock = threading.Lock()
+_block_number_oracle = None
+
+
+def get_lambda_client():
+    global _lambda_client
+    if _lambda_client is None:
+        _lambda_client = boto3.client('lambda', region_name = REGION_NAME)
+    return _lambda_client
+
+
+def get_block_number_oracle() -> BlockNumberOracle:
+    global _block_number_oracle
+    if _block_number_oracle is None:
+        _block_number_oracle = BlockNumberOracle(
+            blockchain_util = BlockChainUtil("WS_PROVIDER", NETWORKS[NETWORK_ID]["ws_provider"]),
+            max_staleness_seconds = STATE_SERVICE_SIGNATURE["block_time_seconds"],
+        )
+    return _block_number_oracle
+
 
 class ChannelService:
     def __init__(self):
@@ -116,8 +152,54 @@ class ChannelService:
 
         return signed_amount
 
+    def _get_channel_state_signature(self, channel_id: int) -> tuple[str, Any]:
+        """
+        The signature only covers the channel and the current block, and the daemon accepts
+        a block a few blocks old, so one signature serves every call within max_blocks blocks.
+        The block number is itself cached for up to a block by the oracle (or by the signer), so
+        the reuse window is measured from when the block number was read, not from when it was
+        signed. This keeps the combined age within max_blocks * block_time_seconds instead of
+        max_blocks blocks of reuse on top of a block number that was already a block old.
+        """
+        signature_ttl = STATE_SERVICE_SIGNATURE["max_blocks"] * STATE_SERVICE_SIGNATURE["block_time_seconds"]
+        with _state_service_signatures_lock:
+            cached_signature = _state_service_signatures.get(channel_id)
+        if cached_signature is not None and time.monotonic() - cached_signature[2] < signature_ttl:
+            return cached_signature[0], cached_signature[1]
+
+        if STATE_SERVICE_SIGNATURE["signer_key"]:
+            signature, current_block_number, block_number_age = self._sign_channel_state_locally(channel_id)
+        else:
+            signature, current_block_number = self._get_channel_state_signature_from_signer(channel_id)
+            # The signer does not report the age of its block number, it is at most a block old
+            block_number_age = STATE_SERVICE_SIGNATURE["block_time_seconds"]
+
+        with _state_service_signatures_lock:
+            _state_service_signatures[channel_id] = (
+                signature, current_block_number, time.monotonic() - block_number_age
+            )
+        return signature, current_block_number
+
+    @staticmethod
+    def _sign_channel_state_locally(channel_id: int) -> tuple[str, int, float]:
+        # Same message as signer's Signer.signature_for_state_service
+        blockchain_util = BlockChainUtil("WS_PROVIDER", NETWORKS[NETWORK_ID]["ws_provider"])
+        base_contract_path = os.path.abspath(
+            os.path.join(CONTRACT_BASE_PATH, 'node_modules', 'singularitynet-platform-contracts'))
+        mpe_address = blockchain_util.get_contract_instance(
+            base_contract_path, "MPE", NETWORK_ID, TOKEN_NAME, STAGE
+        ).address
+        current_block_number, block_number_age = get_block_number_oracle().get_block_number_and_age()
+
+        signature = blockchain_util.generate_signature(
+            data_types = ["string", "address", "uint256", "uint256"],
+            values = ["__get_channel_state", mpe_address, channel_id, current_block_number],
+            signer_key = STATE_SERVICE_SIGNATURE["signer_key"]
+        )
+        return signature, current_block_number, block_number_age
+
     @staticmethod
-    def _get_channel_state_signature(channel_id) -> tuple[str, Any]:
+    def _get_channel_state_signature_from_signer(channel_id: int) -> tuple[str, Any]:
         body = {
             "channel_id": channel_id
         }
@@ -132,8 +214,7 @@ class ChannelService:
             "body": json.dumps(body)
         }
 
-        lambda_client = boto3.client('lambda', region_name = REGION_NAME)
-        signature_response = lambda_client.invoke(
+        signature_response = get_lambda_client().invoke(
             FunctionName = GET_STATE_SERVICE_SIGNATURE_ARN,
             InvocationType = 'RequestResponse',
             Payload = json.dumps(payload)
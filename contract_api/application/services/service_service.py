@@ -2,7 +2,7 @@ import os
 import tempfile
 import uuid
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 from datetime import datetime
 
 from common.boto_utils import BotoUtils
@@ -21,7 +21,6 @@ from contract_api.config import REGION_NAME, ASSETS_COMPONENT_BUCKET_NAME
 from contract_api.constant import FilterKeys
 from contract_api.domain.factory.service_factory import ServiceFactory
 from contract_api.domain.models.demo_component import DemoComponent
-from contract_api.domain.models.offchain_service_attribute import OffchainServiceConfigDomain
 from contract_api.domain.models.org_group import OrgGroupDomain
 from contract_api.domain.models.service_endpoint import ServiceEndpointDomain
 from contract_api.domain.models.service_group import ServiceGroupDomain
@@ -58,21 +57,23 @@ class ServiceService:
 
         return {"values": filters_data}
 
-    def get_services(self, request: GetServicesRequest) -> dict[str, list | int]:
+    def get_services(self, request: GetServicesRequest) -> dict[str, list | int | str | None]:
         limit = request.limit
         page = request.page
         sort = request.sort
         order = request.order
         filters = request.filter
         q = request.q
+        cursor = request.cursor
 
-        services = self._service_repo.get_filtered_services(
+        services, next_cursor = self._service_repo.get_filtered_services(
             limit=limit,
             page=page,
             sort=sort,
             order=order,
             filters=filters,
-            q=q
+            q=q,
+            cursor=cursor
         )
 
         total_count = self._service_repo.get_filtered_services_count(
@@ -82,32 +83,29 @@ class ServiceService:
 
         return {
             "totalCount": total_count,
-            "services": services
+            "services": services,
+            "nextCursor": GetServicesRequest.encode_cursor(next_cursor)
         }
 
     def get_service(self, request: GetServiceRequest) -> dict[str, Any]:
         org_id = request.org_id
         service_id = request.service_id
 
-        service_data = self._service_repo.get_service(org_id, service_id)
+        service_details = self._service_repo.get_service_details(org_id, service_id)
 
-        if service_data is None:
+        if service_details is None:
             raise ServiceNotFoundException(org_id, service_id)
 
-        service, organization, service_metadata = service_data
-        service_media = self._service_repo.get_service_media(org_id, service_id)
-        org_groups = self._org_repo.get_groups(org_id)
-        groups_endpoints = self._service_repo.get_service_groups(org_id, service_id)
-        service_tags = self._service_repo.get_service_tags(org_id, service_id)
-        offchain_service_configs = self._service_repo.get_offchain_service_configs(org_id, service_id)
+        service, organization, service_metadata, media, tags, demo_component_required = service_details
+        groups = self._service_repo.get_service_groups_with_org_groups(org_id, service_id)
 
         service_data = service.to_short_response()
         service_data.update(organization.to_short_response())
         service_data.update(service_metadata.to_short_response())
-        service_data["media"] = [media.to_short_response() for media in service_media]
-        service_data["tags"] = [tag.tag_name for tag in service_tags]
-        service_data.update(self._convert_service_groups(groups_endpoints, org_groups))
-        service_data.update(self._get_demo_component_required(offchain_service_configs))
+        service_data["media"] = media
+        service_data["tags"] = tags
+        service_data.update(self._convert_service_groups(groups))
+        service_data["demoComponentRequired"] = demo_component_required
 
         return service_data
 
@@ -194,38 +192,24 @@ class ServiceService:
 
     @staticmethod
     def _convert_service_groups(
-            groups_endpoints: list[tuple[ServiceGroupDomain, ServiceEndpointDomain]],
-            org_groups: list[OrgGroupDomain]
+            groups: list[tuple[ServiceGroupDomain, ServiceEndpointDomain, Optional[OrgGroupDomain]]]
     ) -> dict[str, int | list]:
-        logger.info(f"Groups endpoints: {groups_endpoints}")
-        logger.info(f"Org groups: {org_groups}")
-        org_group_dict = {group.group_id: group.to_short_response() for group in org_groups}
-
         result = {
             "isAvailable": False,
             "groups": [],
         }
 
-        for group, endpoint in groups_endpoints:
+        for group, endpoint, org_group in groups:
             item = group.to_short_response()
             item["endpoints"] = [endpoint.to_short_response()]
-            item.update(org_group_dict[group.group_id])
+            if org_group is not None:
+                item.update(org_group.to_short_response())
             result["groups"].append(item)
             if endpoint.is_available:
                 result["isAvailable"] = True
 
-        logger.info(f"Result (_convert_service_groups): {result}")
         return result
 
-    @staticmethod
-    def _get_demo_component_required(
-            offchain_service_configs: list[OffchainServiceConfigDomain]
-    ) -> dict:
-        for config in offchain_service_configs:
-            if config.parameter_name == "demo_component_required":
-                return {"demoComponentRequired": config.parameter_value == "1"}
-        return {"demoComponentRequired": False}
-
     def _publish_demo_component(self, org_id, service_id, demo_file_url):
         root_directory = os.path.join(tempfile.gettempdir(), str(uuid.uuid4()))
         if not Path.exists(Path(root_directory)):
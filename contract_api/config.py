@@ -10,6 +10,10 @@ NETWORKS = {
             "DB_PASSWORD": "unittest_pwd",
             "DB_NAME": "contract_api_unittest_db",
             "DB_PORT": 3306,
+            "DB_POOL_SIZE": 1,
+            "DB_POOL_MAX_OVERFLOW": 2,
+            "DB_POOL_RECYCLE": 300,
+            "DB_POOL_PRE_PING": True,
         },
     }
 }
@@ -26,6 +30,15 @@ IPFS_URL = {
     'port': '80',
 
 }
+
+# Content addressed cache of storage provider files: in-process LRU of max_bytes,
+# optionally backed by a local directory and/or an S3 bucket shared by all services
+METADATA_CACHE = {
+    'max_bytes': 32 * 1024 * 1024,
+    'directory': '',
+    's3_bucket': '',
+    's3_prefix': 'metadata-cache/',
+}
 REGION_NAME = ""
 S3_BUCKET_ACCESS_KEY = ""
 S3_BUCKET_SECRET_KEY = ""
@@ -38,4 +51,12 @@ ASSET_TEMP_EXTRACT_DIRECTORY = "/var/task/"
 ASSETS_COMPONENT_BUCKET_NAME = ""
 MANAGE_PROTO_COMPILATION = ""
 GET_STATE_SERVICE_SIGNATURE_ARN = ""
+# Signatures for the daemon state service are reused until their block number is max_blocks blocks old,
+# counting the time the block number itself was cached. When signer_key is set they are signed locally
+# instead of invoking the GET_STATE_SERVICE_SIGNATURE_ARN lambda.
+STATE_SERVICE_SIGNATURE = {
+    'max_blocks': 3,
+    'block_time_seconds': 12,
+    'signer_key': '',
+}
 CONTRACT_BASE_PATH = ""
\ No newline at end of file
@@ -2,6 +2,18 @@ from enum import Enum
 
 GET_ALL_SERVICE_OFFSET_LIMIT = 0
 GET_ALL_SERVICE_LIMIT = 15
+# Shortest word indexed by the InnoDB FULLTEXT parser (innodb_ft_min_token_size)
+FULLTEXT_MIN_TOKEN_SIZE = 3
+# FULLTEXT scores are doubles, they are scaled and rounded to integers so a cursor compares exactly
+RELEVANCE_SCORE_SCALE = 1_000_000
+# Assets mirrored from IPFS to S3 in parallel by the registry event consumers
+ASSET_SYNC_MAX_WORKERS = 8
+# Channels read from the MPE contract in one JSON-RPC batch by the mpe event consumer
+MPE_CHANNEL_BATCH_SIZE = 100
+
+# A service with a large gallery can take ~30s, so the registry event consumer stops taking
+# messages this long before its timeout and hands the rest back to SQS
+REGISTRY_EVENT_TIME_MARGIN_MS = 60000
 
 
 class ServiceAssetsRegex(Enum):
@@ -13,6 +25,7 @@ class SortKeys(str, Enum):
     RANKING = "ranking"
     RATING = "rating"
     NUMBER_OF_RATINGS = "numberOfRatings"
+    RELEVANCE = "relevance"
 
 
 class SortOrder(str, Enum):
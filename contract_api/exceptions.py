@@ -27,6 +27,11 @@ class InvalidFilterParameter(BadRequestException):
         super().__init__(message="Invalid filter parameter")
 
 
+class InvalidCursorParameter(BadRequestException):
+    def __init__(self):
+        super().__init__(message="Invalid cursor parameter")
+
+
 class InvalidCurateParameter(BadRequestException):
     def __init__(self):
         super().__init__(message="Invalid curate parameter")
@@ -1,8 +1,5 @@
-from urllib.parse import urlparse
-
-import grpc
+from common.grpc_channel_pool import DAEMON_GRPC_TIMEOUT_SECONDS, GrpcChannelPool, get_daemon_channel_pool
 from contract_api.infrastructure.stubs import state_service_pb2, state_service_pb2_grpc
-from resources.certificates.root_certificate import certificate
 from common.logger import get_logger
 
 
@@ -10,27 +7,8 @@ logger = get_logger(__name__)
 
 
 class DaemonClient:
-    @staticmethod
-    def __make_endpoint_channel(daemon_endpoint: str):
-        endpoint_object = urlparse(daemon_endpoint)
-        if endpoint_object.hostname is None:
-            raise ValueError("Invalid daemon endpoint: {}".format(daemon_endpoint))
-
-        if endpoint_object.port is not None:
-            channel_endpoint = endpoint_object.hostname + ":" + str(endpoint_object.port)
-        else:
-            channel_endpoint = endpoint_object.hostname
-
-        if endpoint_object.scheme == "http":
-            return grpc.insecure_channel(channel_endpoint)
-        elif endpoint_object.scheme == "https":
-            return grpc.secure_channel(
-                channel_endpoint, grpc.ssl_channel_credentials(root_certificates=certificate)
-            )
-        else:
-            raise ValueError(
-                "Unsupported scheme in service metadata ('{}')".format(endpoint_object.scheme)
-            )
+    def __init__(self, channel_pool: GrpcChannelPool | None = None):
+        self._channel_pool = get_daemon_channel_pool() if channel_pool is None else channel_pool
 
     def get_channel_state(
             self,
@@ -39,7 +17,7 @@ class DaemonClient:
             signature: str,
             current_block_number: int
     ):
-        grpc_channel = self.__make_endpoint_channel(daemon_endpoint)
+        grpc_channel = self._channel_pool.get_daemon_channel(daemon_endpoint)
         stub = state_service_pb2_grpc.PaymentChannelStateServiceStub(grpc_channel)
 
         request = state_service_pb2.ChannelStateRequest(
@@ -49,7 +27,7 @@ class DaemonClient:
         )
 
         try:
-            response = stub.GetChannelState(request)
+            response = stub.GetChannelState(request, timeout=DAEMON_GRPC_TIMEOUT_SECONDS)
         except Exception as e:
             logger.error(str(e))
             raise Exception(f"Failed to get channel state with id {channel_id} "
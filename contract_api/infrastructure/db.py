@@ -1,21 +1,34 @@
 from contextlib import contextmanager
+from functools import wraps
 
 from common.logger import get_logger
 from contract_api.config import NETWORKS, NETWORK_ID
 from sqlalchemy import create_engine
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
 
 logger = get_logger(__name__)
 
+db_config = NETWORKS[NETWORK_ID]['db']
+
 engine = create_engine(
-    f"{NETWORKS[NETWORK_ID]['db']['DB_DRIVER']}://{NETWORKS[NETWORK_ID]['db']['DB_USER']}:"
-    f"{NETWORKS[NETWORK_ID]['db']['DB_PASSWORD']}"
-    f"@{NETWORKS[NETWORK_ID]['db']['DB_HOST']}:"
-    f"{NETWORKS[NETWORK_ID]['db']['DB_PORT']}/{NETWORKS[NETWORK_ID]['db']['DB_NAME']}", echo=False)
+    f"{db_config['DB_DRIVER']}://{db_config['DB_USER']}:"
+    f"{db_config['DB_PASSWORD']}"
+    f"@{db_config['DB_HOST']}:"
+    f"{db_config['DB_PORT']}/{db_config['DB_NAME']}",
+    echo=False,
+    pool_size=db_config.get('DB_POOL_SIZE', 1),
+    max_overflow=db_config.get('DB_POOL_MAX_OVERFLOW', 2),
+    pool_recycle=db_config.get('DB_POOL_RECYCLE', 300),
+    pool_pre_ping=db_config.get('DB_POOL_PRE_PING', True),
+)
 
 DefaultSessionFactory = sessionmaker(bind=engine)
 
+# Session used by repositories that are not given an explicit session.
+# It lives for one lambda invocation and is released by request_session_scope.
+ScopedSession = scoped_session(DefaultSessionFactory)
+
 
 @contextmanager
 def session_scope(session_factory):
@@ -32,4 +45,19 @@ def session_scope(session_factory):
         session.rollback()
         raise
     finally:
-        session.close()
\ No newline at end of file
+        session.close()
+
+
+def request_session_scope(handler):
+    """
+    Releases the invocation scoped session after the handler returns, rolling back anything
+    left uncommitted, so a failed transaction can't leak into the next invocation of a warm container.
+    """
+    @wraps(handler)
+    def wrapper(*args, **kwargs):
+        try:
+            return handler(*args, **kwargs)
+        finally:
+            ScopedSession.remove()
+
+    return wrapper
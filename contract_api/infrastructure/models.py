@@ -1,7 +1,8 @@
 from datetime import datetime
 
-from sqlalchemy import VARCHAR, Integer, ForeignKey, UniqueConstraint, null, DECIMAL, BIGINT, func, BOOLEAN, text
-from sqlalchemy.dialects.mysql import JSON, TIMESTAMP
+from sqlalchemy import VARCHAR, Integer, ForeignKey, UniqueConstraint, null, DECIMAL, BIGINT, func, BOOLEAN, text, \
+    Double, Index
+from sqlalchemy.dialects.mysql import JSON, TIMESTAMP, TEXT
 from sqlalchemy.orm import relationship, Mapped, mapped_column, DeclarativeBase
 
 
@@ -42,7 +43,7 @@ class MpeChannel(Base):
     )
 
     __table_args__ = (
-        UniqueConstraint(channel_id, sender, signer, recipient, group_id, name="uq_channel"),
+        UniqueConstraint(channel_id, name="uq_channel_id"),
     )
 
 
@@ -320,3 +321,51 @@ class OffchainServiceConfig(Base):
     __table_args__ = (
         UniqueConstraint(org_id, service_id, parameter_name, name="uq_off"),
     )
+
+
+class ServiceCatalog(Base):
+    __tablename__ = "service_catalog"
+    service_row_id: Mapped[int] = mapped_column(
+        "service_row_id", Integer,
+        ForeignKey("service.row_id", ondelete = "CASCADE", onupdate = "CASCADE"),
+        primary_key=True,
+        autoincrement=False
+    )
+    org_id: Mapped[str] = mapped_column("org_id", VARCHAR(128), nullable=False, index=True)
+    service_id: Mapped[str] = mapped_column("service_id", VARCHAR(128), nullable=False)
+    organization_name: Mapped[str] = mapped_column(
+        "organization_name", VARCHAR(128), nullable=True, default=null
+    )
+    display_name: Mapped[str] = mapped_column("display_name", VARCHAR(256), nullable=False, default="")
+    short_description: Mapped[str] = mapped_column(
+        "short_description", VARCHAR(1024), nullable=True, default=null
+    )
+    rating: Mapped[float] = mapped_column("rating", Double, nullable=False, default=0)
+    number_of_ratings: Mapped[int] = mapped_column("number_of_ratings", Integer, nullable=False, default=0)
+    ranking: Mapped[int] = mapped_column("ranking", Integer, nullable=False, default=1)
+    is_available: Mapped[bool] = mapped_column("is_available", BOOLEAN, nullable=False, default=False)
+    org_image_url: Mapped[str] = mapped_column("org_image_url", VARCHAR(512), nullable=True, default=null)
+    service_image_url: Mapped[str] = mapped_column(
+        "service_image_url", VARCHAR(512), nullable=True, default=null
+    )
+    tags: Mapped[list] = mapped_column("tags", JSON, nullable=False, default=[])
+    search_text: Mapped[str] = mapped_column("search_text", TEXT, nullable=False, default="")
+
+    created_on: Mapped[datetime] = mapped_column(
+        "created_on", TIMESTAMP(timezone=False), nullable=False, server_default=CreateTimestamp
+    )
+    updated_on: Mapped[datetime] = mapped_column(
+        "updated_on",
+        TIMESTAMP(timezone=False),
+        nullable=False,
+        server_default=UpdateTimestamp
+    )
+
+    __table_args__ = (
+        UniqueConstraint(org_id, service_id, name = "uq_srvc_ctlg"),
+        Index("idx_srvc_ctlg_display_name", display_name, service_row_id),
+        Index("idx_srvc_ctlg_ranking", ranking, service_row_id),
+        Index("idx_srvc_ctlg_rating", rating, service_row_id),
+        Index("idx_srvc_ctlg_number_of_ratings", number_of_ratings, service_row_id),
+        Index("idx_srvc_ctlg_search_text", search_text, mysql_prefix="FULLTEXT"),
+    )
@@ -1,31 +1,18 @@
 from functools import wraps
 
-from sqlalchemy import create_engine
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session
 
 from common.logger import get_logger
-from contract_api.config import NETWORKS, NETWORK_ID
+from contract_api.infrastructure.db import ScopedSession
 
 logger = get_logger(__name__)
 
 
-engine = create_engine(
-    f"{NETWORKS[NETWORK_ID]['db']['DB_DRIVER']}://{NETWORKS[NETWORK_ID]['db']['DB_USER']}:"
-    f"{NETWORKS[NETWORK_ID]['db']['DB_PASSWORD']}"
-    f"@{NETWORKS[NETWORK_ID]['db']['DB_HOST']}:"
-    f"{NETWORKS[NETWORK_ID]['db']['DB_PORT']}/{NETWORKS[NETWORK_ID]['db']['DB_NAME']}", echo=False)
-
-Session = sessionmaker(bind=engine)
-default_session = Session()
-
-# TODO: Implement a context manager for session handling for proper session management
 class BaseRepository:
-    def __init__(self):
-        self.session = default_session
-
-    def __del__(self):
-        self.session.close()
+    @property
+    def session(self) -> Session:
+        return ScopedSession()
 
     @staticmethod
     def write_ops(method):
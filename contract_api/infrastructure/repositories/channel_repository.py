@@ -1,6 +1,7 @@
 from typing import Optional
 
 from sqlalchemy import select, update, delete
+from sqlalchemy.dialects.mysql import insert
 
 from contract_api.domain.factory.channel_factory import ChannelFactory
 from contract_api.domain.models.channel import ChannelDomain, NewChannelDomain
@@ -113,6 +114,40 @@ class ChannelRepository(BaseRepository):
 
         self.session.commit()
 
+    @BaseRepository.write_ops
+    def upsert_channels(self, channels: list[NewChannelDomain]) -> None:
+        """
+        Writes the channels with a single INSERT ... ON DUPLICATE KEY UPDATE. An existing channel hits
+        uq_channel_id whatever the case of its addresses in the event, and only its balance, nonce and
+        expiration are updated, as upsert_channel does.
+        """
+        if not channels:
+            return
+
+        query = insert(MpeChannel).values([
+            {
+                "channel_id": channel.channel_id,
+                "sender": channel.sender,
+                "signer": channel.signer,
+                "recipient": channel.recipient,
+                "group_id": channel.group_id,
+                "balance_in_cogs": channel.balance_in_cogs,
+                "pending": 0,
+                "nonce": channel.nonce,
+                "expiration": channel.expiration,
+            }
+            for channel in channels
+        ])
+        query = query.on_duplicate_key_update(
+            balance_in_cogs=query.inserted.balance_in_cogs,
+            pending=0,
+            nonce=query.inserted.nonce,
+            expiration=query.inserted.expiration,
+        )
+
+        self.session.execute(query)
+        self.session.commit()
+
     def delete_channel(self, channel_id: int) -> None:
         query = delete(
             MpeChannel
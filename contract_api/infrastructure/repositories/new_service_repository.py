@@ -31,6 +31,7 @@ from contract_api.infrastructure.models import (
 )
 from contract_api.infrastructure.models import OffchainServiceConfig
 from contract_api.infrastructure.repositories.base_repository import BaseRepository
+from contract_api.infrastructure.repositories.service_catalog_repository import ServiceCatalogRepository
 from contract_api.domain.factory.service_factory import ServiceFactory
 from contract_api.constant import SortKeys, SortOrder, FilterKeys
 
@@ -323,6 +324,7 @@ class NewServiceRepository(BaseRepository):
         )
 
         session.execute(query)
+        ServiceCatalogRepository().refresh_service(session, org_id, service_id)
         session.commit()
 
     @BaseRepository.write_ops
@@ -705,6 +707,7 @@ class NewServiceRepository(BaseRepository):
         )
 
         session.execute(query)
+        ServiceCatalogRepository().refresh_service(session, org_id, service_id)
         session.commit()
 
     def service_curated(self, session: Session, org_id: str, service_id: str) -> bool:
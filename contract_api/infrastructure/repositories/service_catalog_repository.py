@@ -0,0 +1,122 @@
+from sqlalchemy import select, insert, delete, func, and_, false
+
+from contract_api.infrastructure.models import (
+    ServiceCatalog,
+    Service,
+    ServiceMetadata,
+    Organization,
+    ServiceEndpoint,
+    ServiceMedia,
+    ServiceTags,
+)
+from contract_api.infrastructure.repositories.base_repository import BaseRepository
+
+from sqlalchemy.orm import Session
+
+
+class ServiceCatalogRepository(BaseRepository):
+    """
+    Maintains service_catalog, the precomputed listing row of every curated service.
+    Rows are rebuilt from the source tables by the writers inside their own transaction,
+    so the methods here never commit.
+    """
+
+    _columns = [
+        ServiceCatalog.service_row_id,
+        ServiceCatalog.org_id,
+        ServiceCatalog.service_id,
+        ServiceCatalog.organization_name,
+        ServiceCatalog.display_name,
+        ServiceCatalog.short_description,
+        ServiceCatalog.rating,
+        ServiceCatalog.number_of_ratings,
+        ServiceCatalog.ranking,
+        ServiceCatalog.is_available,
+        ServiceCatalog.org_image_url,
+        ServiceCatalog.service_image_url,
+        ServiceCatalog.tags,
+        ServiceCatalog.search_text,
+    ]
+
+    def refresh_service(self, session: Session, org_id: str, service_id: str) -> None:
+        self._refresh(
+            session,
+            and_(ServiceCatalog.org_id == org_id, ServiceCatalog.service_id == service_id),
+            and_(Service.org_id == org_id, Service.service_id == service_id),
+        )
+
+    def refresh_organization(self, session: Session, org_id: str) -> None:
+        self._refresh(session, ServiceCatalog.org_id == org_id, Service.org_id == org_id)
+
+    def rebuild_catalog(self, session: Session) -> None:
+        session.execute(delete(ServiceCatalog))
+        session.execute(insert(ServiceCatalog).from_select(self._columns, self._catalog_query()))
+
+    def _refresh(self, session: Session, catalog_condition, service_condition) -> None:
+        session.execute(delete(ServiceCatalog).where(catalog_condition))
+        session.execute(
+            insert(ServiceCatalog).from_select(
+                self._columns, self._catalog_query().where(service_condition)
+            )
+        )
+
+    @staticmethod
+    def _is_available_query(service_row_id):
+        return (
+            select(func.coalesce(func.max(ServiceEndpoint.is_available), false()))
+            .where(ServiceEndpoint.service_row_id == service_row_id)
+            .scalar_subquery()
+        )
+
+    def _catalog_query(self):
+        service_image_query = (
+            select(ServiceMedia.url)
+            .where(
+                ServiceMedia.service_row_id == Service.row_id,
+                ServiceMedia.asset_type == "hero_image",
+            )
+            .order_by(ServiceMedia.row_id)
+            .limit(1)
+            .scalar_subquery()
+        )
+        tags_query = (
+            select(func.coalesce(func.json_arrayagg(ServiceTags.tag_name), func.json_array()))
+            .where(ServiceTags.service_row_id == Service.row_id)
+            .scalar_subquery()
+        )
+        tag_names_query = (
+            select(func.group_concat(ServiceTags.tag_name))
+            .where(ServiceTags.service_row_id == Service.row_id)
+            .scalar_subquery()
+        )
+        # Everything a user may search a service by, indexed by idx_srvc_ctlg_search_text
+        search_text = func.concat_ws(
+            " ",
+            ServiceMetadata.display_name,
+            ServiceMetadata.short_description,
+            ServiceMetadata.description,
+            Organization.organization_name,
+            tag_names_query,
+        )
+
+        return (
+            select(
+                Service.row_id,
+                Service.org_id,
+                Service.service_id,
+                Organization.organization_name,
+                func.coalesce(ServiceMetadata.display_name, ""),
+                ServiceMetadata.short_description,
+                func.coalesce(ServiceMetadata.service_rating["rating"].as_float(), 0),
+                func.coalesce(ServiceMetadata.service_rating["total_users_rated"].as_integer(), 0),
+                func.coalesce(ServiceMetadata.ranking, 1),
+                self._is_available_query(Service.row_id),
+                func.nullif(Organization.org_assets_url["hero_image"].as_string(), "null"),
+                service_image_query,
+                tags_query,
+                search_text,
+            )
+            .join(ServiceMetadata, ServiceMetadata.service_row_id == Service.row_id)
+            .join(Organization, Organization.org_id == Service.org_id)
+            .where(Service.is_curated == True)
+        )
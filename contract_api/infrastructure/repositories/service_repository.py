@@ -1,10 +1,14 @@
+import json
+import re
 from typing import Optional
 
-from sqlalchemy import select, and_, or_, func, update, delete
+from sqlalchemy import select, and_, or_, func, update, delete, cast, tuple_, literal, BigInteger
+from sqlalchemy.dialects.mysql import JSON, match
 
 from contract_api.domain.factory.organization_factory import OrganizationFactory
 from contract_api.domain.models.offchain_service_attribute import OffchainServiceConfigDomain, \
     NewOffchainServiceConfigDomain
+from contract_api.domain.models.org_group import OrgGroupDomain
 from contract_api.domain.models.organization import OrganizationDomain
 from contract_api.domain.models.service import ServiceDomain, NewServiceDomain
 from contract_api.domain.models.service_endpoint import ServiceEndpointDomain, NewServiceEndpointDomain
@@ -19,16 +23,25 @@ from contract_api.infrastructure.models import (
     ServiceMetadata,
     Organization,
     ServiceMedia,
-    ServiceGroup
+    ServiceGroup,
+    OrgGroup,
+    ServiceCatalog
 )
 from contract_api.infrastructure.models import OffchainServiceConfig
 from contract_api.infrastructure.repositories.base_repository import BaseRepository
+from contract_api.infrastructure.repositories.service_catalog_repository import ServiceCatalogRepository
 from contract_api.domain.factory.service_factory import ServiceFactory
-from contract_api.constant import SortKeys, SortOrder, FilterKeys
+from contract_api.constant import SortKeys, SortOrder, FilterKeys, FULLTEXT_MIN_TOKEN_SIZE, RELEVANCE_SCORE_SCALE
 
 
 
 class ServiceRepository(BaseRepository):
+    _catalog_sort_mapping = {
+        SortKeys.DISPLAY_NAME.value: ServiceCatalog.display_name,
+        SortKeys.RANKING.value: ServiceCatalog.ranking,
+        SortKeys.RATING.value: ServiceCatalog.rating,
+        SortKeys.NUMBER_OF_RATINGS.value: ServiceCatalog.number_of_ratings
+    }
 
     def get_service_endpoint(self, org_id: str, service_id: str, group_id: str) -> str:
         query = select(
@@ -63,144 +76,133 @@ class ServiceRepository(BaseRepository):
             sort: str,
             order: str,
             filters: dict,
-            q: str
-    ) -> list[dict]:
+            q: str,
+            cursor: Optional[list] = None
+    ) -> tuple[list[dict], Optional[list]]:
+        """
+        Lists services from service_catalog. When a cursor (the sort values and row id of the last
+        service of the previous page) is given the page is found by keyset instead of OFFSET.
+        Sorting by relevance orders by the FULLTEXT score of q, then by rating.
+        Returns the services and the cursor of the last one, or None when there are no more pages.
+        """
+        if sort == SortKeys.RELEVANCE:
+            sort_columns = [self._search_relevance(q), ServiceCatalog.rating]
+        else:
+            sort_columns = [self._catalog_sort_mapping[sort]]
         query = select(
-            Service.org_id.label("orgId"),
-            Organization.organization_name.label("organizationName"),
-            Service.service_id.label("serviceId"),
-            ServiceMetadata.display_name.label("displayName"),
-            ServiceMetadata.service_rating["rating"].label("rating"),
-            ServiceMetadata.service_rating["total_users_rated"].label("numberOfRatings"),
-            ServiceMetadata.short_description.label("shortDescription"),
-            func.max(ServiceEndpoint.is_available).label("isAvailable"),
-            Organization.org_assets_url["hero_image"].label("orgImageUrl"),
-            ServiceMedia.url.label("serviceImageUrl")
-        ).join(
-            ServiceMetadata, ServiceMetadata.service_row_id == Service.row_id
-        ).join(
-            Organization, Organization.org_id == Service.org_id
-        ).join(
-            ServiceEndpoint, ServiceEndpoint.service_row_id == Service.row_id, isouter = True
-        ).join(
-            ServiceMedia, and_(
-                ServiceMedia.service_row_id == Service.row_id,
-                ServiceMedia.asset_type == "hero_image"
-            ),
-            isouter = True
+            ServiceCatalog.org_id.label("orgId"),
+            ServiceCatalog.organization_name.label("organizationName"),
+            ServiceCatalog.service_id.label("serviceId"),
+            ServiceCatalog.display_name.label("displayName"),
+            ServiceCatalog.rating.label("rating"),
+            ServiceCatalog.number_of_ratings.label("numberOfRatings"),
+            ServiceCatalog.short_description.label("shortDescription"),
+            ServiceCatalog.is_available.label("isAvailable"),
+            ServiceCatalog.org_image_url.label("orgImageUrl"),
+            ServiceCatalog.service_image_url.label("serviceImageUrl"),
+            *(sort_column.label(f"sortValue{index}") for index, sort_column in enumerate(sort_columns)),
+            ServiceCatalog.service_row_id.label("rowId")
         ).where(
-            Service.is_curated == True
-        ).group_by(
-            Service.org_id,
-            Organization.organization_name,
-            Service.service_id,
-            ServiceMetadata.display_name,
-            ServiceMetadata.service_rating["rating"],
-            ServiceMetadata.service_rating["total_users_rated"],
-            ServiceMetadata.short_description,
-            ServiceEndpoint.is_available,
-            Organization.org_assets_url["hero_image"],
-            ServiceMedia.url
+            *self._catalog_filters(filters, q)
         )
 
-        if filters:
-            query_filters = []
-
-            if FilterKeys.ORG_ID in filters and filters[FilterKeys.ORG_ID]:
-                query_filters.append(Service.org_id.in_(filters[FilterKeys.ORG_ID]))
-
-            if FilterKeys.TAG_NAME in filters and filters[FilterKeys.TAG_NAME]:
-                tag_subquery = select(
-                    ServiceTags.service_row_id
-                ).where(
-                    ServiceTags.tag_name.in_(filters[FilterKeys.TAG_NAME])
-                ).subquery()
-                query_filters.append(Service.row_id.in_(tag_subquery))
-
-            if FilterKeys.ONLY_AVAILABLE in filters and filters[FilterKeys.ONLY_AVAILABLE]:
-                query_filters.append(ServiceEndpoint.is_available == True)
-
-            if query_filters:
-                query = query.where(and_(*query_filters))
-
-        if q:
-            search = f"%{q}%"
-            query = query.where(
-                or_(
-                    ServiceMetadata.display_name.ilike(search),
-                    ServiceMetadata.short_description.ilike(search)
-                )
+        key = tuple_(*sort_columns, ServiceCatalog.service_row_id)
+        if order == SortOrder.DESC:
+            query = query.order_by(
+                *(sort_column.desc() for sort_column in sort_columns), ServiceCatalog.service_row_id.desc()
             )
+            if cursor:
+                query = query.where(key < tuple_(*cursor))
+        else:
+            query = query.order_by(*sort_columns, ServiceCatalog.service_row_id)
+            if cursor:
+                query = query.where(key > tuple_(*cursor))
 
-        sort_mapping = {
-            SortKeys.DISPLAY_NAME.value: ServiceMetadata.display_name,
-            SortKeys.RANKING.value: ServiceMetadata.ranking,
-            SortKeys.RATING.value: ServiceMetadata.service_rating["rating"].as_integer(),
-            SortKeys.NUMBER_OF_RATINGS.value: ServiceMetadata.service_rating["total_users_rated"].as_integer()
-        }
-
-        if sort in sort_mapping:
-            sort_column = sort_mapping[sort]
-            if order == SortOrder.DESC:
-                sort_column = sort_column.desc()
-            query = query.order_by(sort_column)
+        if not cursor:
+            query = query.offset((page - 1) * limit)
+        query = query.limit(limit + 1)
 
-        query = query.limit(limit).offset((page - 1) * limit)
+        rows = [dict(row) for row in self.session.execute(query).mappings().all()]
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = [rows[-1][f"sortValue{index}"] for index in range(len(sort_columns))]
+            next_cursor.append(rows[-1]["rowId"])
 
-        result = self.session.execute(query)
+        for row in rows:
+            for index in range(len(sort_columns)):
+                del row[f"sortValue{index}"]
+            del row["rowId"]
+            row["isAvailable"] = bool(row["isAvailable"])
 
-        return [dict(row) for row in result.mappings().all()]
+        return rows, next_cursor
 
     def get_filtered_services_count(
             self,
             filters: dict,
             q: str
     ) -> int:
-        subquery = select(
-            Service.row_id
-        ).join(
-            ServiceMetadata, ServiceMetadata.service_row_id == Service.row_id
-        ).join(
-            Organization, Organization.org_id == Service.org_id
-        ).join(
-            ServiceEndpoint, ServiceEndpoint.service_row_id == Service.row_id, isouter = True
+        query = select(
+            func.count()
+        ).select_from(
+            ServiceCatalog
         ).where(
-            Service.is_curated == True
+            *self._catalog_filters(filters, q)
         )
 
-        if filters:
-            query_filters = []
+        result = self.session.execute(query)
+        return result.scalar()
 
+    @staticmethod
+    def _catalog_filters(filters: dict, q: str) -> list:
+        query_filters = []
+
+        if filters:
             if FilterKeys.ORG_ID in filters and filters[FilterKeys.ORG_ID]:
-                query_filters.append(Service.org_id.in_(filters[FilterKeys.ORG_ID]))
+                query_filters.append(ServiceCatalog.org_id.in_(filters[FilterKeys.ORG_ID]))
 
             if FilterKeys.TAG_NAME in filters and filters[FilterKeys.TAG_NAME]:
-                tag_subquery = select(
-                    ServiceTags.service_row_id
-                ).where(
-                    ServiceTags.tag_name.in_(filters[FilterKeys.TAG_NAME])
-                ).subquery()
-                query_filters.append(Service.row_id.in_(tag_subquery))
+                query_filters.append(
+                    func.json_overlaps(
+                        ServiceCatalog.tags, cast(json.dumps(filters[FilterKeys.TAG_NAME]), JSON)
+                    )
+                )
 
             if FilterKeys.ONLY_AVAILABLE in filters and filters[FilterKeys.ONLY_AVAILABLE]:
-                query_filters.append(ServiceEndpoint.is_available == True)
-
-            if query_filters:
-                subquery = subquery.where(and_(*query_filters))
+                query_filters.append(ServiceCatalog.is_available == True)
 
         if q:
-            search = f"%{q}%"
-            subquery = subquery.where(
-                or_(
-                    ServiceMetadata.display_name.ilike(search),
-                    ServiceMetadata.short_description.ilike(search)
+            search_terms = ServiceRepository._search_terms(q)
+            if search_terms:
+                query_filters.append(match(ServiceCatalog.search_text, against=search_terms).in_boolean_mode())
+            else:
+                # Words shorter than the FULLTEXT token size are not indexed
+                search = f"%{q}%"
+                query_filters.append(
+                    or_(
+                        ServiceCatalog.display_name.ilike(search),
+                        ServiceCatalog.short_description.ilike(search)
+                    )
                 )
-            )
-
-        count_query = select(func.count()).select_from(subquery.subquery())
 
-        result = self.session.execute(count_query)
-        return result.scalar()
+        return query_filters
+
+    @staticmethod
+    def _search_terms(q: str) -> str:
+        """
+        Builds a boolean mode FULLTEXT query in which every indexable word of q is required
+        and matched as a prefix, e.g. "image gen" -> "+image* +gen*".
+        """
+        words = [word for word in re.findall(r"\w+", q.lower()) if len(word) >= FULLTEXT_MIN_TOKEN_SIZE]
+        return " ".join(f"+{word}*" for word in words)
+
+    @staticmethod
+    def _search_relevance(q: str):
+        search_terms = ServiceRepository._search_terms(q) if q else ""
+        if not search_terms:
+            return literal(0)
+        score = match(ServiceCatalog.search_text, against=search_terms).in_boolean_mode()
+        return cast(func.round(score * RELEVANCE_SCORE_SCALE), BigInteger)
 
     def get_service(
             self, org_id: str, service_id: str
@@ -231,6 +233,102 @@ class ServiceRepository(BaseRepository):
             ServiceFactory.service_metadata_from_db_model(service_metadata)
         )
 
+    def get_service_details(
+            self, org_id: str, service_id: str
+    ) -> Optional[tuple[ServiceDomain, OrganizationDomain, ServiceMetadataDomain, list[dict], list[str], bool]]:
+        """
+        Loads a curated service with its organization, metadata, media, tags and demo component flag
+        in a single round-trip. Media, tags and the offchain flag are aggregated by MySQL as JSON.
+        """
+        media_query = select(
+            func.json_arrayagg(
+                func.json_object("url", ServiceMedia.url, "assetType", ServiceMedia.asset_type),
+                type_=JSON
+            )
+        ).where(
+            ServiceMedia.service_row_id == Service.row_id
+        ).scalar_subquery()
+
+        tags_query = select(
+            func.json_arrayagg(ServiceTags.tag_name, type_=JSON)
+        ).where(
+            ServiceTags.service_row_id == Service.row_id
+        ).scalar_subquery()
+
+        demo_component_required_query = select(
+            OffchainServiceConfig.parameter_value
+        ).where(
+            OffchainServiceConfig.org_id == Service.org_id,
+            OffchainServiceConfig.service_id == Service.service_id,
+            OffchainServiceConfig.parameter_name == "demo_component_required"
+        ).limit(1).scalar_subquery()
+
+        query = select(
+            Service,
+            Organization,
+            ServiceMetadata,
+            media_query.label("media"),
+            tags_query.label("tags"),
+            demo_component_required_query.label("demo_component_required")
+        ).join(
+            Organization, Organization.org_id == Service.org_id
+        ).join(
+            ServiceMetadata, ServiceMetadata.service_row_id == Service.row_id
+        ).where(
+            Service.org_id == org_id,
+            Service.service_id == service_id,
+            Service.is_curated == True
+        ).limit(1)
+
+        result = self.session.execute(query).first()
+
+        if not result:
+            return None
+
+        service, organization, service_metadata, media, tags, demo_component_required = result
+        return (
+            ServiceFactory.service_from_db_model(service),
+            OrganizationFactory.organization_from_db_model(organization),
+            ServiceFactory.service_metadata_from_db_model(service_metadata),
+            media or [],
+            tags or [],
+            demo_component_required == "1"
+        )
+
+    def get_service_groups_with_org_groups(
+            self, org_id: str, service_id: str
+    ) -> list[tuple[ServiceGroupDomain, ServiceEndpointDomain, Optional[OrgGroupDomain]]]:
+        query = select(
+            ServiceGroup,
+            ServiceEndpoint,
+            OrgGroup
+        ).join(
+            ServiceEndpoint, and_(
+                ServiceEndpoint.service_row_id == ServiceGroup.service_row_id,
+                ServiceEndpoint.group_id == ServiceGroup.group_id
+            )
+        ).outerjoin(
+            OrgGroup, and_(
+                OrgGroup.org_id == ServiceGroup.org_id,
+                OrgGroup.group_id == ServiceGroup.group_id
+            )
+        ).where(
+            ServiceGroup.org_id == org_id,
+            ServiceGroup.service_id == service_id
+        )
+
+        result = self.session.execute(query)
+        groups_db = result.all()
+
+        return [
+            (
+                ServiceFactory.service_group_from_db_model(group),
+                ServiceFactory.service_endpoint_from_db_model(endpoint),
+                OrganizationFactory.org_groups_from_db_model([org_group])[0] if org_group is not None else None
+            )
+            for group, endpoint, org_group in groups_db
+        ]
+
     def get_service_media(self, org_id: str, service_id: str) -> list[ServiceMediaDomain]:
         query = select(
             ServiceMedia
@@ -331,6 +429,7 @@ class ServiceRepository(BaseRepository):
         )
 
         self.session.execute(query)
+        ServiceCatalogRepository().refresh_service(self.session, org_id, service_id)
         self.session.commit()
 
     @BaseRepository.write_ops
@@ -733,6 +832,7 @@ class ServiceRepository(BaseRepository):
         ).returning()
 
         self.session.execute(query)
+        ServiceCatalogRepository().refresh_service(self.session, org_id, service_id)
         self.session.commit()
 
     def service_curated(
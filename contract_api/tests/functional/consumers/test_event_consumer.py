@@ -0,0 +1,95 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from contract_api.application.consumers.event_consumer import EventConsumer
+
+EVENT_CONSUMER = "contract_api.application.consumers.event_consumer"
+
+
+def _event_consumer():
+    with patch(f"{EVENT_CONSUMER}.S3Util"), patch(f"{EVENT_CONSUMER}.StorageProvider"), \
+            patch(f"{EVENT_CONSUMER}.BlockChainUtil"):
+        return EventConsumer()
+
+
+class TestEventConsumerAssets(TestCase):
+    def test_emptied_asset_list_removes_outdated_assets(self):
+        event_consumer = _event_consumer()
+        event_consumer._push_asset_to_s3_using_hash = MagicMock()
+
+        assets_url = event_consumer._compare_assets_and_push_to_s3(
+            existing_assets_hash={"hero_image": "Qmhero", "gallery": ["Qmimage1", "Qmimage2"]},
+            new_assets_hash={"hero_image": "Qmhero", "gallery": []},
+            existing_assets_url={
+                "hero_image": "https://bucket/hero",
+                "gallery": ["https://bucket/1", "https://bucket/2"]
+            },
+            org_id="org",
+            service_id="service"
+        )
+
+        self.assertEqual(assets_url, {"hero_image": "https://bucket/hero", "gallery": []})
+        event_consumer._push_asset_to_s3_using_hash.assert_not_called()
+        deleted_urls = [call.args[0] for call in event_consumer._s3_util.delete_file_from_s3.call_args_list]
+        self.assertCountEqual(deleted_urls, ["https://bucket/1", "https://bucket/2"])
+
+    def test_assets_are_pushed_concurrently_in_metadata_order(self):
+        event_consumer = _event_consumer()
+        active_pushes, max_active_pushes = [0], [0]
+        lock = threading.Lock()
+
+        def push_asset(hash_uri, org_id, service_id, asset_type):
+            with lock:
+                active_pushes[0] += 1
+                max_active_pushes[0] = max(max_active_pushes[0], active_pushes[0])
+            # Later assets finish first so the result order does not follow completion order
+            time.sleep(0.05 if hash_uri.endswith("1") else 0.01)
+            with lock:
+                active_pushes[0] -= 1
+            return f"https://bucket/{hash_uri}_{asset_type}"
+
+        event_consumer._push_asset_to_s3_using_hash = MagicMock(side_effect=push_asset)
+
+        assets_url = event_consumer._compare_assets_and_push_to_s3(
+            existing_assets_hash={"gallery": ["Qmold"]},
+            new_assets_hash={"hero_image": "Qmhero1", "gallery": ["Qmimage1", "Qmimage2", "Qmimage3"]},
+            existing_assets_url={"gallery": ["https://bucket/Qmold_gallery", "https://bucket/Qmimage2_gallery"]},
+            org_id="org",
+            service_id="service"
+        )
+
+        self.assertEqual(assets_url, {
+            "hero_image": "https://bucket/Qmhero1_hero_image",
+            "gallery": [
+                "https://bucket/Qmimage1_gallery",
+                "https://bucket/Qmimage2_gallery",
+                "https://bucket/Qmimage3_gallery"
+            ]
+        })
+        self.assertGreater(max_active_pushes[0], 1)
+        event_consumer._s3_util.delete_file_from_s3.assert_called_once_with("https://bucket/Qmold_gallery")
+
+    def test_asset_with_same_cid_is_not_uploaded_again(self):
+        event_consumer = _event_consumer()
+        event_consumer._storage_provider.uri_to_hash.return_value = ("ipfs", "Qmhero")
+        event_consumer._s3_util.get_object_metadata.return_value = {"cid": "Qmhero"}
+
+        url = event_consumer._push_asset_to_s3_using_hash("ipfs://Qmhero", "org", "service", "hero_image")
+
+        self.assertTrue(url.endswith("/org/service/Qmhero_hero_image"))
+        event_consumer._storage_provider.get_stream.assert_not_called()
+        event_consumer._s3_util.push_stream_to_s3.assert_not_called()
+
+    def test_asset_with_changed_cid_is_uploaded(self):
+        event_consumer = _event_consumer()
+        event_consumer._storage_provider.uri_to_hash.return_value = ("ipfs", "Qmnew")
+        event_consumer._s3_util.get_object_metadata.return_value = {"cid": "Qmold"}
+        event_consumer._s3_util.push_stream_to_s3.return_value = "https://bucket/new"
+
+        url = event_consumer._push_asset_to_s3_using_hash("ipfs://Qmnew", "org", "service", "hero_image")
+
+        self.assertEqual(url, "https://bucket/new")
+        event_consumer._storage_provider.get_stream.assert_called_once_with("ipfs://Qmnew")
+        self.assertEqual(event_consumer._s3_util.push_stream_to_s3.call_args.kwargs["metadata"], {"cid": "Qmnew"})
@@ -36,8 +36,9 @@ class TestMPEEventConsumer(unittest.TestCase):
         assert channel_result.expiration == 10768765
         assert channel_result.signer == '0x6E7BaCcc00D69eab748eDf661D831cd2c7f3A4DF'
 
+    @patch("web3.main.Web3.batch_requests")
     @patch("common.blockchain_util.BlockChainUtil.get_contract_instance")
-    def test_on_event_channels_add_funds(self, mock_get_contract_instance):
+    def test_on_event_channels_add_funds(self, mock_get_contract_instance, mock_batch_requests):
         create_event = {'Records': [
             {'body': '{\n "Message" : "{\\"blockchain_name\\": \\"Ethereum\\", \\"blockchain_event\\": {\\"name\\": \\"ChannelOpen\\", \\"data\\": {\\"block_no\\": 8626046, \\"from_address\\": \\"0x6E7BaCcc00D69eab748eDf661D831cd2c7f3A4DF\\", \\"to_address\\": \\"0x03e7D37A13ed807B2311418095E23fA8Ff9DE380\\", \\"json_str\\": \\"{\'sender\': \'0x6E7BaCcc00D69eab748eDf661D831cd2c7f3A4DF\', \'recipient\': \'0x4DD0668f583c92b006A81743c9704Bd40c876fDE\', \'groupId\': b\\\\\\"5\'\\\\\\\\xff\\\\\\\\xdb\\\\\\\\xcf\\\\\\\\xff2l\\\\\\\\x0c\\\\\\\\xfaKp\\\\\\\\xafX\\\\\\\\x0e\\\\\\\\xd2\\\\\\\\xf5E\\\\\\\\xa1j\\\\\\\\xafr\\\\\\\\xd0\\\\\\\\x13\\\\\\\\xf9\\\\\\\\t(\\\\\\\\xdaS\\\\\\\\xb7_:\\\\\\", \'channelId\': 23, \'nonce\': 0, \'signer\': \'0x6E7BaCcc00D69eab748eDf661D831cd2c7f3A4DF\', \'amount\': 1, \'expiration\': 10768765}\\", \\"transaction_hash\\": \\"0xe2d933987f97b20145071f1ff61e9cb74233a903a696c7cd468bc56bf609d96d\\", \\"log_index\\": 12}}}"\n }'}
         ]}
@@ -45,6 +46,7 @@ class TestMPEEventConsumer(unittest.TestCase):
         mpe_event_consumer(create_event, context = None)
 
         update_event = {'Records': [
+            {'body': '{\n "Message" : "{\\"blockchain_name\\": \\"Ethereum\\", \\"blockchain_event\\": {\\"name\\": \\"ChannelAddFunds\\", \\"data\\": {\\"block_no\\": 8626046, \\"from_address\\": \\"0x6E7BaCcc00D69eab748eDf661D831cd2c7f3A4DF\\", \\"to_address\\": \\"0x03e7D37A13ed807B2311418095E23fA8Ff9DE380\\", \\"json_str\\": \\"{\'channelId\': 23, \'additionalFunds\': 10}\\", \\"transaction_hash\\": \\"0xe2d933987f97b20145071f1ff61e9cb74233a903a696c7cd468bc56bf609d96d\\", \\"log_index\\": 12}}}"\n }'},
             {'body': '{\n "Message" : "{\\"blockchain_name\\": \\"Ethereum\\", \\"blockchain_event\\": {\\"name\\": \\"ChannelAddFunds\\", \\"data\\": {\\"block_no\\": 8626046, \\"from_address\\": \\"0x6E7BaCcc00D69eab748eDf661D831cd2c7f3A4DF\\", \\"to_address\\": \\"0x03e7D37A13ed807B2311418095E23fA8Ff9DE380\\", \\"json_str\\": \\"{\'channelId\': 23, \'additionalFunds\': 10}\\", \\"transaction_hash\\": \\"0xe2d933987f97b20145071f1ff61e9cb74233a903a696c7cd468bc56bf609d96d\\", \\"log_index\\": 12}}}"\n }'}
         ]}
 
@@ -64,7 +66,13 @@ class TestMPEEventConsumer(unittest.TestCase):
             )
         )
 
-        mpe_event_consumer(update_event, context = None)
+        mock_batch = mock_batch_requests.return_value.__enter__.return_value
+        mock_batch.execute.return_value = [block_chain_channel_data]
+
+        response = mpe_event_consumer(update_event, context = None)
+
+        assert response == {"batchItemFailures": []}
+        mock_batch.add.assert_called_once()
 
         channel_result = self.channel_repository.get_channel(23)
         assert channel_result.sender == '0x6E7BaCcc00D69eab748eDf661D831cd2c7f3A4DF'
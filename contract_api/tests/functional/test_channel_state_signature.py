@@ -0,0 +1,108 @@
+import io
+import json
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from common.blockchain_util import BlockChainUtil
+from contract_api.application.services import channel_service
+from contract_api.application.services.channel_service import ChannelService
+from contract_api.config import STATE_SERVICE_SIGNATURE
+
+CHANNEL_SERVICE = "contract_api.application.services.channel_service"
+MPE_ADDRESS = "0x5e592F9b1d303183d963635f895f0f0C48284f4e"
+SIGNER_KEY = "5d66dccb32b03871f30533fe410d2e5998d607a579fb7bc2d991cd2148e3ec69"
+
+
+def _signer_lambda_response(signature: str, block_number: int) -> dict:
+    body = {"data": {"signature": signature, "snet-current-block-number": block_number}}
+    payload = {"statusCode": 200, "body": json.dumps(body)}
+    return {"Payload": io.BytesIO(json.dumps(payload).encode())}
+
+
+class TestChannelStateSignature(TestCase):
+    def setUp(self):
+        channel_service._state_service_signatures.clear()
+        with patch(f"{CHANNEL_SERVICE}.ChannelRepository"), patch(f"{CHANNEL_SERVICE}.DaemonClient"), \
+                patch(f"{CHANNEL_SERVICE}.ServiceRepository"):
+            self.channel_service = ChannelService()
+
+    def tearDown(self):
+        channel_service._state_service_signatures.clear()
+
+    @patch(f"{CHANNEL_SERVICE}.time.monotonic")
+    @patch(f"{CHANNEL_SERVICE}.get_lambda_client")
+    def test_signature_is_reused_until_its_block_number_is_max_blocks_old(self, get_lambda_client, monotonic):
+        get_lambda_client.return_value.invoke.side_effect = [
+            _signer_lambda_response("0xsignature1", 100),
+            _signer_lambda_response("0xsignature2", 103),
+        ]
+        block_time = STATE_SERVICE_SIGNATURE["block_time_seconds"]
+        signature_ttl = STATE_SERVICE_SIGNATURE["max_blocks"] * block_time
+
+        monotonic.return_value = 1000.0
+        first = self.channel_service._get_channel_state_signature(1)
+        # The signer block number may already be a block old, so it is reused for one block less
+        monotonic.return_value = 1000.0 + signature_ttl - block_time - 1
+        cached = self.channel_service._get_channel_state_signature(1)
+        monotonic.return_value = 1000.0 + signature_ttl - block_time
+        expired = self.channel_service._get_channel_state_signature(1)
+
+        self.assertEqual(first, ("0xsignature1", 100))
+        self.assertEqual(cached, first)
+        self.assertEqual(expired, ("0xsignature2", 103))
+        self.assertEqual(get_lambda_client.return_value.invoke.call_count, 2)
+
+    @patch(f"{CHANNEL_SERVICE}.time.monotonic")
+    @patch(f"{CHANNEL_SERVICE}.get_lambda_client")
+    @patch(f"{CHANNEL_SERVICE}.get_block_number_oracle")
+    @patch(f"{CHANNEL_SERVICE}.BlockChainUtil.get_contract_instance")
+    def test_local_signature_age_includes_block_number_age(
+            self, get_contract_instance, get_block_number_oracle, get_lambda_client, monotonic
+    ):
+        get_contract_instance.return_value = MagicMock(address=MPE_ADDRESS)
+        get_block_number_oracle.return_value.get_block_number_and_age.return_value = (100, 10.0)
+        signature_ttl = STATE_SERVICE_SIGNATURE["max_blocks"] * STATE_SERVICE_SIGNATURE["block_time_seconds"]
+
+        with patch.dict(STATE_SERVICE_SIGNATURE, {"signer_key": SIGNER_KEY}):
+            monotonic.return_value = 1000.0
+            self.channel_service._get_channel_state_signature(1)
+            monotonic.return_value = 1000.0 + signature_ttl - 10.0 - 1
+            self.channel_service._get_channel_state_signature(1)
+            monotonic.return_value = 1000.0 + signature_ttl - 10.0
+            self.channel_service._get_channel_state_signature(1)
+
+        self.assertEqual(get_block_number_oracle.return_value.get_block_number_and_age.call_count, 2)
+        get_lambda_client.assert_not_called()
+
+    @patch(f"{CHANNEL_SERVICE}.get_block_number_oracle")
+    @patch(f"{CHANNEL_SERVICE}.BlockChainUtil.get_contract_instance")
+    def test_local_signature_matches_signer_signature(self, get_contract_instance, get_block_number_oracle):
+        from signer.infrastructure.signers import Signer
+
+        get_contract_instance.return_value = MagicMock(address=MPE_ADDRESS)
+        get_block_number_oracle.return_value.get_block_number_and_age.return_value = (100, 0.0)
+        signer = Signer.__new__(Signer)
+        signer.obj_blockchain_utils = BlockChainUtil("HTTP_PROVIDER", "http://localhost:8545")
+        signer.mpe_address = MPE_ADDRESS
+
+        with patch.dict(STATE_SERVICE_SIGNATURE, {"signer_key": SIGNER_KEY}), \
+                patch("signer.infrastructure.signers.settings") as signer_settings:
+            signer_settings.signer.key = SIGNER_KEY
+            signature, block_number, _ = self.channel_service._sign_channel_state_locally(1)
+            expected = signer._Signer__sign_state_service(1, 100)
+
+        self.assertEqual(signature, expected["signature"])
+        self.assertEqual(block_number, expected["snet-current-block-number"])
+
+    @patch(f"{CHANNEL_SERVICE}.get_lambda_client")
+    @patch(f"{CHANNEL_SERVICE}.ChannelService._sign_channel_state_locally")
+    def test_signer_lambda_is_used_without_signer_key(self, sign_channel_state_locally, get_lambda_client):
+        get_lambda_client.return_value.invoke.return_value = _signer_lambda_response("0xsignature", 100)
+
+        with patch.dict(STATE_SERVICE_SIGNATURE, {"signer_key": ""}):
+            signature = self.channel_service._get_channel_state_signature(1)
+
+        self.assertEqual(signature, ("0xsignature", 100))
+        sign_channel_state_locally.assert_not_called()
+        payload = json.loads(get_lambda_client.return_value.invoke.call_args.kwargs["Payload"])
+        self.assertEqual(json.loads(payload["body"]), {"channel_id": 1})
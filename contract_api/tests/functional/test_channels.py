@@ -123,6 +123,26 @@ class TestChannels(TestCase):
         channel = self.channel_repository.get_channel(self.channel_id)
         assert int(channel.consumed_balance) == 5
 
+    def test_upsert_channels_updates_channel_with_differently_cased_addresses(self):
+        self.channel_repository.upsert_channels([
+            NewChannelDomain(
+                channel_id=self.channel_id,
+                sender="0x6e7baccc00d69eab750edf661d831cd2c7f3a4df",
+                signer="0x6e7baccc00d69eab750edf661d831cd2c7f3a4df",
+                recipient="0x4dd0668f583c92b006a81743c9704bd40c876fde",
+                nonce=1,
+                expiration=987654321,
+                balance_in_cogs=20,
+                group_id="NSf/28//MmwM+ktwr1gO0vVFoWqvctAT+Qko6lO3Xzo="
+            )
+        ])
+
+        channel = self.channel_repository.get_channel(self.channel_id)
+        self.assertEqual(channel.balance_in_cogs, 20)
+        self.assertEqual(channel.nonce, 1)
+        self.assertEqual(channel.expiration, 987654321)
+        self.assertEqual(channel.sender, "0x6E7BaCcc00D69eab750eDf661D831cd2c7f3A4DF")
+
     @patch("contract_api.application.services.channel_service.ChannelService._get_channel_state_from_daemon")
     def test_update_consumed_balance_via_daemon(self, get_channel_state_from_daemon):
         get_channel_state_from_daemon.return_value = 5
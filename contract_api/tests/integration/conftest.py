@@ -1,12 +1,13 @@
 import pytest
 import os
 from datetime import datetime, UTC
+from unittest.mock import patch
 from alembic.config import Config
 from alembic import command
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
-from contract_api.infrastructure.repositories import base_repository
+from contract_api.infrastructure.db import ScopedSession
 from contract_api.config import NETWORKS, NETWORK_ID
 from contract_api.infrastructure.models import (
     Organization, Service, ServiceMetadata, ServiceGroup, 
@@ -86,11 +87,15 @@ def db_session():
 
 @pytest.fixture(scope="function", autouse=True)
 def mock_db_session(db_session):
-    """Replace the default session in BaseRepository with the test session."""
-    original_session = base_repository.default_session
-    base_repository.default_session = db_session
-    yield db_session
-    base_repository.default_session = original_session
+    """
+    Replace the invocation scoped session used by BaseRepository with the test session.
+    request_session_scope removes the scoped session after every handler call, the removal is
+    skipped so later calls and the test itself keep using the test session.
+    """
+    ScopedSession.registry.set(db_session)
+    with patch.object(ScopedSession, "remove"):
+        yield db_session
+    ScopedSession.registry.clear()
 
 
 # ========================= Test Data Factories =========================
@@ -13,7 +13,16 @@ from contract_api.domain.models.service_group import NewServiceGroupDomain
 from contract_api.domain.models.org_group import NewOrgGroupDomain
 from contract_api.application.handlers.service_handlers import get_services
 from contract_api.constant import SortKeys, SortOrder, FilterKeys
+from contract_api.application.schemas.service_schemas import GetServicesRequest
+from contract_api.infrastructure.db import ScopedSession
 from contract_api.domain.models.service_endpoint import NewServiceEndpointDomain
+from contract_api.infrastructure.repositories.service_catalog_repository import ServiceCatalogRepository
+
+
+def rebuild_service_catalog(db_session):
+    """The listing is served from service_catalog, which the consumers keep up to date in production."""
+    ServiceCatalogRepository().rebuild_catalog(db_session)
+    db_session.commit()
 
 
 class TestGetService:
@@ -454,6 +463,34 @@ class TestGetService:
         assert "tags" in data
         assert data["tags"] == []
     
+    def test_get_service_called_twice(self, db_session, base_service, base_organization, service_repo):
+        """Test that the test session survives the session removal after each handler call."""
+        event = {
+            "pathParameters": {
+                "orgId": base_organization.org_id,
+                "serviceId": base_service.service_id
+            }
+        }
+
+        first_response = get_service(event, context=None)
+
+        tag = NewServiceTagDomain(
+            service_row_id=base_service.row_id,
+            org_id=base_organization.org_id,
+            service_id=base_service.service_id,
+            tag_name="ai"
+        )
+        service_repo.create_service_tag(db_session, tag)
+        db_session.commit()
+
+        second_response = get_service(event, context=None)
+
+        assert ScopedSession() is db_session
+        assert first_response["statusCode"] == HTTPStatus.OK
+        assert second_response["statusCode"] == HTTPStatus.OK
+        assert json.loads(first_response["body"])["data"]["tags"] == []
+        assert json.loads(second_response["body"])["data"]["tags"] == ["ai"]
+
     def test_get_service_without_media(self, base_service, base_organization):
         """Test service without any media."""
         event = {
@@ -557,7 +594,7 @@ class TestGetService:
 class TestGetServices:
     """Tests for get_services handler."""
     
-    def test_get_services_basic(self, base_service):
+    def test_get_services_basic(self, db_session, base_service):
         """Test basic get services without filters."""
         event = {
             "body": json.dumps({
@@ -570,6 +607,7 @@ class TestGetServices:
             })
         }
         
+        rebuild_service_catalog(db_session)
         response = get_services(event, context=None)
         
         assert response["statusCode"] == HTTPStatus.OK
@@ -641,6 +679,7 @@ class TestGetServices:
             })
         }
         
+        rebuild_service_catalog(db_session)
         response = get_services(event, context=None)
         body = json.loads(response["body"])
         data = body["data"]
@@ -658,12 +697,95 @@ class TestGetServices:
             "q": ""
         })
         
+        rebuild_service_catalog(db_session)
         response = get_services(event, context=None)
         body = json.loads(response["body"])
         data = body["data"]
         
         assert len(data["services"]) == 2
     
+    def test_get_services_cursor_pagination(self, db_session, service_repo, test_data_factory, base_organization):
+        """Test keyset pagination with the returned cursor."""
+        for i in range(5):
+            service_data = test_data_factory.create_service_data(
+                base_organization.org_id,
+                service_id=f"cursor-service-{i}"
+            )
+            service = service_repo.upsert_service(db_session, service_data)
+
+            metadata_data = test_data_factory.create_service_metadata_data(
+                service.row_id,
+                base_organization.org_id,
+                service_data.service_id,
+                display_name="Same Name" if i < 3 else f"Service {i}"
+            )
+            service_repo.upsert_service_metadata(db_session, metadata_data)
+
+        db_session.commit()
+        rebuild_service_catalog(db_session)
+
+        request = {
+            "limit": 2,
+            "page": 1,
+            "sort": SortKeys.DISPLAY_NAME.value,
+            "order": SortOrder.ASC.value,
+            "filter": {},
+            "q": ""
+        }
+        service_ids = []
+        cursor = None
+        for _ in range(3):
+            response = get_services({"body": json.dumps({**request, "cursor": cursor})}, context=None)
+            data = json.loads(response["body"])["data"]
+            assert data["totalCount"] == 5
+            service_ids.extend(service["serviceId"] for service in data["services"])
+            cursor = data["nextCursor"]
+
+        assert cursor is None
+        assert len(service_ids) == 5
+        assert set(service_ids) == {f"cursor-service-{i}" for i in range(5)}
+
+    def test_get_services_invalid_cursor(self):
+        """Test that an undecodable cursor is rejected."""
+        event = {
+            "body": json.dumps({
+                "limit": 2,
+                "page": 1,
+                "sort": SortKeys.DISPLAY_NAME.value,
+                "order": SortOrder.ASC.value,
+                "cursor": "not-a-cursor"
+            })
+        }
+
+        response = get_services(event, context=None)
+
+        assert response["statusCode"] == HTTPStatus.BAD_REQUEST
+
+    @pytest.mark.parametrize("cursor", [
+        ["Service", "1"],
+        ["Service", 1.5],
+        ["Service", True],
+        [{"name": "Service"}, 1],
+        [["Service"], 1],
+        [None, 1],
+        [1000000, 4.5, 1],
+    ])
+    def test_get_services_cursor_with_invalid_values(self, cursor):
+        """Test that a decodable cursor with values of the wrong type is rejected."""
+        event = {
+            "body": json.dumps({
+                "limit": 2,
+                "page": 1,
+                "sort": SortKeys.DISPLAY_NAME.value,
+                "order": SortOrder.ASC.value,
+                "cursor": GetServicesRequest.encode_cursor(cursor)
+            })
+        }
+
+        response = get_services(event, context=None)
+
+        assert response["statusCode"] == HTTPStatus.BAD_REQUEST
+
     def test_get_services_sort_by_display_name(self, db_session, service_repo, test_data_factory, base_organization):
         """Test sorting by display name."""
         # Create services with different names
@@ -709,6 +831,7 @@ class TestGetServices:
             })
         }
         
+        rebuild_service_catalog(db_session)
         response = get_services(event, context=None)
         body = json.loads(response["body"])
         services = body["data"]["services"]
@@ -727,6 +850,7 @@ class TestGetServices:
             "q": ""
         })
         
+        rebuild_service_catalog(db_session)
         response = get_services(event, context=None)
         body = json.loads(response["body"])
         services = body["data"]["services"]
@@ -793,6 +917,7 @@ class TestGetServices:
             })
         }
         
+        rebuild_service_catalog(db_session)
         response = get_services(event, context=None)
         body = json.loads(response["body"])
         services = body["data"]["services"]
@@ -848,6 +973,7 @@ class TestGetServices:
             })
         }
         
+        rebuild_service_catalog(db_session)
         response = get_services(event, context=None)
         body = json.loads(response["body"])
         data = body["data"]
@@ -868,13 +994,46 @@ class TestGetServices:
             "q": ""
         })
         
+        rebuild_service_catalog(db_session)
         response = get_services(event, context=None)
         body = json.loads(response["body"])
         data = body["data"]
         
         assert data["totalCount"] == 2
         assert len(data["services"]) == 2
-    
+
+    def test_get_services_org_without_hero_image(self, db_session, org_repo, service_repo, test_data_factory):
+        """Test that an org hero image stored as JSON null is listed as null, not the string 'null'."""
+        org_data = test_data_factory.create_organization_data(
+            org_id="org-without-image", org_assets_url={"hero_image": None}
+        )
+        org_repo.upsert_organization(db_session, org_data)
+        service_data = test_data_factory.create_service_data(org_data.org_id, service_id="service-without-image")
+        service = service_repo.upsert_service(db_session, service_data)
+        service_repo.upsert_service_metadata(db_session, test_data_factory.create_service_metadata_data(
+            service.row_id, org_data.org_id, service_data.service_id
+        ))
+        db_session.commit()
+
+        ServiceCatalogRepository().refresh_organization(db_session, org_data.org_id)
+        db_session.commit()
+        event = {
+            "body": json.dumps({
+                "limit": 10,
+                "page": 1,
+                "sort": SortKeys.DISPLAY_NAME.value,
+                "order": SortOrder.ASC.value,
+                "filter": {FilterKeys.ORG_ID.value: [org_data.org_id]},
+                "q": ""
+            })
+        }
+
+        response = get_services(event, context=None)
+
+        services = json.loads(response["body"])["data"]["services"]
+        assert len(services) == 1
+        assert services[0]["orgImageUrl"] is None
+
     def test_get_services_filter_by_tags(self, db_session, base_service, service_repo):
         """Test filtering by tags."""
         # Add tags to base service
@@ -909,6 +1068,7 @@ class TestGetServices:
             })
         }
         
+        rebuild_service_catalog(db_session)
         response = get_services(event, context=None)
         body = json.loads(response["body"])
         data = body["data"]
@@ -928,6 +1088,7 @@ class TestGetServices:
             "q": ""
         })
         
+        rebuild_service_catalog(db_session)
         response = get_services(event, context=None)
         body = json.loads(response["body"])
         data = body["data"]
@@ -982,6 +1143,7 @@ class TestGetServices:
             })
         }
         
+        rebuild_service_catalog(db_session)
         response = get_services(event, context=None)
         body = json.loads(response["body"])
         data = body["data"]
@@ -1040,6 +1202,7 @@ class TestGetServices:
             })
         }
         
+        rebuild_service_catalog(db_session)
         response = get_services(event, context=None)
         body = json.loads(response["body"])
         data = body["data"]
@@ -1057,6 +1220,7 @@ class TestGetServices:
             "q": "vision"
         })
         
+        rebuild_service_catalog(db_session)
         response = get_services(event, context=None)
         body = json.loads(response["body"])
         data = body["data"]
@@ -1064,6 +1228,93 @@ class TestGetServices:
         assert data["totalCount"] == 1
         assert "vision" in data["services"][0]["shortDescription"].lower()
     
+    def test_get_services_search_by_prefix_and_tag_with_relevance(self, db_session, service_repo, base_service):
+        """Test prefix search over tags and sorting by relevance."""
+        service_repo.create_service_tag(
+            db_session,
+            NewServiceTagDomain(
+                service_row_id=base_service.row_id,
+                org_id=base_service.org_id,
+                service_id=base_service.service_id,
+                tag_name="translation"
+            )
+        )
+        db_session.commit()
+
+        event = {
+            "body": json.dumps({
+                "limit": 10,
+                "page": 1,
+                "sort": SortKeys.RELEVANCE.value,
+                "order": SortOrder.DESC.value,
+                "filter": {},
+                "q": "transl"
+            })
+        }
+
+        rebuild_service_catalog(db_session)
+        response = get_services(event, context=None)
+        data = json.loads(response["body"])["data"]
+
+        assert data["totalCount"] == 1
+        assert data["services"][0]["serviceId"] == base_service.service_id
+
+    def test_get_services_relevance_cursor_pagination(
+            self, db_session, service_repo, test_data_factory, base_organization
+    ):
+        """Test keyset pagination by relevance, ties in score are ordered by rating."""
+        ratings = [4.0, 5.0, 4.0, 3.0, 5.0]
+        for i, rating in enumerate(ratings):
+            service_data = test_data_factory.create_service_data(
+                base_organization.org_id,
+                service_id=f"relevance-service-{i}"
+            )
+            service = service_repo.upsert_service(db_session, service_data)
+
+            metadata_data = test_data_factory.create_service_metadata_data(
+                service.row_id,
+                base_organization.org_id,
+                service_data.service_id,
+                display_name=f"Translator {i}",
+                description="Translator service",
+                short_description="Translator"
+            )
+            service_repo.upsert_service_metadata(db_session, metadata_data)
+            service_repo.update_service_rating(
+                db_session,
+                base_organization.org_id,
+                service_data.service_id,
+                {"rating": rating, "total_users_rated": 10}
+            )
+
+        db_session.commit()
+        rebuild_service_catalog(db_session)
+
+        request = {
+            "limit": 2,
+            "page": 1,
+            "sort": SortKeys.RELEVANCE.value,
+            "order": SortOrder.DESC.value,
+            "filter": {},
+            "q": "translator"
+        }
+        services = []
+        cursor = None
+        for _ in range(3):
+            response = get_services({"body": json.dumps({**request, "cursor": cursor})}, context=None)
+            assert response["statusCode"] == HTTPStatus.OK
+            data = json.loads(response["body"])["data"]
+            assert data["totalCount"] == 5
+            services.extend(data["services"])
+            cursor = data["nextCursor"]
+
+        assert cursor is None
+        assert sorted(service["serviceId"] for service in services) == [
+            f"relevance-service-{i}" for i in range(5)
+        ]
+        service_ratings = [service["rating"] for service in services]
+        assert service_ratings == sorted(service_ratings, reverse=True)
+
     def test_get_services_with_media(self, db_session, base_service, service_repo):
         """Test services with media (hero image)."""
         # Add hero image to base service
@@ -1093,6 +1344,7 @@ class TestGetServices:
             })
         }
         
+        rebuild_service_catalog(db_session)
         response = get_services(event, context=None)
         body = json.loads(response["body"])
         data = body["data"]
@@ -1213,6 +1465,7 @@ class TestGetServices:
             })
         }
         
+        rebuild_service_catalog(db_session)
         response = get_services(event, context=None)
         body = json.loads(response["body"])
         data = body["data"]
@@ -1243,7 +1496,7 @@ class TestGetServices:
         assert response["statusCode"] == HTTPStatus.BAD_REQUEST
     
     @patch('contract_api.application.services.service_service.ServiceService.get_services')
-    def test_get_services_internal_error(self, mock_get_services):
+    def test_get_services_internal_error(self, db_session, mock_get_services):
         """Test internal error handling."""
         mock_get_services.side_effect = Exception("Database error")
         
@@ -1258,5 +1511,6 @@ class TestGetServices:
             })
         }
         
+        rebuild_service_catalog(db_session)
         response = get_services(event, context=None)
         assert response["statusCode"] == HTTPStatus.INTERNAL_SERVER_ERROR
\ No newline at end of file
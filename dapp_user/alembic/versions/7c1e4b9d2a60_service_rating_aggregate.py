@@ -0,0 +1,54 @@
+"""service_rating_aggregate
+
+Revision ID: 7c1e4b9d2a60
+Revises: 53a71d0e2494
+Create Date: 2026-10-18 14:21:37.184412
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7c1e4b9d2a60"
+down_revision = "53a71d0e2494"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "service_rating_aggregate",
+        sa.Column("org_id", sa.VARCHAR(length=128), nullable=False),
+        sa.Column("service_id", sa.VARCHAR(length=128), nullable=False),
+        sa.Column("rating_sum", sa.DECIMAL(precision=19, scale=1), nullable=False),
+        sa.Column("rating_count", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "created_at",
+            mysql.TIMESTAMP(),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            mysql.TIMESTAMP(),
+            server_default=sa.text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("org_id", "service_id"),
+    )
+    op.execute(
+        """
+        INSERT INTO service_rating_aggregate (org_id, service_id, rating_sum, rating_count)
+        SELECT org_id, service_id, SUM(rating), COUNT(rating)
+        FROM user_service_vote
+        WHERE rating IS NOT NULL
+        GROUP BY org_id, service_id
+        """
+    )
+
+
+def downgrade():
+    op.drop_table("service_rating_aggregate")
@@ -0,0 +1,43 @@
+"""sync_checkpoint
+
+Revision ID: b3f0d6a81c27
+Revises: 7c1e4b9d2a60
+Create Date: 2026-10-18 15:02:11.530214
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b3f0d6a81c27"
+down_revision = "7c1e4b9d2a60"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "sync_checkpoint",
+        sa.Column("name", sa.VARCHAR(length=128), nullable=False),
+        sa.Column("pagination_token", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            mysql.TIMESTAMP(),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            mysql.TIMESTAMP(),
+            server_default=sa.text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade():
+    op.drop_table("sync_checkpoint")
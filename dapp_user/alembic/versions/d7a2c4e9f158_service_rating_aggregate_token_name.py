@@ -0,0 +1,28 @@
+"""service_rating_aggregate_token_name
+
+Revision ID: d7a2c4e9f158
+Revises: b3f0d6a81c27
+Create Date: 2026-10-18 18:40:52.317706
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d7a2c4e9f158"
+down_revision = "b3f0d6a81c27"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "service_rating_aggregate",
+        sa.Column("token_name", sa.VARCHAR(length=16), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_column("service_rating_aggregate", "token_name")
@@ -12,7 +12,7 @@ from dapp_user.application.schemas import (
     UpdateUserAlertsRequest,
 )
 from dapp_user.application.services.user_service import UserService
-from dapp_user.constant import CognitoTriggerSource
+from dapp_user.constant import USER_SYNC_TIME_MARGIN_MS, CognitoTriggerSource
 from dapp_user.exceptions import UnauthorizedException
 
 logger = get_logger(__name__)
@@ -125,4 +125,14 @@ def post_aws_cognito_signup_handler(event, context):
 
 @worker_exception_handler(logger=logger)
 def sync_users_handler(event, context):
-    __user_service.sync_users()
+    get_remaining_time = getattr(context, "get_remaining_time_in_millis", None)
+
+    def should_stop() -> bool:
+        return get_remaining_time is not None and get_remaining_time() < USER_SYNC_TIME_MARGIN_MS
+
+    __user_service.sync_users(should_stop=should_stop)
+
+
+@worker_exception_handler(logger=logger)
+def reconcile_service_ratings_handler(event, context):
+    __user_service.reconcile_service_ratings()
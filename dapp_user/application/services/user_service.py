@@ -1,4 +1,5 @@
-from typing import List
+import time
+from typing import Callable, List
 
 from common.constant import TokenSymbol
 from common.exceptions import BadGateway
@@ -10,6 +11,7 @@ from dapp_user.application.schemas import (
     GetUserFeedbackRequest,
     UpdateUserAlertsRequest,
 )
+from dapp_user.constant import USER_SYNC_CHECKPOINT
 from dapp_user.domain.factory.user_factory import UserFactory
 from dapp_user.domain.interfaces.contract_api_client_interface import AbstractContractAPIClient
 from dapp_user.domain.interfaces.user_identity_manager_interface import UserIdentityManager
@@ -95,11 +97,68 @@ class UserService:
             logger.error(msg)
             raise BadGateway(msg)
 
-    def sync_users(self) -> None:
-        users_for_sync = self.user_identity_manager.get_all_users()
+    def sync_users(self, should_stop: Callable[[], bool] | None = None) -> dict:
+        """
+        Upserts the users of the identity provider page by page, committing every page together
+        with the token of the next one. A run stopped by should_stop, or killed by the lambda timeout,
+        is resumed by the next run from the last committed page.
+        """
+        with session_scope(self.session_factory) as session:
+            pagination_token = self.user_repo.get_sync_checkpoint(session, USER_SYNC_CHECKPOINT)
+        if pagination_token:
+            logger.info("Resuming users sync from the checkpoint")
+
+        started_at = time.monotonic()
+        synced_users = 0
+        synced_pages = 0
+        completed = True
+        for users, next_pagination_token in self.user_identity_manager.iter_user_pages(pagination_token):
+            with session_scope(self.session_factory) as session:
+                self.user_repo.batch_insert_users(session, users)
+                self.user_repo.set_sync_checkpoint(session, USER_SYNC_CHECKPOINT, next_pagination_token)
+            synced_users += len(users)
+            synced_pages += 1
+
+            if next_pagination_token and should_stop is not None and should_stop():
+                completed = False
+                break
+
+        elapsed_seconds = time.monotonic() - started_at
+        metrics = {
+            "completed": completed,
+            "synced_users": synced_users,
+            "synced_pages": synced_pages,
+            "elapsed_seconds": round(elapsed_seconds, 3),
+            "users_per_second": round(synced_users / elapsed_seconds, 1) if elapsed_seconds else 0.0,
+        }
+        logger.info(f"Users sync metrics: {metrics}")
+        return metrics
 
+    def reconcile_service_ratings(self) -> None:
         with session_scope(self.session_factory) as session:
-            self.user_repo.batch_insert_users(session, users_for_sync)
+            fixed_ratings = self.user_repo.reconcile_service_ratings(session)
+
+        logger.info(f"Reconciled {len(fixed_ratings)} drifted service ratings")
+        for org_id, service_id, rating, total_users_rated, token_name in fixed_ratings:
+            # A service is listed by the contract_api of one token only. Aggregates written before
+            # the token was recorded are sent to both, the other one rejects the update
+            if token_name:
+                tokens = (TokenSymbol(token_name),)
+            else:
+                tokens = (TokenSymbol.FET, TokenSymbol.AGIX)
+            for token in tokens:
+                try:
+                    self.contract_api_client.update_service_rating(
+                        org_id=org_id,
+                        service_id=service_id,
+                        rating=float(rating),
+                        total_users_rated=total_users_rated,
+                        token_name=token,
+                    )
+                except ContractAPIClientError as e:
+                    logger.warning(
+                        f"Failed to update {token.value} service rating for {org_id}/{service_id}: {str(e)}"
+                    )
 
     def register_user(self, request: CognitoUserPoolEvent) -> dict:
         new_user = UserFactory.user_from_cognito_request(event=request)
@@ -147,6 +206,8 @@ class UserService:
     def create_user_review(
         self, origin: str, username: str, request: CreateUserServiceReviewRequest
     ) -> None:
+        token_name = self.__get_token_from_origin(origin)
+
         try:
             with session_scope(self.session_factory) as session:
                 user = self.user_repo.get_user(session, username=username)
@@ -156,13 +217,14 @@ class UserService:
                 )
 
                 rating, total_users_rated = self.user_repo.submit_user_review(
-                    session=session, user_vote=user_vote, user_feedback=user_feedback
+                    session=session,
+                    user_vote=user_vote,
+                    user_feedback=user_feedback,
+                    token_name=token_name.value,
                 )
         except (VoteAlreadyExistsException, FeedbackAlreadyExistsException):
             raise UserReviewAlreadyExistHTTPException()
 
-        token_name = self.__get_token_from_origin(origin)
-
         try:
             self.contract_api_client.update_service_rating(
                 org_id=user_vote.org_id,
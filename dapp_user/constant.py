@@ -31,3 +31,9 @@ class CognitoTriggerSource(str, Enum):
 
 class CognitoAttributes(str, Enum):
     TNC = "custom:publisher_tnc"
+
+
+# Name of the sync_checkpoint row of the Cognito users sync
+USER_SYNC_CHECKPOINT = "cognito_users"
+# Stop the users sync this long before the lambda times out, the next run resumes from the checkpoint
+USER_SYNC_TIME_MARGIN_MS = 30000
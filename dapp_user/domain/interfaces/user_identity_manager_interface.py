@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List, Tuple
 
 from dapp_user.domain.models.user import NewUser
 
@@ -9,3 +9,13 @@ class UserIdentityManager(ABC):
     def get_all_users(self) -> List[NewUser]:
         """Fetch all users from the identity provider"""
         pass
+
+    @abstractmethod
+    def iter_user_pages(
+        self, pagination_token: str | None = None
+    ) -> Iterator[Tuple[List[NewUser], str | None]]:
+        """
+        Yields the users of the identity provider page by page, with the token of the next page,
+        starting from the page of pagination_token
+        """
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 from dapp_user.domain.models.user import (
     NewUser as NewUserDomain,
@@ -30,9 +30,15 @@ class AbstractUserRepository(ABC):
 
     @abstractmethod
     def batch_insert_users(
-        self, session: Session, users: List[NewUserDomain], batch_size: int = 100
+        self, session: Session, users: Iterable[NewUserDomain], batch_size: int = 100
     ) -> None: ...
 
+    @abstractmethod
+    def get_sync_checkpoint(self, session: Session, name: str) -> str | None: ...
+
+    @abstractmethod
+    def set_sync_checkpoint(self, session: Session, name: str, pagination_token: str | None) -> None: ...
+
     @abstractmethod
     def get_user_preferences(
         self, session: Session, username: str
@@ -49,8 +55,14 @@ class AbstractUserRepository(ABC):
         session: Session,
         user_vote: UserServiceVoteDomain,
         user_feedback: UserServiceFeedbackDomain | None,
+        token_name: str | None = None,
     ) -> Tuple[float, int]: ...
 
+    @abstractmethod
+    def reconcile_service_ratings(
+        self, session: Session
+    ) -> List[Tuple[str, str, float, int, str | None]]: ...
+
     @abstractmethod
     def get_user_service_vote_and_feedback(
         self,
@@ -1,12 +1,15 @@
 import json
-from typing import Dict, List
+from typing import Dict, Iterator, List, Tuple
 
 import boto3
+from common.logger import get_logger
 from dapp_user.constant import CognitoAttributes
 from dapp_user.domain.interfaces.user_identity_manager_interface import UserIdentityManager
 from dapp_user.domain.models.user import NewUser
 from dapp_user.settings import settings
 
+logger = get_logger(__name__)
+
 
 class CognitoUserManager(UserIdentityManager):
     def __init__(self, user_pool_id: str):
@@ -14,9 +17,11 @@ class CognitoUserManager(UserIdentityManager):
         self.user_pool_id = user_pool_id
 
     def get_all_users(self) -> List[NewUser]:
-        users: List[NewUser] = []
-        pagination_token = None
+        return [user for users, _ in self.iter_user_pages() for user in users]
 
+    def iter_user_pages(
+        self, pagination_token: str | None = None
+    ) -> Iterator[Tuple[List[NewUser], str | None]]:
         while True:
             params = {
                 "UserPoolId": self.user_pool_id,
@@ -25,8 +30,17 @@ class CognitoUserManager(UserIdentityManager):
             if pagination_token:
                 params["PaginationToken"] = pagination_token
 
-            response = self.client.list_users(**params)
+            try:
+                response = self.client.list_users(**params)
+            except self.client.exceptions.InvalidParameterException:
+                if not pagination_token:
+                    raise
+                # Pagination tokens expire, upserts are idempotent so start over
+                logger.warning("Cognito pagination token was rejected, listing users from the start")
+                pagination_token = None
+                continue
 
+            users: List[NewUser] = []
             for user in response["Users"]:
                 attr_map: Dict[str, str] = {
                     attr["Name"]: attr["Value"] for attr in user.get("Attributes", [])
@@ -50,11 +64,10 @@ class CognitoUserManager(UserIdentityManager):
                 users.append(new_user)
 
             pagination_token = response.get("PaginationToken")
+            yield users, pagination_token
             if not pagination_token:
                 break
 
-        return users
-
     def _parse_terms_accepted(self, json_str: str | None) -> bool:
         if not json_str:
             return False
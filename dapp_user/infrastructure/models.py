@@ -8,6 +8,7 @@ from sqlalchemy import (
     BigInteger,
     ForeignKey,
     Integer,
+    Text,
     UniqueConstraint,
     text,
 )
@@ -124,3 +125,42 @@ class UserServiceFeedback(Base):
     updated_at: Mapped[datetime] = mapped_column(
         TIMESTAMP, server_default=UpdateTimestamp, nullable=True
     )
+
+
+class ServiceRatingAggregate(Base):
+    """
+    Running sum and count of the non null ratings in user_service_vote, maintained by the repository
+    in the same transaction as the votes and recomputed by the reconciliation job.
+    token_name is the token of the contract_api listing the service, taken from the review origin.
+    """
+    __tablename__ = "service_rating_aggregate"
+
+    org_id: Mapped[str] = mapped_column(VARCHAR(128), primary_key=True)
+    service_id: Mapped[str] = mapped_column(VARCHAR(128), primary_key=True)
+    rating_sum: Mapped[Decimal] = mapped_column(DECIMAL(19, 1), nullable=False, default=0)
+    rating_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    token_name: Mapped[str] = mapped_column(VARCHAR(16), nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP, server_default=CreateTimestamp, nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP, server_default=UpdateTimestamp, nullable=False
+    )
+
+
+class SyncCheckpoint(Base):
+    """
+    Where a paginated sync job stopped, so the next run resumes from there.
+    """
+    __tablename__ = "sync_checkpoint"
+
+    name: Mapped[str] = mapped_column(VARCHAR(128), primary_key=True)
+    pagination_token: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP, server_default=CreateTimestamp, nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP, server_default=UpdateTimestamp, nullable=False
+    )
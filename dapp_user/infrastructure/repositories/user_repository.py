@@ -1,4 +1,5 @@
-from typing import List, Tuple
+from decimal import Decimal
+from typing import Iterable, List, Tuple
 
 from common.utils import chunked
 from dapp_user.constant import Status
@@ -11,6 +12,8 @@ from dapp_user.domain.models.user_service_feedback import (
 )
 from dapp_user.domain.models.user_service_vote import UserServiceVote as UserServiceVoteDomain
 from dapp_user.infrastructure.models import (
+    ServiceRatingAggregate,
+    SyncCheckpoint,
     User,
     UserPreference,
     UserServiceFeedback,
@@ -90,6 +93,21 @@ class UserRepository:
         return UserFactory.user_preferences_from_db_model(user_preference_db)
 
     def delete_user(self, session: Session, username: str):
+        # Votes are removed by the foreign key cascade, so take them out of the aggregates first
+        votes_query = (
+            select(
+                UserServiceVote.org_id,
+                UserServiceVote.service_id,
+                func.sum(UserServiceVote.rating),
+                func.count(UserServiceVote.rating),
+            )
+            .join(User, User.row_id == UserServiceVote.user_row_id)
+            .where(User.username == username, UserServiceVote.rating.isnot(None))
+            .group_by(UserServiceVote.org_id, UserServiceVote.service_id)
+        )
+        for org_id, service_id, rating_sum, rating_count in session.execute(votes_query).all():
+            self.__apply_service_rating_delta(session, org_id, service_id, -rating_sum, -rating_count)
+
         query = delete(User).where(User.username == username)
         result = session.execute(query)
         if result.rowcount == 0:
@@ -98,11 +116,9 @@ class UserRepository:
     def batch_insert_users(
         self,
         session: Session,
-        users: List[NewUserDomain],
+        users: Iterable[NewUserDomain],
         batch_size: int = 100,
     ):
-        if not users:
-            return
 
         for batch in chunked(users, batch_size):
             user_dicts = [
@@ -128,6 +144,15 @@ class UserRepository:
 
             session.execute(query)
 
+    def get_sync_checkpoint(self, session: Session, name: str) -> str | None:
+        checkpoint = session.get(SyncCheckpoint, name)
+        return checkpoint.pagination_token if checkpoint else None
+
+    def set_sync_checkpoint(self, session: Session, name: str, pagination_token: str | None) -> None:
+        query = insert(SyncCheckpoint).values(name=name, pagination_token=pagination_token)
+        query = query.on_duplicate_key_update(pagination_token=query.inserted.pagination_token)
+        session.execute(query)
+
     def insert_user(self, session: Session, user: UserDomain | NewUserDomain):
         try:
             query = insert(User).values(
@@ -145,16 +170,20 @@ class UserRepository:
         except IntegrityError:
             raise UserAlreadyExistsException(username=user.email)
 
-    def __update_or_set_user_vote(self, session: Session, user_vote: UserServiceVoteDomain) -> None:
+    def __update_or_set_user_vote(
+        self, session: Session, user_vote: UserServiceVoteDomain, token_name: str | None
+    ) -> None:
         query = select(UserServiceVote).where(
             UserServiceVote.user_row_id == user_vote.user_row_id,
             UserServiceVote.org_id == user_vote.org_id,
             UserServiceVote.service_id == user_vote.service_id,
         )
-        vote = session.execute(query).scalar_one_or_none()
+        vote = session.execute(query.with_for_update()).scalar_one_or_none()
         if vote:
+            previous_rating = vote.rating
             vote.rating = user_vote.rating
         else:
+            previous_rating = None
             new_vote = UserServiceVote(
                 user_row_id=user_vote.user_row_id,
                 org_id=user_vote.org_id,
@@ -163,6 +192,15 @@ class UserRepository:
             )
             session.add(new_vote)
 
+        self.__apply_service_rating_delta(
+            session,
+            user_vote.org_id,
+            user_vote.service_id,
+            self.__to_rating_decimal(user_vote.rating) - self.__to_rating_decimal(previous_rating),
+            (user_vote.rating is not None) - (previous_rating is not None),
+            token_name,
+        )
+
     def __update_or_set_user_feedback(
         self, session: Session, user_feedback: UserServiceFeedbackDomain,
     ) -> None:
@@ -183,29 +221,122 @@ class UserRepository:
             )
             session.add(new_feedback)
 
+    @staticmethod
+    def __to_rating_decimal(rating) -> Decimal:
+        # Ratings come as floats from requests and as Decimals from user_service_vote
+        return Decimal(0) if rating is None else Decimal(str(rating))
+
+    def __apply_service_rating_delta(
+        self,
+        session: Session,
+        org_id: str,
+        service_id: str,
+        rating_sum_delta,
+        rating_count_delta: int,
+        token_name: str | None = None,
+    ) -> None:
+        if not rating_sum_delta and not rating_count_delta:
+            return
+        query = insert(ServiceRatingAggregate).values(
+            org_id=org_id,
+            service_id=service_id,
+            rating_sum=rating_sum_delta,
+            rating_count=rating_count_delta,
+            token_name=token_name,
+        )
+        query = query.on_duplicate_key_update(
+            rating_sum=ServiceRatingAggregate.rating_sum + query.inserted.rating_sum,
+            rating_count=ServiceRatingAggregate.rating_count + query.inserted.rating_count,
+            token_name=func.coalesce(query.inserted.token_name, ServiceRatingAggregate.token_name),
+        )
+        session.execute(query)
+
     def __aggregate_service_rating(
         self, session: Session, org_id: str, service_id: str
     ) -> Tuple[float, int]:
-        agg_stmt = select(
-            func.avg(UserServiceVote.rating).label("avg_rating"),
-            func.count(UserServiceVote.rating).label("total_rated"),
-        ).where(
-            UserServiceVote.org_id == org_id,
-            UserServiceVote.service_id == service_id,
-            UserServiceVote.rating.isnot(None),
+        query = select(ServiceRatingAggregate.rating_sum, ServiceRatingAggregate.rating_count).where(
+            ServiceRatingAggregate.org_id == org_id,
+            ServiceRatingAggregate.service_id == service_id,
         )
-        result = session.execute(agg_stmt).one()
-        avg_rating, total_rated = result
-        return avg_rating or 0.0, total_rated
+        result = session.execute(query).one_or_none()
+        if result is None or not result.rating_count:
+            return 0.0, 0
+        return result.rating_sum / result.rating_count, result.rating_count
+
+    def reconcile_service_ratings(
+        self, session: Session
+    ) -> List[Tuple[str, str, float, int, str | None]]:
+        """
+        Recomputes every aggregate from user_service_vote and fixes the ones that drifted.
+        Returns (org_id, service_id, avg_rating, total_rated, token_name) of the fixed aggregates,
+        token_name is None when no review recorded it.
+        """
+        votes_query = (
+            select(
+                UserServiceVote.org_id,
+                UserServiceVote.service_id,
+                func.sum(UserServiceVote.rating),
+                func.count(UserServiceVote.rating),
+            )
+            .where(UserServiceVote.rating.isnot(None))
+            .group_by(UserServiceVote.org_id, UserServiceVote.service_id)
+        )
+        expected = {
+            (org_id, service_id): (rating_sum, rating_count)
+            for org_id, service_id, rating_sum, rating_count in session.execute(votes_query).all()
+        }
+        aggregates_query = select(
+            ServiceRatingAggregate.org_id,
+            ServiceRatingAggregate.service_id,
+            ServiceRatingAggregate.rating_sum,
+            ServiceRatingAggregate.rating_count,
+            ServiceRatingAggregate.token_name,
+        ).with_for_update()
+        actual = {}
+        token_names = {}
+        for org_id, service_id, rating_sum, rating_count, token_name in session.execute(
+            aggregates_query
+        ).all():
+            actual[(org_id, service_id)] = (rating_sum, rating_count)
+            token_names[(org_id, service_id)] = token_name
+
+        fixed = []
+        for key in expected.keys() | actual.keys():
+            rating_sum, rating_count = expected.get(key, (Decimal(0), 0))
+            if actual.get(key, (Decimal(0), 0)) == (rating_sum, rating_count):
+                continue
+            org_id, service_id = key
+            if rating_count:
+                session.execute(
+                    insert(ServiceRatingAggregate)
+                    .values(org_id=org_id, service_id=service_id, rating_sum=rating_sum, rating_count=rating_count)
+                    .on_duplicate_key_update(rating_sum=rating_sum, rating_count=rating_count)
+                )
+            else:
+                session.execute(
+                    delete(ServiceRatingAggregate).where(
+                        ServiceRatingAggregate.org_id == org_id,
+                        ServiceRatingAggregate.service_id == service_id,
+                    )
+                )
+            fixed.append((
+                org_id,
+                service_id,
+                rating_sum / rating_count if rating_count else 0.0,
+                rating_count,
+                token_names.get(key),
+            ))
+        return fixed
 
     def submit_user_review(
         self,
         session: Session,
         user_vote: UserServiceVoteDomain,
         user_feedback: UserServiceFeedbackDomain | None,
+        token_name: str | None = None,
     ) -> Tuple[float, int]:
         try:
-            self.__update_or_set_user_vote(session, user_vote)
+            self.__update_or_set_user_vote(session, user_vote, token_name)
         except IntegrityError:
             raise VoteAlreadyExistsException()
 
@@ -288,6 +419,13 @@ class UserRepository:
         )
 
         session.add(new_vote)
+        self.__apply_service_rating_delta(
+            session,
+            user_vote.org_id,
+            user_vote.service_id,
+            self.__to_rating_decimal(user_vote.rating),
+            int(user_vote.rating is not None),
+        )
 
         return UserFactory().user_service_vote_from_db_model(new_vote)
 
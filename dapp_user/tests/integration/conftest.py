@@ -300,4 +300,44 @@ def mock_user_identity_manager(fake_cognito_users: List[NewUser]):
         def get_all_users(self) -> List[NewUser]:
             return fake_cognito_users
 
+        def iter_user_pages(self, pagination_token: str | None = None):
+            yield fake_cognito_users, None
+
     return MockUserIdentityManager()
+
+
+@pytest.fixture
+def paged_user_identity_manager():
+    """Identity manager serving three pages of two users, the token of a page is page-<index>."""
+
+    class PagedUserIdentityManager:
+        def __init__(self):
+            self.pages = [
+                [
+                    NewUser(
+                        account_id=f"paged-{index}",
+                        username=f"paged-{index}@example.com",
+                        name=f"Paged User {index}",
+                        email=f"paged-{index}@example.com",
+                        email_verified=True,
+                        email_alerts=True,
+                        status=True,
+                        is_terms_accepted=True,
+                    )
+                    for index in range(page * 2, page * 2 + 2)
+                ]
+                for page in range(3)
+            ]
+            self.start_tokens = []
+
+        def get_all_users(self) -> List[NewUser]:
+            return [user for page in self.pages for user in page]
+
+        def iter_user_pages(self, pagination_token: str | None = None):
+            self.start_tokens.append(pagination_token)
+            start = int(pagination_token.split("-")[1]) if pagination_token else 0
+            for index in range(start, len(self.pages)):
+                next_token = f"page-{index + 1}" if index + 1 < len(self.pages) else None
+                yield self.pages[index], next_token
+
+    return PagedUserIdentityManager()
@@ -5,16 +5,19 @@ from typing import List, Tuple
 from unittest.mock import MagicMock
 
 import pytest
+from common.constant import TokenSymbol
 from dapp_user.application.handlers import user_handlers
 from dapp_user.application.services.user_service import UserService
+from dapp_user.constant import USER_SYNC_CHECKPOINT
 from dapp_user.domain.interfaces.user_identity_manager_interface import UserIdentityManager
 from dapp_user.domain.models.user_preference import UserPreference as UserPreferenceDomain
 from dapp_user.domain.models.user_service_feedback import (
     UserServiceFeedback as UserServiceFeedbackDomain,
 )
 from dapp_user.domain.models.user_service_vote import UserServiceVote as UserServiceVoteDomain
+from dapp_user.infrastructure.cognito_api import CognitoUserManager
 from dapp_user.infrastructure.db import session_scope
-from dapp_user.infrastructure.models import User
+from dapp_user.infrastructure.models import ServiceRatingAggregate, User
 from dapp_user.infrastructure.repositories.exceptions import UserNotFoundException
 from dapp_user.infrastructure.repositories.user_repository import UserRepository
 from dapp_user.tests.integration.conftest import TEST_USER
@@ -340,6 +343,13 @@ def test_create_user_service_review_handler_with_comment(
         assert feedback is not None
         assert feedback.comment == expected_comment
 
+        aggregate = session.get(ServiceRatingAggregate, (expected_org_id, expected_service_id))
+        assert aggregate.token_name == TokenSymbol.FET.value
+
+    mock_contract_api.update_service_rating.assert_called_once()
+    assert mock_contract_api.update_service_rating.call_args.kwargs["rating"] == expected_user_rating
+    assert mock_contract_api.update_service_rating.call_args.kwargs["total_users_rated"] == 1
+
 
 def test_get_user_review(
     lambda_event_authorized: dict,
@@ -363,6 +373,68 @@ def test_get_user_review(
     assert body["data"]["comment"] == "test"
 
 
+def test_reconcile_service_ratings_handler(
+    create_test_user_feedback_vote: Tuple[UserServiceVoteDomain, UserServiceFeedbackDomain],
+    monkeypatch: MonkeyPatch,
+    test_session_factory: sessionmaker,
+):
+    mock_contract_api = MagicMock()
+    monkeypatch.setattr(
+        user_handlers,
+        "__user_service",
+        UserService(contract_api_client=mock_contract_api, session_factory=test_session_factory),
+    )
+
+    # The fixture vote was written without the repository, so its aggregate is missing
+    user_handlers.reconcile_service_ratings_handler(event={}, context={})
+
+    with session_scope(test_session_factory) as session:
+        aggregate = session.get(ServiceRatingAggregate, ("test_org", "test_service"))
+        assert aggregate.rating_sum == 5
+        assert aggregate.rating_count == 1
+        session.delete(aggregate)
+
+    calls = mock_contract_api.update_service_rating.call_args_list
+    assert [call.kwargs["token_name"] for call in calls] == [TokenSymbol.FET, TokenSymbol.AGIX]
+    assert all(call.kwargs["rating"] == 5.0 and call.kwargs["total_users_rated"] == 1 for call in calls)
+
+
+def test_reconcile_service_ratings_handler_recorded_token(
+    create_test_user_feedback_vote: Tuple[UserServiceVoteDomain, UserServiceFeedbackDomain],
+    monkeypatch: MonkeyPatch,
+    test_session_factory: sessionmaker,
+):
+    mock_contract_api = MagicMock()
+    monkeypatch.setattr(
+        user_handlers,
+        "__user_service",
+        UserService(contract_api_client=mock_contract_api, session_factory=test_session_factory),
+    )
+    with session_scope(test_session_factory) as session:
+        session.add(
+            ServiceRatingAggregate(
+                org_id="test_org",
+                service_id="test_service",
+                rating_sum=3,
+                rating_count=2,
+                token_name=TokenSymbol.AGIX.value,
+            )
+        )
+
+    user_handlers.reconcile_service_ratings_handler(event={}, context={})
+
+    with session_scope(test_session_factory) as session:
+        aggregate = session.get(ServiceRatingAggregate, ("test_org", "test_service"))
+        assert aggregate.rating_sum == 5
+        assert aggregate.rating_count == 1
+        assert aggregate.token_name == TokenSymbol.AGIX.value
+        session.delete(aggregate)
+
+    mock_contract_api.update_service_rating.assert_called_once()
+    assert mock_contract_api.update_service_rating.call_args.kwargs["token_name"] == TokenSymbol.AGIX
+    assert mock_contract_api.update_service_rating.call_args.kwargs["total_users_rated"] == 1
+
+
 def test_sync_users_handler(
     create_test_users: List[User],
     monkeypatch: MonkeyPatch,
@@ -385,3 +457,72 @@ def test_sync_users_handler(
         for cognito_user in fake_cognito_users:
             user = UserRepository().get_user(session=session,username=cognito_user.username)
             assert cognito_user.account_id == user.account_id
+        assert UserRepository().get_sync_checkpoint(session, USER_SYNC_CHECKPOINT) is None
+
+
+def test_sync_users_checkpoints_pages_and_resumes(
+    paged_user_identity_manager,
+    test_session_factory: sessionmaker,
+):
+    user_service = UserService(
+        user_identity_manager=paged_user_identity_manager,
+        session_factory=test_session_factory,
+    )
+    checkpoints = []
+
+    def should_stop() -> bool:
+        # Called after every page, once the page and its checkpoint are committed
+        with session_scope(test_session_factory) as session:
+            checkpoints.append(UserRepository().get_sync_checkpoint(session, USER_SYNC_CHECKPOINT))
+        return len(checkpoints) == 2
+
+    metrics = user_service.sync_users(should_stop=should_stop)
+
+    assert checkpoints == ["page-1", "page-2"]
+    assert metrics["completed"] is False
+    assert metrics["synced_pages"] == 2
+    with session_scope(test_session_factory) as session:
+        assert UserRepository().get_sync_checkpoint(session, USER_SYNC_CHECKPOINT) == "page-2"
+
+    metrics = user_service.sync_users()
+
+    assert paged_user_identity_manager.start_tokens == [None, "page-2"]
+    assert metrics["completed"] is True
+    assert metrics["synced_users"] == 2
+    with session_scope(test_session_factory) as session:
+        assert UserRepository().get_sync_checkpoint(session, USER_SYNC_CHECKPOINT) is None
+        for user in paged_user_identity_manager.get_all_users():
+            synced_user = UserRepository().get_user(session, username=user.username)
+            assert synced_user.account_id == user.account_id
+
+
+def test_cognito_user_pages_restart_on_expired_token():
+    user_manager = CognitoUserManager("test_pool")
+    user_manager.client = MagicMock()
+    user_manager.client.exceptions.InvalidParameterException = type(
+        "InvalidParameterException", (Exception,), {}
+    )
+
+    def cognito_user(index: int) -> dict:
+        return {
+            "Attributes": [
+                {"Name": "sub", "Value": f"sub-{index}"},
+                {"Name": "email", "Value": f"user-{index}@example.com"},
+                {"Name": "nickname", "Value": f"User {index}"},
+            ]
+        }
+
+    user_manager.client.list_users.side_effect = [
+        user_manager.client.exceptions.InvalidParameterException("Invalid pagination token"),
+        {"Users": [cognito_user(0)], "PaginationToken": "token-1"},
+        {"Users": [cognito_user(1)]},
+    ]
+
+    pages = list(user_manager.iter_user_pages("expired-token"))
+
+    requested_tokens = [
+        call.kwargs.get("PaginationToken") for call in user_manager.client.list_users.call_args_list
+    ]
+    assert requested_tokens == ["expired-token", None, "token-1"]
+    assert [[user.account_id for user in users] for users, _ in pages] == [["sub-0"], ["sub-1"]]
+    assert [next_token for _, next_token in pages] == ["token-1", None]
@@ -0,0 +1,63 @@
+"""call_event_ledger
+
+Revision ID: e4d2a7c91f35
+Revises: 5c8704c9b2b7
+Create Date: 2026-10-18 15:42:10.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4d2a7c91f35"
+down_revision: Union[str, None] = "5c8704c9b2b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "call_event",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("idempotency_key", sa.VARCHAR(length=128), nullable=False),
+        sa.Column("account_id", sa.VARCHAR(length=128), nullable=False),
+        sa.Column("org_id", sa.VARCHAR(length=256), nullable=False),
+        sa.Column("service_id", sa.VARCHAR(length=256), nullable=False),
+        sa.Column("duration", sa.Integer(), nullable=False),
+        sa.Column("amount", sa.DECIMAL(precision=38, scale=0), nullable=False),
+        sa.Column("event_timestamp", sa.TIMESTAMP(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(),
+            server_default=sa.text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["account_id"],
+            ["account_balance.account_id"],
+            onupdate="CASCADE",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("idempotency_key", name="uq_idempotency_key"),
+    )
+    op.create_index(
+        op.f("ix_call_event_account_id"), "call_event", ["account_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_call_event_account_id"), table_name="call_event")
+    op.drop_table("call_event")
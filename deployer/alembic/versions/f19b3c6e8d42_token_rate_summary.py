@@ -0,0 +1,47 @@
+"""token_rate_summary
+
+Revision ID: f19b3c6e8d42
+Revises: e4d2a7c91f35
+Create Date: 2026-10-18 17:05:44.902617
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f19b3c6e8d42"
+down_revision: Union[str, None] = "e4d2a7c91f35"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "token_rate_summary",
+        sa.Column("token_symbol", sa.VARCHAR(length=128), nullable=False),
+        sa.Column("cogs_per_usd", sa.DECIMAL(precision=38, scale=0), nullable=False),
+        sa.Column("rate_updated_at", sa.TIMESTAMP(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(),
+            server_default=sa.text("CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("token_symbol"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("token_rate_summary")
@@ -2,7 +2,7 @@ from common.constant import StatusCode
 from common.exception_handler import exception_handler
 from common.logger import get_logger
 from common.request_context import RequestContext
-from common.utils import generate_lambda_response, generate_lambda_text_file_response
+from common.utils import generate_lambda_response
 from deployer.application.schemas.billing_schemas import (
     GetMetricsRequest,
     CallEventConsumerRequest,
@@ -112,9 +112,9 @@ def download_metrics(event, context, metrics_service=None, auth_service=None):
 
     if metrics_service is None:
         metrics_service = MetricsService()
-    file_content, filename = metrics_service.download_metrics(request)
+    file_export = metrics_service.download_metrics(request)
 
-    return generate_lambda_text_file_response(file_content, filename, cors_enabled=True)
+    return file_export.to_lambda_response(cors_enabled=True)
 
 
 @exception_handler(logger=logger)
@@ -140,17 +140,29 @@ def update_transaction_status(event, context, billing_service=None):
 
 def call_event_consumer(event, context, billing_service=None):
     logger.debug(f"Received events from queue: {event}")
-    events = CallEventConsumerRequest.get_events_from_queue(event)
 
     if billing_service is None:
         billing_service = BillingService()
 
-    logger.debug(f"Events: {events}")
-    for e in events:
-        request = CallEventConsumerRequest.validate_event(e)
-        billing_service.process_call_event(request)
-
-    return {}
+    requests = {}
+    failed_message_ids = []
+    for record in event.get("Records", []):
+        message_id = record.get("messageId")
+        try:
+            requests[message_id] = CallEventConsumerRequest.from_queue_record(record)
+        except Exception:
+            logger.exception(f"Failed to parse call event from message {message_id}")
+            failed_message_ids.append(message_id)
+
+    logger.debug(f"Events: {requests}")
+    if requests:
+        failed_message_ids.extend(billing_service.process_call_events(requests))
+
+    return {
+        "batchItemFailures": [
+            {"itemIdentifier": message_id} for message_id in failed_message_ids
+        ]
+    }
 
 
 def update_token_rate(event, context, billing_service=None):
@@ -2,7 +2,7 @@ from common.constant import StatusCode
 from common.exception_handler import exception_handler
 from common.logger import get_logger
 from common.request_context import RequestContext
-from common.utils import generate_lambda_response, generate_lambda_text_file_response
+from common.utils import generate_lambda_response
 from deployer.application.services.authorization_service import AuthorizationService
 from deployer.application.schemas.daemon_schemas import (
     DaemonRequest,
@@ -65,9 +65,9 @@ def download_daemon_logs(event, context, daemon_service=None, auth_service=None)
 
     if daemon_service is None:
         daemon_service = DaemonService()
-    file_content, filename = daemon_service.download_daemon_logs(request)
+    file_export = daemon_service.download_daemon_logs(request)
 
-    return generate_lambda_text_file_response(file_content, filename, cors_enabled=True)
+    return file_export.to_lambda_response(cors_enabled=True)
 
 
 @exception_handler(logger=logger)
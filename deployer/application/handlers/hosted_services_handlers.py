@@ -2,7 +2,7 @@ from common.constant import StatusCode
 from common.exception_handler import exception_handler
 from common.logger import get_logger
 from common.request_context import RequestContext
-from common.utils import generate_lambda_response, generate_lambda_text_file_response
+from common.utils import generate_lambda_response
 from deployer.application.schemas.hosted_services_schemas import (
     HostedServiceRequest,
     UpdateHostedServiceStatusRequest,
@@ -77,9 +77,9 @@ def download_hosted_service_logs(event, context, hosted_services_service=None, a
 
     if hosted_services_service is None:
         hosted_services_service = HostedServicesService()
-    file_content, filename = hosted_services_service.download_hosted_service_logs(request)
+    file_export = hosted_services_service.download_hosted_service_logs(request)
 
-    return generate_lambda_text_file_response(file_content, filename, cors_enabled=True)
+    return file_export.to_lambda_response(cors_enabled=True)
 
 
 def update_hosted_service_status(event, context, hosted_services_service=None):
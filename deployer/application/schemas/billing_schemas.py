@@ -1,3 +1,4 @@
+import hashlib
 import json
 from datetime import datetime
 from typing import Optional
@@ -79,12 +80,29 @@ class CallEventConsumerRequest(BaseModel, QueueEventRequest):
     duration: int
     amount: int
     timestamp: datetime
+    idempotency_key: Optional[str] = Field(default=None, exclude=True)
 
     @classmethod
     @validation_handler()
     def validate_event(cls, event: dict) -> "CallEventConsumerRequest":
         return cls.model_validate(event)
 
+    @classmethod
+    def from_queue_record(cls, record: dict) -> "CallEventConsumerRequest":
+        """
+        Parses an SQS record with an SNS notification. The SNS message id stays the same when
+        the message is redelivered, so it is used as the idempotency key of the call event.
+        """
+        body = json.loads(record["body"])
+        message = body["Message"]
+        request = cls.validate_event(json.loads(message))
+        request.idempotency_key = (
+            body.get("MessageId")
+            or record.get("messageId")
+            or hashlib.sha256(message.encode()).hexdigest()
+        )
+        return request
+
 
 class GetBalanceAndRateRequest(BaseModel):
     org_id: str = Field(alias="orgId")
@@ -1,5 +1,8 @@
 import os
-from typing import Tuple, List
+import time
+from datetime import UTC, datetime
+from collections import defaultdict
+from typing import Tuple, List, Dict, Set
 
 from eth_typing import HexStr
 from web3 import Web3
@@ -21,12 +24,21 @@ from deployer.config import (
     TOKEN_JSON_FILE_NAME,
     TOKEN_NAME,
     TOKEN_DECIMALS,
+    TOKEN_RATE_AVERAGING_MODE,
+    TOKEN_RATE_EMA_HALF_LIFE_IN_HOURS,
+)
+from deployer.constant import (
+    TypeOfMovementOfFunds,
+    OrderType,
+    IncomeStatus,
+    SERVICE_ACCOUNT_CACHE_TTL_IN_SECONDS,
+    TokenRateAveragingMode,
 )
-from deployer.constant import TypeOfMovementOfFunds, OrderType, IncomeStatus
 from deployer.domain.models.account_balance import NewAccountBalanceDomain
+from deployer.domain.models.call_event import NewCallEventDomain
 from deployer.domain.models.evm_transaction import NewEVMTransactionDomain
 from deployer.domain.models.order import NewOrderDomain
-from deployer.domain.models.token_rate import NewTokenRateDomain
+from deployer.domain.models.token_rate import NewTokenRateDomain, TokenRateSummaryDomain
 from deployer.domain.models.transactions_metadata import TransactionsMetadataDomain
 from deployer.exceptions import (
     UnacceptableOrderStatusException,
@@ -38,6 +50,7 @@ from deployer.infrastructure.clients.haas_client import HaaSClient
 from deployer.infrastructure.db import DefaultSessionFactory, session_scope
 from deployer.infrastructure.models import OrderStatus, EVMTransactionStatus
 from deployer.infrastructure.repositories.account_balance_repository import AccountBalanceRepository
+from deployer.infrastructure.repositories.call_event_repository import CallEventRepository
 from deployer.infrastructure.repositories.daemon_repository import DaemonRepository
 from deployer.infrastructure.repositories.order_repository import OrderRepository
 from deployer.infrastructure.repositories.token_rate_repository import TokenRateRepository
@@ -46,10 +59,22 @@ from deployer.infrastructure.repositories.transaction_repository import Transact
 
 logger = get_logger(__name__)
 
+# (org_id, service_id) -> (account_id, expires_at), shared by the invocations of a warm container
+_service_accounts: Dict[Tuple[str, str], Tuple[str, float]] = {}
+
 
 class BillingService:
-    def __init__(self, session_factory=None, haas_client=None, crypto_exchange_client=None):
+    def __init__(
+        self,
+        session_factory=None,
+        haas_client=None,
+        crypto_exchange_client=None,
+        service_account_cache=None,
+    ):
         self.session_factory = DefaultSessionFactory if session_factory is None else session_factory
+        self._service_accounts = (
+            _service_accounts if service_account_cache is None else service_account_cache
+        )
         self._haas_client = HaaSClient() if haas_client is None else haas_client
         self._crypto_exchange_client = (
             CryptoExchangeClient() if crypto_exchange_client is None else crypto_exchange_client
@@ -148,7 +173,16 @@ class BillingService:
             if account_balance is not None:
                 balance = int(account_balance.balance_in_cogs)
 
-            average_cogs_per_usd = TokenRateRepository.get_average_cogs_per_usd(session, TOKEN_NAME)
+            token_rate_summary = TokenRateRepository.get_token_rate_summary(
+                session, TOKEN_NAME.lower()
+            )
+            if token_rate_summary is not None:
+                average_cogs_per_usd = token_rate_summary.cogs_per_usd
+            else:
+                # Until the first update_token_rate run writes the summary
+                average_cogs_per_usd = TokenRateRepository.get_average_cogs_per_usd(
+                    session, TOKEN_NAME
+                )
             if average_cogs_per_usd is None:
                 raise TokenRateUnavailableException()
 
@@ -279,18 +313,84 @@ class BillingService:
             OrderRepository.fail_old_orders(session)
             OrderRepository.expire_old_orders(session)
 
-    def process_call_event(self, request: CallEventConsumerRequest):
+    def process_call_events(self, requests: Dict[str, CallEventConsumerRequest]) -> List[str]:
+        """
+        Bills a batch of call events keyed by message id and returns the ids of the messages
+        that could not be billed. Every new event is written to the call event ledger and the
+        amounts are charged with one balance update per account, events already in the ledger
+        are skipped.
+        """
+        failed_message_ids = []
         with session_scope(self.session_factory) as session:
-            daemon = DaemonRepository.search_daemon(session, request.org_id, request.service_id)
+            service_accounts = self._get_service_accounts(
+                session, {(request.org_id, request.service_id) for request in requests.values()}
+            )
+            billed_keys = CallEventRepository.get_existing_idempotency_keys(
+                session, [request.idempotency_key for request in requests.values()]
+            )
 
-            if daemon is None or daemon.hosted_service is None:
-                raise HostedServiceNotFoundException(
-                    org_id=request.org_id, service_id=request.service_id
+            call_events: Dict[str, NewCallEventDomain] = {}
+            for message_id, request in requests.items():
+                account_id = service_accounts.get((request.org_id, request.service_id))
+                if account_id is None:
+                    logger.warning(
+                        HostedServiceNotFoundException(
+                            org_id=request.org_id, service_id=request.service_id
+                        ).message
+                    )
+                    failed_message_ids.append(message_id)
+                    continue
+
+                if request.idempotency_key in billed_keys or request.idempotency_key in call_events:
+                    logger.info(f"Call event {request.idempotency_key} is already billed")
+                    continue
+
+                call_events[request.idempotency_key] = NewCallEventDomain(
+                    idempotency_key=request.idempotency_key,
+                    account_id=account_id,
+                    org_id=request.org_id,
+                    service_id=request.service_id,
+                    duration=request.duration,
+                    amount=request.amount,
+                    event_timestamp=request.timestamp,
                 )
 
-            AccountBalanceRepository.decrease_account_balance(
-                session, daemon.account_id, request.amount
-            )
+            CallEventRepository.add_call_events(session, list(call_events.values()))
+
+            amounts = defaultdict(int)
+            for call_event in call_events.values():
+                amounts[call_event.account_id] += call_event.amount
+            # Sorted to lock the balance rows in the same order in concurrent batches
+            for account_id in sorted(amounts):
+                AccountBalanceRepository.decrease_account_balance(
+                    session, account_id, amounts[account_id]
+                )
+
+        logger.info(
+            f"Billed {len(call_events)} call events of {len(amounts)} accounts, "
+            f"failed: {len(failed_message_ids)}"
+        )
+        return failed_message_ids
+
+    def _get_service_accounts(
+        self, session, services: Set[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], str]:
+        now = time.monotonic()
+        service_accounts = {}
+        for service in services:
+            cached = self._service_accounts.get(service)
+            if cached is not None and cached[1] > now:
+                service_accounts[service] = cached[0]
+
+        missing_services = services - service_accounts.keys()
+        if missing_services:
+            found_accounts = DaemonRepository.get_hosted_service_accounts(session, missing_services)
+            expires_at = now + SERVICE_ACCOUNT_CACHE_TTL_IN_SECONDS
+            for service, account_id in found_accounts.items():
+                self._service_accounts[service] = (account_id, expires_at)
+            service_accounts.update(found_accounts)
+
+        return service_accounts
 
     def update_token_rate(self) -> None:
         token_symbol = TOKEN_NAME.lower()
@@ -307,6 +407,60 @@ class BillingService:
             )
             TokenRateRepository.delete_old_token_rates(session)
 
+            current_time = datetime.now(UTC).replace(tzinfo=None)
+            average_cogs_per_usd = self._get_average_cogs_per_usd(
+                session, token_symbol, cogs_per_usd, current_time
+            )
+            TokenRateRepository.upsert_token_rate_summary(
+                session,
+                TokenRateSummaryDomain(
+                    token_symbol=token_symbol,
+                    cogs_per_usd=average_cogs_per_usd,
+                    rate_updated_at=current_time,
+                ),
+            )
+
+        logger.info(
+            f"Token rate: {cogs_per_usd} cogs per usd, {TOKEN_RATE_AVERAGING_MODE.value} average: "
+            f"{average_cogs_per_usd}"
+        )
+
+    @staticmethod
+    def _get_average_cogs_per_usd(
+        session, token_symbol: str, cogs_per_usd: int, current_time: datetime
+    ) -> int:
+        if TOKEN_RATE_AVERAGING_MODE == TokenRateAveragingMode.EMA:
+            token_rate_summary = TokenRateRepository.get_token_rate_summary(session, token_symbol)
+            # Without a previous average the EMA starts from the mean of the stored rates
+            if token_rate_summary is not None:
+                elapsed_hours = (
+                    current_time - token_rate_summary.rate_updated_at
+                ).total_seconds() / 3600
+                alpha = 1 - 0.5 ** (max(elapsed_hours, 0) / TOKEN_RATE_EMA_HALF_LIFE_IN_HOURS)
+                previous_average = token_rate_summary.cogs_per_usd
+                return round(previous_average + alpha * (cogs_per_usd - previous_average))
+        elif TOKEN_RATE_AVERAGING_MODE == TokenRateAveragingMode.TIME_WEIGHTED:
+            history = TokenRateRepository.get_cogs_per_usd_history(session, token_symbol)
+            return BillingService._get_time_weighted_average(history)
+
+        return TokenRateRepository.get_average_cogs_per_usd(session, token_symbol)
+
+    @staticmethod
+    def _get_time_weighted_average(history: List[Tuple[datetime, int]]) -> int:
+        """
+        Averages the rates linearly interpolated between their timestamps, so the rates around
+        a missed update do not count less than the others.
+        """
+        total_seconds = (history[-1][0] - history[0][0]).total_seconds()
+        if total_seconds <= 0:
+            return round(sum(rate for _, rate in history) / len(history))
+
+        area = sum(
+            (previous_rate + rate) / 2 * (timestamp - previous_timestamp).total_seconds()
+            for (previous_timestamp, previous_rate), (timestamp, rate) in zip(history, history[1:])
+        )
+        return round(area / total_seconds)
+
     @staticmethod
     def _get_transactions_from_blockchain(
         tx_metadata: TransactionsMetadataDomain,
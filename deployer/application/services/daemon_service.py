@@ -1,13 +1,14 @@
-from typing import List, Tuple
+from typing import List
 
 from common.boto_utils import BotoUtils
+from common.file_export import FileExport
 from common.logger import get_logger
 from deployer.application.schemas.daemon_schemas import (
     DaemonRequest,
     UpdateConfigRequest,
     UpdateDaemonStatusRequest,
 )
-from deployer.config import REGION_NAME
+from deployer.config import REGION_NAME, EXPORT_BUCKET, EXPORT_KEY_PREFIX
 from deployer.exceptions import (
     DaemonNotFoundException,
     UpdateConfigNotAvailableException,
@@ -57,10 +58,15 @@ class DaemonService:
 
         return daemon_logs
 
-    def download_daemon_logs(self, request: DaemonRequest) -> Tuple[str, str]:
+    def download_daemon_logs(self, request: DaemonRequest) -> FileExport:
         daemon_logs = self.get_daemon_logs(request)
 
-        return "\n".join(daemon_logs), f"daemon_{request.daemon_id}_logs.txt"
+        with FileExport(
+            f"daemon_{request.daemon_id}_logs.txt", bucket=EXPORT_BUCKET, key_prefix=EXPORT_KEY_PREFIX
+        ) as file_export:
+            file_export.write_lines(daemon_logs)
+
+        return file_export
 
     def redeploy_all_daemons(self) -> dict:
         with session_scope(self.session_factory) as session:
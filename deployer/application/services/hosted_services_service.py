@@ -1,11 +1,13 @@
-from typing import Tuple, List
+from typing import List
 
+from common.file_export import FileExport
 from common.logger import get_logger
 from deployer.application.schemas.hosted_services_schemas import (
     HostedServiceRequest,
     UpdateHostedServiceStatusRequest,
     CheckGithubRepositoryRequest,
 )
+from deployer.config import EXPORT_BUCKET, EXPORT_KEY_PREFIX
 from deployer.exceptions import HostedServiceNotFoundException, LogsAreNotAvailableException
 from deployer.infrastructure.clients.github_api_client import GithubAPIClient
 from deployer.infrastructure.clients.haas_client import HaaSClient
@@ -50,12 +52,17 @@ class HostedServicesService:
 
         return hosted_service_logs
 
-    def download_hosted_service_logs(self, request: HostedServiceRequest) -> Tuple[str, str]:
+    def download_hosted_service_logs(self, request: HostedServiceRequest) -> FileExport:
         hosted_service_logs = self.get_hosted_service_logs(request)
 
-        return "\n".join(
-            hosted_service_logs
-        ), f"hosted_service_{request.hosted_service_id}_logs.txt"
+        with FileExport(
+            f"hosted_service_{request.hosted_service_id}_logs.txt",
+            bucket=EXPORT_BUCKET,
+            key_prefix=EXPORT_KEY_PREFIX,
+        ) as file_export:
+            file_export.write_lines(hosted_service_logs)
+
+        return file_export
 
     def check_github_repository(self, request: CheckGithubRepositoryRequest) -> dict:
         is_installed = self._github_api_client.check_repo_installation(
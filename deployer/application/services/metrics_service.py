@@ -1,16 +1,42 @@
-from typing import Dict, List, Any, Tuple
+import csv
+import math
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Iterator, Optional
 
-from pandas import DataFrame, date_range
+from pandas import DataFrame, concat, date_range
 
+from common.file_export import FileExport
 from deployer.application.schemas.billing_schemas import GetMetricsRequest
-from deployer.config import REQUEST_MAX_LIMIT
-from deployer.constant import OrderType, PeriodType, FREQUENCY_BY_PERIOD
-from deployer.domain.schemas.haas_responses import CallEventResponse
+from deployer.config import REQUEST_MAX_LIMIT, EXPORT_BUCKET, EXPORT_KEY_PREFIX
+from deployer.constant import OrderType, FREQUENCY_BY_PERIOD, METRICS_FETCH_MAX_WORKERS
+from deployer.domain.schemas.haas_responses import CallEventResponse, GetCallEventsResponse
 from deployer.infrastructure.clients.haas_client import HaaSClient
 from deployer.infrastructure.db import DefaultSessionFactory, session_scope
 from deployer.infrastructure.repositories.daemon_repository import DaemonRepository
 
 
+# Per time group accumulators of the events and how the accumulators of two pages are combined
+EVENTS_AGGREGATIONS = {
+    "requests_count": ("amount", "size"),
+    "costs_sum": ("amount", "sum"),
+    "costs_min": ("amount", "min"),
+    "costs_max": ("amount", "max"),
+    "durations_sum": ("duration", "sum"),
+    "durations_min": ("duration", "min"),
+    "durations_max": ("duration", "max"),
+}
+AGGREGATES_COMBINATIONS = {
+    "requests_count": "sum",
+    "costs_sum": "sum",
+    "costs_min": "min",
+    "costs_max": "max",
+    "durations_sum": "sum",
+    "durations_min": "min",
+    "durations_max": "max",
+}
+
+
 class MetricsService:
     def __init__(self, session_factory=None, haas_client=None):
         self.session_factory = DefaultSessionFactory if session_factory is None else session_factory
@@ -18,31 +44,42 @@ class MetricsService:
         self.datetime_format = "%Y-%m-%dT%H:%M:%S"
 
     def get_metrics(self, request: GetMetricsRequest) -> dict:
-        events = self._get_all_events(request)
+        frequency = FREQUENCY_BY_PERIOD[request.period]
 
-        if not events:
-            return self._get_empty_metrics_response()
+        aggregates = None
+        for events in self._iter_event_pages(request):
+            aggregates = self._fold_events_page(aggregates, events, frequency)
 
-        df = self._create_events_dataframe(events)
-        grouped_data = self._group_events_by_timeframe(df, request.period)
+        if aggregates is None:
+            return self._get_empty_metrics_response()
 
-        metrics = self._prepare_aggregated_metrics(grouped_data)
-        metrics["summary"] = self._prepare_metrics_summary(df)
+        metrics = self._prepare_aggregated_metrics(aggregates, frequency)
+        metrics["summary"] = self._prepare_metrics_summary(aggregates)
 
         return metrics
 
-    def download_metrics(self, request: GetMetricsRequest) -> Tuple[str, str]:
-        file_content = "orgId,serviceId,duration,amount,timestamp"
-        filename = f"hosted_service_{request.hosted_service_id}_metrics.csv"
-
-        events = self._get_all_events(request)
-
-        for event in events:
-            file_content += f"\n{event.org_id},{event.service_id},{event.duration},{event.amount},{event.timestamp}"
-
-        return file_content, filename
-
-    def _get_all_events(self, request: GetMetricsRequest) -> List[CallEventResponse]:
+    def download_metrics(self, request: GetMetricsRequest) -> FileExport:
+        with FileExport(
+            f"hosted_service_{request.hosted_service_id}_metrics.csv",
+            bucket=EXPORT_BUCKET,
+            key_prefix=EXPORT_KEY_PREFIX,
+        ) as file_export:
+            writer = csv.writer(file_export, lineterminator="\n")
+            writer.writerow(["orgId", "serviceId", "duration", "amount", "timestamp"])
+            for events in self._iter_event_pages(request):
+                writer.writerows(
+                    (event.org_id, event.service_id, event.duration, event.amount, event.timestamp)
+                    for event in events
+                )
+
+        return file_export
+
+    def _iter_event_pages(self, request: GetMetricsRequest) -> Iterator[List[CallEventResponse]]:
+        """
+        Yields the pages of the hosted service call events in order. Once the first page gives
+        the total count, the rest of the pages are fetched concurrently, with at most
+        METRICS_FETCH_MAX_WORKERS pages fetched ahead of the consumer.
+        """
         with session_scope(self.session_factory) as session:
             daemon = DaemonRepository.get_daemon_by_hosted_service(
                 session, request.hosted_service_id
@@ -50,50 +87,79 @@ class MetricsService:
 
         # In this case, the daemon and hosted_service will never be None, because otherwise the verification will not pass at the authorization stage earlier
 
-        events = []
-        page = 1
-        response = self._haas_client.get_call_events(
-            services=(daemon.org_id, daemon.service_id),
-            limit=REQUEST_MAX_LIMIT,
-            page=page,
-            order=OrderType.ASC,
-            period=request.period,
-        )
-        events.extend(response.events)
-
-        while response.total_count > len(events):
-            page += 1
-            response = self._haas_client.get_call_events(
+        def get_page(page: int) -> GetCallEventsResponse:
+            return self._haas_client.get_call_events(
                 services=(daemon.org_id, daemon.service_id),
                 limit=REQUEST_MAX_LIMIT,
                 page=page,
                 order=OrderType.ASC,
                 period=request.period,
             )
-            events.extend(response.events)
 
-        return events
+        response = get_page(1)
+        yield response.events
+
+        pages_count = math.ceil(response.total_count / REQUEST_MAX_LIMIT)
+        if pages_count <= 1:
+            return
+
+        with ThreadPoolExecutor(max_workers=METRICS_FETCH_MAX_WORKERS) as executor:
+            pending_pages = deque()
+            for page in range(2, pages_count + 1):
+                pending_pages.append(executor.submit(get_page, page))
+                if len(pending_pages) >= METRICS_FETCH_MAX_WORKERS:
+                    yield pending_pages.popleft().result().events
+            while pending_pages:
+                yield pending_pages.popleft().result().events
+
+    @staticmethod
+    def _fold_events_page(
+        aggregates: Optional[DataFrame], events: List[CallEventResponse], frequency: str
+    ) -> Optional[DataFrame]:
+        """
+        Folds a page of events into the per time group accumulators, so only one row per
+        time group is kept in memory however many events the hosted service has.
+        """
+        if not events:
+            return aggregates
+
+        df = DataFrame(
+            {
+                "timestamp": [event.timestamp for event in events],
+                "duration": [event.duration for event in events],
+                "amount": [event.amount for event in events],
+            }
+        )
+        time_group = df["timestamp"].dt.floor(frequency).rename("time_group")
+        page_aggregates = df.groupby(time_group).agg(**EVENTS_AGGREGATIONS)
+
+        if aggregates is None:
+            return page_aggregates
 
-    def _prepare_aggregated_metrics(self, grouped_data: dict):
-        df = grouped_data["grouped_df"]
-        time_groups = grouped_data["time_groups"]
+        return concat([aggregates, page_aggregates]).groupby(level=0).agg(AGGREGATES_COMBINATIONS)
 
+    def _prepare_aggregated_metrics(self, aggregates: DataFrame, frequency: str) -> dict:
+        time_groups = date_range(
+            start=aggregates.index.min(), end=aggregates.index.max(), freq=frequency
+        )
+        full_aggregates = aggregates.reindex(time_groups, fill_value=0)
+
+        requests_count = full_aggregates["requests_count"]
+        non_empty_requests_count = requests_count.where(requests_count > 0)
         aggregated_metrics = {
-            "requestsCount": df.groupby("time_group").size(),
-            "costsSum": df.groupby("time_group")["amount"].sum(),
-            "costsAvg": df.groupby("time_group")["amount"].mean(),
-            "durationsSum": df.groupby("time_group")["duration"].sum(),
-            "durationsAvg": df.groupby("time_group")["duration"].mean(),
+            "requestsCount": requests_count,
+            "costsSum": full_aggregates["costs_sum"],
+            "costsAvg": (full_aggregates["costs_sum"] / non_empty_requests_count).fillna(0),
+            "durationsSum": full_aggregates["durations_sum"],
+            "durationsAvg": (full_aggregates["durations_sum"] / non_empty_requests_count).fillna(0),
         }
 
-        full_series = aggregated_metrics["requestsCount"].reindex(time_groups, fill_value=0)
-        labels = full_series.index.strftime(self.datetime_format)
-
-        for name, data in aggregated_metrics.items():
-            full_series = data.reindex(time_groups, fill_value=0)
-            aggregated_metrics[name] = full_series.values.tolist()
+        labels = time_groups.strftime(self.datetime_format)
 
-        return {"labels": labels.tolist(), "values": aggregated_metrics}
+        return {
+            "labels": labels.tolist(),
+            "values": {name: data.values.tolist() for name, data in aggregated_metrics.items()},
+        }
 
     def _get_empty_metrics_response(self) -> dict:
         return {
@@ -112,48 +178,23 @@ class MetricsService:
             },
         }
 
-    def _create_events_dataframe(self, events: List[CallEventResponse]) -> DataFrame:
-        events_data = []
-        for event in events:
-            events_data.append(
-                {
-                    "timestamp": event.timestamp,
-                    "duration": event.duration,
-                    "amount": event.amount,
-                }
-            )
-
-        return DataFrame(events_data)
-
-    def _group_events_by_timeframe(self, df: DataFrame, period: PeriodType) -> Dict[str, Any]:
-        df = df.sort_values("timestamp")
-        df = df.copy()
-        df["time_group"] = df["timestamp"].dt.floor(FREQUENCY_BY_PERIOD[period])
-
-        time_groups = date_range(
-            start=df["time_group"].min(),
-            end=df["time_group"].max(),
-            freq=FREQUENCY_BY_PERIOD[period],
-        )
-
-        return {"grouped_df": df, "time_groups": time_groups, "period": period}
-
-    def _prepare_metrics_summary(self, df: DataFrame) -> Dict:
-        cost_stats = df["amount"].describe()
-        duration_stats = df["duration"].describe()
+    def _prepare_metrics_summary(self, aggregates: DataFrame) -> Dict:
+        requests_total = int(aggregates["requests_count"].sum())
+        costs_total = int(aggregates["costs_sum"].sum())
+        durations_total = int(aggregates["durations_sum"].sum())
 
         return {
-            "requests": {"total": len(df)},
+            "requests": {"total": requests_total},
             "costs": {
-                "total": int(df["amount"].sum()),
-                "avg": round(float(cost_stats["mean"]), 2),
-                "max": round(float(cost_stats["max"]), 2),
-                "min": round(float(cost_stats["min"]), 2),
+                "total": costs_total,
+                "avg": round(costs_total / requests_total, 2),
+                "max": round(float(aggregates["costs_max"].max()), 2),
+                "min": round(float(aggregates["costs_min"].min()), 2),
             },
             "durations": {
-                "total": int(df["duration"].sum()),
-                "avg": round(float(duration_stats["mean"]), 2),
-                "max": round(float(duration_stats["max"]), 2),
-                "min": round(float(duration_stats["min"]), 2),
+                "total": durations_total,
+                "avg": round(durations_total / requests_total, 2),
+                "max": round(float(aggregates["durations_max"].max()), 2),
+                "min": round(float(aggregates["durations_min"].min()), 2),
             },
         }
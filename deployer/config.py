@@ -1,4 +1,4 @@
-from deployer.constant import DaemonStorageType
+from deployer.constant import DaemonStorageType, TokenRateAveragingMode
 
 NETWORKS = {
     11155111: {
@@ -19,6 +19,8 @@ NETWORK_ID = 11155111
 TOKEN_NAME = "FET"
 STAGE = "dev"
 TOKEN_DECIMALS = 18
+TOKEN_RATE_AVERAGING_MODE = TokenRateAveragingMode.SIMPLE
+TOKEN_RATE_EMA_HALF_LIFE_IN_HOURS = 6
 
 IPFS_URL = {
     "url": "ipfs.singularitynet.io",
@@ -59,5 +61,9 @@ GITHUB_PRIVATE_KEY = """
 
 REQUEST_MAX_LIMIT = 100
 
+# Downloads too large to be returned inline are uploaded here and served by pre-signed URLs
+EXPORT_BUCKET = ""
+EXPORT_KEY_PREFIX = "deployer/exports/"
+
 CONTRACT_BASE_PATH = ""
 TOKEN_JSON_FILE_NAME = ""
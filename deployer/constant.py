@@ -44,6 +44,12 @@ FREQUENCY_BY_PERIOD = {
 }
 
 
+class TokenRateAveragingMode(str, Enum):
+    SIMPLE = "simple"  # mean of the rates of the last day
+    TIME_WEIGHTED = "time_weighted"  # rates of the last day weighted by the time between them
+    EMA = "ema"  # exponential moving average updated with every new rate
+
+
 class OrderType(str, Enum):
     ASC = "asc"
     DESC = "desc"
@@ -83,3 +89,10 @@ class HaaSHostedServiceStatus(str, Enum):
     UP = "UP"
     DOWN = "DOWN"
     ERROR = "ERROR"
+
+
+# Hosted services rarely change their account, so call events reuse the resolved account for a while
+SERVICE_ACCOUNT_CACHE_TTL_IN_SECONDS = 300
+
+# Call event pages fetched from HaaS concurrently when building the metrics
+METRICS_FETCH_MAX_WORKERS = 8
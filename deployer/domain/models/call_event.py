@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass
+class NewCallEventDomain:
+    idempotency_key: str
+    account_id: str
+    org_id: str
+    service_id: str
+    duration: int
+    amount: int
+    event_timestamp: datetime
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 
 from deployer.domain.models.base_domain import BaseDomain
 
@@ -13,3 +14,10 @@ class NewTokenRateDomain:
 @dataclass
 class TokenRateDomain(NewTokenRateDomain, BaseDomain):
     id: int
+
+
+@dataclass
+class TokenRateSummaryDomain:
+    token_symbol: str
+    cogs_per_usd: int
+    rate_updated_at: datetime
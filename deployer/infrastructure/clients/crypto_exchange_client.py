@@ -1,4 +1,4 @@
-import requests
+from common.http_session import get_http_session
 
 
 class CryptoExchangeClientError(Exception):
@@ -12,7 +12,9 @@ class CryptoExchangeClient:
             url = "https://api.coingecko.com/api/v3/simple/price"
             query_params = {"symbols": token_symbol, "vs_currencies": "usd"}
 
-            response = requests.get(url, params=query_params)
+            response = get_http_session("coingecko").get(
+                url, params=query_params, endpoint="get_token_rate"
+            )
 
             return float(response.json()[token_symbol]["usd"])
         except Exception as e:
@@ -1,13 +1,21 @@
+import threading
 import time
 from typing import Tuple
 
-import requests
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
 import jwt
 
+from common.http_session import get_http_session
 from deployer.config import GITHUB_PRIVATE_KEY, GITHUB_APP_ID, JWT_EXPIRATION_IN_MINUTES
 
+# The cached app JWT is replaced this long before it expires
+JWT_REFRESH_MARGIN_IN_SECONDS = 30
+
+_private_key = None
+_jwt_cache = {"token": None, "expires_at": 0}
+_jwt_lock = threading.Lock()
+
 
 class GithubAPIClientError(Exception):
     def __init__(self, message):
@@ -17,18 +25,31 @@ class GithubAPIClientError(Exception):
 class GithubAPIClient:
     @staticmethod
     def __generate_jwt() -> str:
-        private_key = serialization.load_pem_private_key(
-            GITHUB_PRIVATE_KEY.encode("utf-8"), password=None, backend=default_backend()
-        )
-
-        current_time = int(time.time())
-        payload = {
-            "iat": current_time,
-            "exp": current_time + (60 * JWT_EXPIRATION_IN_MINUTES),
-            "iss": GITHUB_APP_ID,
-        }
-
-        return jwt.encode(payload, private_key, algorithm="RS256")
+        global _private_key
+
+        with _jwt_lock:
+            current_time = int(time.time())
+            if (
+                _jwt_cache["token"] is not None
+                and current_time < _jwt_cache["expires_at"] - JWT_REFRESH_MARGIN_IN_SECONDS
+            ):
+                return _jwt_cache["token"]
+
+            if _private_key is None:
+                _private_key = serialization.load_pem_private_key(
+                    GITHUB_PRIVATE_KEY.encode("utf-8"), password=None, backend=default_backend()
+                )
+
+            expires_at = current_time + (60 * JWT_EXPIRATION_IN_MINUTES)
+            payload = {
+                "iat": current_time,
+                "exp": expires_at,
+                "iss": GITHUB_APP_ID,
+            }
+
+            _jwt_cache["token"] = jwt.encode(payload, _private_key, algorithm="RS256")
+            _jwt_cache["expires_at"] = expires_at
+            return _jwt_cache["token"]
 
     @staticmethod
     def _get_installation(account_name: str, repository_name: str) -> Tuple[int, dict]:
@@ -38,7 +59,9 @@ class GithubAPIClient:
             url = f"https://api.github.com/repos/{account_name}/{repository_name}/installation"
             headers = {"Authorization": f"Bearer {token}", "Accept": "application/vnd.github+json"}
 
-            response = requests.get(url, headers=headers)
+            response = get_http_session("github").get(
+                url, headers=headers, endpoint="get_installation"
+            )
 
             return response.status_code, response.json()
         except Exception as e:
@@ -1,9 +1,9 @@
 from typing import Tuple, List, Union
 
-import requests
 from requests.auth import HTTPBasicAuth
 
 from common.boto_utils import BotoUtils
+from common.http_session import get_http_session
 from common.logger import get_logger
 from deployer.config import (
     HAAS_BASE_URL,
@@ -20,7 +20,7 @@ from deployer.config import (
     REGION_NAME,
     DEPLOY_SERVICE_TOPIC_ARN,
 )
-from deployer.constant import PeriodType, OrderType
+from deployer.constant import PeriodType, OrderType, METRICS_FETCH_MAX_WORKERS
 from deployer.domain.schemas.haas_responses import GetCallEventsResponse
 
 logger = get_logger(__name__)
@@ -35,6 +35,8 @@ class HaaSClient:
     def __init__(self, boto_utils=None):
         self.auth = HTTPBasicAuth(HAAS_LOGIN, HAAS_PASSWORD)
         self._boto_utils = BotoUtils(REGION_NAME) if boto_utils is None else boto_utils
+        # Call event pages are fetched concurrently, so the pool has a connection per fetch worker
+        self._session = get_http_session("haas", pool_maxsize=METRICS_FETCH_MAX_WORKERS)
 
     # ========== DAEMON ==========
 
@@ -60,7 +62,9 @@ class HaaSClient:
         logger.debug(f"Deploying daemon url: {url}")
         logger.debug(f"Deploying daemon body: {request_data}")
         try:
-            result = requests.post(url, json=request_data, auth=self.auth)
+            result = self._session.post(
+                url, json=request_data, auth=self.auth, endpoint="deploy_daemon"
+            )
             if not result.ok:
                 raise HaaSClientError(result.text)
         except Exception as e:
@@ -71,7 +75,7 @@ class HaaSClient:
 
         logger.debug(f"Deleting daemon url: {url}")
         try:
-            result = requests.delete(url, auth=self.auth)
+            result = self._session.delete(url, auth=self.auth, endpoint="delete_daemon")
             if not result.ok:
                 raise HaaSClientError(result.text)
         except Exception as e:
@@ -83,7 +87,7 @@ class HaaSClient:
 
         logger.debug(f"Getting daemon logs url: {url}")
         try:
-            result = requests.get(url, auth=self.auth)
+            result = self._session.get(url, auth=self.auth, endpoint="get_daemon_logs")
             if result.ok:
                 return result.json()["data"]["logs"]
             else:
@@ -96,7 +100,7 @@ class HaaSClient:
 
         logger.debug(f"Getting public key url: {url}")
         try:
-            result = requests.get(url, auth=self.auth)
+            result = self._session.get(url, auth=self.auth, endpoint="get_public_key")
             if result.ok:
                 return result.json()["data"]["publicKey"]
             else:
@@ -111,7 +115,7 @@ class HaaSClient:
 
         logger.debug(f"Deleting hosted service url: {url}")
         try:
-            result = requests.delete(url, auth=self.auth)
+            result = self._session.delete(url, auth=self.auth, endpoint="delete_hosted_service")
             if not result.ok:
                 raise HaaSClientError(result.text)
         except Exception as e:
@@ -123,7 +127,7 @@ class HaaSClient:
 
         logger.debug(f"Getting hosted service logs url: {url}")
         try:
-            result = requests.get(url, auth=self.auth)
+            result = self._session.get(url, auth=self.auth, endpoint="get_hosted_service_logs")
             if result.ok:
                 return result.json()["data"]["logs"]
             else:
@@ -180,7 +184,9 @@ class HaaSClient:
         logger.debug(f"Getting call events url: {url}")
         logger.debug(f"Getting call events body: {request_body}")
         try:
-            response = requests.post(url, json=request_body, auth=self.auth)
+            response = self._session.post(
+                url, json=request_body, auth=self.auth, endpoint="get_call_events"
+            )
             if response.ok:
                 return GetCallEventsResponse(**response.json())
             else:
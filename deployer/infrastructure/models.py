@@ -223,3 +223,48 @@ class TokenRate(Base):
     updated_at: Mapped[datetime] = mapped_column(
         "updated_at", TIMESTAMP(timezone=False), nullable=False, server_default=UpdateTimestamp
     )
+
+
+class TokenRateSummary(Base):
+    __tablename__ = "token_rate_summary"
+    token_symbol: Mapped[str] = mapped_column("token_symbol", VARCHAR(128), primary_key=True)
+    cogs_per_usd: Mapped[int] = mapped_column("cogs_per_usd", DECIMAL(38, 0), nullable=False)
+    rate_updated_at: Mapped[datetime] = mapped_column(
+        "rate_updated_at", TIMESTAMP(timezone=False), nullable=False
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        "created_at", TIMESTAMP(timezone=False), nullable=False, server_default=CreateTimestamp
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        "updated_at", TIMESTAMP(timezone=False), nullable=False, server_default=UpdateTimestamp
+    )
+
+
+class CallEvent(Base):
+    __tablename__ = "call_event"
+    id: Mapped[int] = mapped_column("id", Integer, autoincrement=True, primary_key=True)
+    idempotency_key: Mapped[str] = mapped_column("idempotency_key", VARCHAR(128), nullable=False)
+    account_id: Mapped[str] = mapped_column(
+        "account_id",
+        VARCHAR(128),
+        ForeignKey("account_balance.account_id", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    org_id: Mapped[str] = mapped_column("org_id", VARCHAR(256), nullable=False)
+    service_id: Mapped[str] = mapped_column("service_id", VARCHAR(256), nullable=False)
+    duration: Mapped[int] = mapped_column("duration", Integer, nullable=False)
+    amount: Mapped[int] = mapped_column("amount", DECIMAL(38, 0), nullable=False)
+    event_timestamp: Mapped[datetime] = mapped_column(
+        "event_timestamp", TIMESTAMP(timezone=False), nullable=False
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        "created_at", TIMESTAMP(timezone=False), nullable=False, server_default=CreateTimestamp
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        "updated_at", TIMESTAMP(timezone=False), nullable=False, server_default=UpdateTimestamp
+    )
+
+    __table_args__ = (UniqueConstraint(idempotency_key, name="uq_idempotency_key"),)
@@ -0,0 +1,43 @@
+from typing import List, Set
+
+from sqlalchemy import select, insert
+from sqlalchemy.orm import Session
+
+from deployer.domain.models.call_event import NewCallEventDomain
+from deployer.infrastructure.models import CallEvent
+
+
+class CallEventRepository:
+    @staticmethod
+    def get_existing_idempotency_keys(session: Session, idempotency_keys: List[str]) -> Set[str]:
+        if not idempotency_keys:
+            return set()
+
+        query = select(CallEvent.idempotency_key).where(
+            CallEvent.idempotency_key.in_(idempotency_keys)
+        )
+
+        result = session.scalars(query).all()
+
+        return set(result)
+
+    @staticmethod
+    def add_call_events(session: Session, call_events: List[NewCallEventDomain]) -> None:
+        if not call_events:
+            return
+
+        session.execute(
+            insert(CallEvent),
+            [
+                {
+                    "idempotency_key": call_event.idempotency_key,
+                    "account_id": call_event.account_id,
+                    "org_id": call_event.org_id,
+                    "service_id": call_event.service_id,
+                    "duration": call_event.duration,
+                    "amount": call_event.amount,
+                    "event_timestamp": call_event.event_timestamp,
+                }
+                for call_event in call_events
+            ],
+        )
@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Dict, Tuple, Iterable
 
-from sqlalchemy import update, select, func
+from sqlalchemy import update, select, func, tuple_
 from sqlalchemy.orm import Session, joinedload
 
 from deployer.constant import OrderType, OrderByType
@@ -119,6 +119,24 @@ class DaemonRepository:
 
         return DaemonFactory.daemon_from_db_model(daemon_db)
 
+    @staticmethod
+    def get_hosted_service_accounts(
+        session: Session, services: Iterable[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], str]:
+        services = list(services)
+        if not services:
+            return {}
+
+        query = (
+            select(Daemon.org_id, Daemon.service_id, Daemon.account_id)
+            .join(HostedService, Daemon.id == HostedService.daemon_id)
+            .where(tuple_(Daemon.org_id, Daemon.service_id).in_(services))
+        )
+
+        result = session.execute(query).all()
+
+        return {(org_id, service_id): account_id for org_id, service_id, account_id in result}
+
     @staticmethod
     def get_all_daemon_ids(
         session: Session, status: Union[DaemonStatus, List[DaemonStatus], None] = None
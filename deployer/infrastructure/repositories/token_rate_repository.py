@@ -1,11 +1,11 @@
 from datetime import UTC, datetime, timedelta
-from typing import Optional
+from typing import Optional, List, Tuple
 
-from sqlalchemy import select, func, delete
+from sqlalchemy import select, func, delete, update
 from sqlalchemy.orm import Session
 
-from deployer.domain.models.token_rate import NewTokenRateDomain
-from deployer.infrastructure.models import TokenRate
+from deployer.domain.models.token_rate import NewTokenRateDomain, TokenRateSummaryDomain
+from deployer.infrastructure.models import TokenRate, TokenRateSummary
 
 
 class TokenRateRepository:
@@ -37,3 +37,63 @@ class TokenRateRepository:
         query = delete(TokenRate).where(TokenRate.created_at < minimal_datetime)
 
         session.execute(query)
+
+    @staticmethod
+    def get_cogs_per_usd_history(session: Session, token_symbol: str) -> List[Tuple[datetime, int]]:
+        query = (
+            select(TokenRate.created_at, TokenRate.cogs_per_usd)
+            .where(TokenRate.token_symbol == token_symbol)
+            .order_by(TokenRate.created_at.asc(), TokenRate.id.asc())
+        )
+
+        result = session.execute(query).all()
+
+        return [(created_at, int(cogs_per_usd)) for created_at, cogs_per_usd in result]
+
+    @staticmethod
+    def get_token_rate_summary(
+        session: Session, token_symbol: str
+    ) -> Optional[TokenRateSummaryDomain]:
+        query = select(TokenRateSummary).where(TokenRateSummary.token_symbol == token_symbol)
+
+        token_rate_summary_db = session.execute(query).scalar_one_or_none()
+        if token_rate_summary_db is None:
+            return None
+
+        return TokenRateSummaryDomain(
+            token_symbol=token_rate_summary_db.token_symbol,
+            cogs_per_usd=int(token_rate_summary_db.cogs_per_usd),
+            rate_updated_at=token_rate_summary_db.rate_updated_at,
+        )
+
+    @staticmethod
+    def upsert_token_rate_summary(
+        session: Session, token_rate_summary: TokenRateSummaryDomain
+    ) -> None:
+        query = (
+            select(TokenRateSummary)
+            .where(TokenRateSummary.token_symbol == token_rate_summary.token_symbol)
+            .limit(1)
+        )
+
+        token_rate_summary_db = session.execute(query).scalar_one_or_none()
+
+        if token_rate_summary_db is not None:
+            query = (
+                update(TokenRateSummary)
+                .where(TokenRateSummary.token_symbol == token_rate_summary.token_symbol)
+                .values(
+                    cogs_per_usd=token_rate_summary.cogs_per_usd,
+                    rate_updated_at=token_rate_summary.rate_updated_at,
+                )
+            )
+
+            session.execute(query)
+        else:
+            session.add(
+                TokenRateSummary(
+                    token_symbol=token_rate_summary.token_symbol,
+                    cogs_per_usd=token_rate_summary.cogs_per_usd,
+                    rate_updated_at=token_rate_summary.rate_updated_at,
+                )
+            )
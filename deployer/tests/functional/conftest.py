@@ -36,7 +36,12 @@ def test_auth_service(test_session_factory, test_registry_client):
 
 @pytest.fixture(scope="function")
 def test_billing_service(test_session_factory, test_haas_client, test_crypto_exchange_client):
-    return BillingService(test_session_factory, test_haas_client, test_crypto_exchange_client)
+    return BillingService(
+        test_session_factory,
+        test_haas_client,
+        test_crypto_exchange_client,
+        service_account_cache={},
+    )
 
 
 @pytest.fixture(scope="function")
@@ -93,6 +98,40 @@ def test_haas_client_with_events(test_haas_client, test_org_id, test_service_id)
     return test_haas_client
 
 
+@pytest.fixture(scope="function")
+def test_haas_client_with_paged_events(test_haas_client, test_org_id, test_service_id):
+    """
+    HaaS client serving 350 events 7 minutes apart in pages of the requested limit,
+    so the hourly time groups span the page boundaries.
+    """
+    start_time = datetime.datetime(2026, 10, 1, 0, 3, tzinfo=datetime.UTC)
+    test_haas_client.call_events = GetCallEventsResponse(
+        events=[
+            CallEventResponse(
+                orgId=test_org_id,
+                serviceId=test_service_id,
+                duration=10 + i % 17,
+                amount=100 + i % 23,
+                timestamp=start_time + timedelta(minutes=7 * i),
+            )
+            for i in range(350)
+        ],
+        totalCount=350,
+    )
+    test_haas_client.requested_pages = []
+
+    def get_call_events(services, limit, page, order, period):
+        test_haas_client.requested_pages.append(page)
+        events = test_haas_client.call_events.events
+        return GetCallEventsResponse(
+            events=events[(page - 1) * limit : page * limit], totalCount=len(events)
+        )
+
+    test_haas_client.get_call_events = get_call_events
+
+    return test_haas_client
+
+
 @pytest.fixture(scope="function")
 def add_test_orders(test_session_factory, add_test_account_balance, test_account_id):
     total_count = 3
@@ -1,7 +1,8 @@
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
+from unittest.mock import MagicMock
 
 import deepdiff
-import pytest
 
 from common.logger import get_logger
 from deployer.application.handlers.billing_handlers import (
@@ -17,8 +18,9 @@ from deployer.application.handlers.billing_handlers import (
 )
 from deployer.application.services.billing_service import BillingService
 from deployer.application.services.metrics_service import MetricsService
-from deployer.config import TOKEN_DECIMALS, TOKEN_NAME
-from deployer.exceptions import HostedServiceNotFoundException
+from deployer.config import TOKEN_DECIMALS, TOKEN_NAME, REQUEST_MAX_LIMIT
+from deployer.constant import FREQUENCY_BY_PERIOD, PeriodType, TokenRateAveragingMode
+from deployer.domain.models.token_rate import NewTokenRateDomain, TokenRateSummaryDomain
 from deployer.infrastructure.db import session_scope
 from deployer.infrastructure.models import OrderStatus, EVMTransactionStatus
 from deployer.infrastructure.repositories.account_balance_repository import AccountBalanceRepository
@@ -38,6 +40,8 @@ from deployer.tests.functional.utils import (
 
 logger = get_logger(__name__)
 
+BILLING_SERVICE = "deployer.application.services.billing_service"
+
 
 class TestCreateOrder:
     def test_create_order_ok(self, test_billing_service, test_session_factory):
@@ -321,6 +325,40 @@ class TestGetMetrics:
         assert data["summary"]["requests"]["total"] in [20, 21]
         assert all(len(value) in [20, 21] for value in data["values"].values())
 
+    def test_get_metrics_pages_ok(
+        self,
+        test_auth_service,
+        test_haas_client_with_paged_events,
+        test_session_factory,
+        add_test_daemon_and_service,
+        test_hosted_service_id,
+    ):
+        metrics_service = MetricsService(
+            session_factory=test_session_factory, haas_client=test_haas_client_with_paged_events
+        )
+        events = test_haas_client_with_paged_events.call_events.events
+        frequency = FREQUENCY_BY_PERIOD[PeriodType.DAY]
+        # An hourly group with events on both sides of the first page boundary
+        boundary_events = events[REQUEST_MAX_LIMIT - 1 : REQUEST_MAX_LIMIT + 1]
+        assert boundary_events[0].timestamp.hour == boundary_events[1].timestamp.hour
+
+        event = generate_request_event(
+            path_parameters={"hostedServiceId": test_hosted_service_id},
+            query_parameters={"period": "day"},
+        )
+
+        response = get_metrics(event, None, metrics_service, test_auth_service)
+        _, data = validate_response_ok(response)
+
+        single_page_aggregates = metrics_service._fold_events_page(None, events, frequency)
+        expected = metrics_service._prepare_aggregated_metrics(single_page_aggregates, frequency)
+        expected["summary"] = metrics_service._prepare_metrics_summary(single_page_aggregates)
+
+        assert sorted(test_haas_client_with_paged_events.requested_pages) == [1, 2, 3, 4]
+        assert deepdiff.DeepDiff(expected, data) == {}
+        assert data["summary"]["requests"]["total"] == len(events)
+        assert sum(data["values"]["requestsCount"]) == len(events)
+
     def test_get_metrics_empty_ok(
         self,
         test_metrics_service,
@@ -482,6 +520,40 @@ class TestCallEventConsumer:
 
         assert account_balance.balance_in_cogs == balance - amount
 
+    def test_call_event_consumer_batch(
+        self,
+        test_billing_service,
+        test_session_factory,
+        add_test_account_balance,
+        add_test_daemon_and_service,
+        test_org_id,
+        test_service_id,
+        test_account_id,
+    ):
+        balance = add_test_account_balance
+        events = [
+            generate_request_event(
+                orgId=test_org_id,
+                serviceId=test_service_id,
+                duration=10,
+                amount=amount,
+                timestamp="2025-10-16T18:08:42.782000",
+            )
+            for amount in (10, 20)
+        ]
+        queue_event = create_common_queue_event(events)
+
+        response = call_event_consumer(queue_event, None, test_billing_service)
+        # Redelivered messages are already in the ledger and must not be charged again
+        redelivery_response = call_event_consumer(queue_event, None, test_billing_service)
+
+        with session_scope(test_session_factory) as session:
+            account_balance = AccountBalanceRepository.get_account_balance(session, test_account_id)
+
+        assert response == {"batchItemFailures": []}
+        assert redelivery_response == {"batchItemFailures": []}
+        assert account_balance.balance_in_cogs == balance - 30
+
     def test_call_event_consumer_no_service(
         self,
         test_billing_service,
@@ -501,14 +573,9 @@ class TestCallEventConsumer:
         )
         queue_event = create_common_queue_event([event])
 
-        with pytest.raises(HostedServiceNotFoundException) as e:
-            call_event_consumer(queue_event, None, test_billing_service)
+        response = call_event_consumer(queue_event, None, test_billing_service)
 
-        assert e.type == HostedServiceNotFoundException
-        assert (
-            f"Hosted service for service with org_id={test_org_id} and service_id={test_service_id} not found!"
-            in str(e.value)
-        )
+        assert response == {"batchItemFailures": [{"itemIdentifier": "0"}]}
 
 
 class TestUpdateTokenRate:
@@ -523,8 +590,104 @@ class TestUpdateTokenRate:
 
         with session_scope(test_session_factory) as session:
             token_rate = TokenRateRepository.get_average_cogs_per_usd(session, TOKEN_NAME)
+            token_rate_summary = TokenRateRepository.get_token_rate_summary(
+                session, TOKEN_NAME.lower()
+            )
 
         new_cogs_per_usd = round(
             Decimal(add_token_rate_records * 10 + test_cogs_per_usd) / Decimal(11)
         )
         assert token_rate == new_cogs_per_usd
+        assert token_rate_summary.cogs_per_usd == new_cogs_per_usd
+
+    def test_get_balance_and_rate_reads_summary(
+        self, test_billing_service, add_token_rate_records, test_org_id, test_service_id
+    ):
+        test_billing_service._crypto_exchange_client.token_rate = 0.5
+        update_token_rate(None, None, billing_service=test_billing_service)
+
+        # Rates added after the update are only taken into account by the next one
+        with session_scope(test_billing_service.session_factory) as session:
+            expected_cogs_per_usd = TokenRateRepository.get_token_rate_summary(
+                session, TOKEN_NAME.lower()
+            ).cogs_per_usd
+            TokenRateRepository.add_token_rate(
+                session,
+                NewTokenRateDomain(
+                    token_symbol=TOKEN_NAME,
+                    usd_per_token=0.01,
+                    cogs_per_usd=10**TOKEN_DECIMALS * 100,
+                ),
+            )
+
+        event = generate_request_event(
+            query_parameters={"orgId": test_org_id, "serviceId": test_service_id}
+        )
+        response = get_balance_and_rate(event, None, test_billing_service)
+        _, data = validate_response_ok(response)
+
+        assert data["cogsPerUsd"] == expected_cogs_per_usd
+
+
+class TestTokenRateAveraging:
+    start_time = datetime(2026, 10, 1, tzinfo=UTC)
+
+    def test_ema_decays_with_elapsed_time(self, monkeypatch):
+        monkeypatch.setattr(
+            f"{BILLING_SERVICE}.TOKEN_RATE_AVERAGING_MODE", TokenRateAveragingMode.EMA
+        )
+        monkeypatch.setattr(f"{BILLING_SERVICE}.TOKEN_RATE_EMA_HALF_LIFE_IN_HOURS", 6)
+        get_token_rate_summary = MagicMock(
+            return_value=TokenRateSummaryDomain(
+                token_symbol="fet", cogs_per_usd=1000, rate_updated_at=self.start_time
+            )
+        )
+        monkeypatch.setattr(TokenRateRepository, "get_token_rate_summary", get_token_rate_summary)
+
+        # One half-life moves the average half way to the new rate, two half-lives three quarters
+        assert BillingService._get_average_cogs_per_usd(
+            None, "fet", 2000, self.start_time + timedelta(hours=6)
+        ) == 1500
+        assert BillingService._get_average_cogs_per_usd(
+            None, "fet", 2000, self.start_time + timedelta(hours=12)
+        ) == 1750
+        assert BillingService._get_average_cogs_per_usd(None, "fet", 2000, self.start_time) == 1000
+
+    def test_ema_first_run_falls_back_to_simple_average(self, monkeypatch):
+        monkeypatch.setattr(
+            f"{BILLING_SERVICE}.TOKEN_RATE_AVERAGING_MODE", TokenRateAveragingMode.EMA
+        )
+        monkeypatch.setattr(
+            TokenRateRepository, "get_token_rate_summary", MagicMock(return_value=None)
+        )
+        monkeypatch.setattr(
+            TokenRateRepository, "get_average_cogs_per_usd", MagicMock(return_value=1234)
+        )
+
+        assert BillingService._get_average_cogs_per_usd(None, "fet", 2000, self.start_time) == 1234
+
+    def test_time_weighted_average_weights_rates_by_interval(self, monkeypatch):
+        monkeypatch.setattr(
+            f"{BILLING_SERVICE}.TOKEN_RATE_AVERAGING_MODE", TokenRateAveragingMode.TIME_WEIGHTED
+        )
+        # Three hourly updates and a three hour gap, the simple average would be 175
+        history = [
+            (self.start_time, 100),
+            (self.start_time + timedelta(hours=1), 100),
+            (self.start_time + timedelta(hours=2), 100),
+            (self.start_time + timedelta(hours=5), 400),
+        ]
+        monkeypatch.setattr(
+            TokenRateRepository, "get_cogs_per_usd_history", MagicMock(return_value=history)
+        )
+
+        assert BillingService._get_average_cogs_per_usd(None, "fet", 400, self.start_time) == 190
+
+    def test_time_weighted_average_of_single_timestamp(self):
+        assert BillingService._get_time_weighted_average([(self.start_time, 100)]) == 100
+        assert (
+            BillingService._get_time_weighted_average(
+                [(self.start_time, 100), (self.start_time, 200)]
+            )
+            == 150
+        )
@@ -184,6 +184,7 @@ def add_daemon(
 def create_common_queue_event(events: list) -> dict:
     return {
         "Records": [
-            {"body": json.dumps({"Message": json.dumps(event_data)})} for event_data in events
+            {"messageId": str(message_id), "body": json.dumps({"Message": json.dumps(event_data)})}
+            for message_id, event_data in enumerate(events)
         ]
     }
@@ -1,7 +1,12 @@
+import ast
 import json
 
+from web3 import Web3
+
 from common.logger import get_logger
+from common.sqs_batch import process_sqs_batch
 from registry.config import NETWORKS, NETWORK_ID
+from registry.constants import REGISTRY_EVENT_TIME_MARGIN_MS
 from registry.consumer.organization_event_consumer import (
     OrganizationCreatedAndModifiedEventConsumer,
     OrganizationDeletedEventConsumer,
@@ -23,27 +28,42 @@ org_repository = OrganizationPublisherRepository()
 service_repository = ServicePublisherRepository()
 
 
-def get_registry_event_consumer(event):
-    if event["name"] in ["OrganizationCreated", "OrganizationModified"]:
-        return OrganizationCreatedAndModifiedEventConsumer(
-            ws_provider=NETWORKS[NETWORK_ID]["ws_provider"], organization_repository=org_repository
-        )
-    elif event["name"] in ["ServiceCreated", "ServiceMetadataModified"]:
-        return ServiceCreatedEventConsumer(
-            ws_provider=NETWORKS[NETWORK_ID]["ws_provider"],
-            service_repository=service_repository,
-            organization_repository=org_repository,
-        )
-    elif event["name"] == "OrganizationDeleted":
-        return OrganizationDeletedEventConsumer(
+def get_registry_event_consumer_class(event_name: str):
+    if event_name in ["OrganizationCreated", "OrganizationModified"]:
+        return OrganizationCreatedAndModifiedEventConsumer
+    elif event_name in ["ServiceCreated", "ServiceMetadataModified"]:
+        return ServiceCreatedEventConsumer
+    elif event_name == "OrganizationDeleted":
+        return OrganizationDeletedEventConsumer
+    elif event_name == "ServiceDeleted":
+        return ServiceDeletedEventConsumer
+    return None
+
+
+def get_registry_event_consumer(event, consumers: dict | None = None):
+    """
+    Returns the consumer of the event. When consumers is given, the consumer built
+    for an event class is kept there and reused for the rest of the batch.
+    """
+    consumer_class = get_registry_event_consumer_class(event["name"])
+    if consumer_class is None:
+        return None
+    if consumers is not None and consumer_class in consumers:
+        return consumers[consumer_class]
+
+    if consumer_class in [OrganizationCreatedAndModifiedEventConsumer, OrganizationDeletedEventConsumer]:
+        consumer = consumer_class(
             ws_provider=NETWORKS[NETWORK_ID]["ws_provider"], organization_repository=org_repository
         )
-    elif event["name"] == "ServiceDeleted":
-        return ServiceDeletedEventConsumer(
+    else:
+        consumer = consumer_class(
             ws_provider=NETWORKS[NETWORK_ID]["ws_provider"],
             service_repository=service_repository,
             organization_repository=org_repository,
         )
+    if consumers is not None:
+        consumers[consumer_class] = consumer
+    return consumer
 
 
 def get_payload_from_queue_event(event) -> list[dict]:
@@ -62,15 +82,41 @@ def get_payload_from_queue_event(event) -> list[dict]:
     return converted_events
 
 
+def get_entity_key_from_event(event) -> tuple | None:
+    # Unhandled events must not supersede a handled event of the same entity
+    if get_registry_event_consumer_class(event["name"]) is None:
+        return None
+    event_data = ast.literal_eval(event["data"]["json_str"])
+    org_id = Web3.to_text(event_data["orgId"]).rstrip("\x00")
+    service_id = None
+    if "serviceId" in event_data:
+        service_id = Web3.to_text(event_data["serviceId"]).rstrip("\x00")
+    return org_id, service_id
+
+
 def registry_event_consumer_handler(event, context):
     logger.info(f"Got Registry event {event}")
-    events = get_payload_from_queue_event(event)
+    consumers = {}
 
-    for e in events:
-        consumer = get_registry_event_consumer(e)
+    def parse_record(record: dict) -> dict | None:
+        events = get_payload_from_queue_event({"Records": [record]})
+        return events[0] if events else None
+
+    def process(registry_event: dict) -> None:
+        consumer = get_registry_event_consumer(registry_event, consumers)
         if consumer is None:
-            logger.info(f"Unhandled Registry event: {e}")
-            continue
-        logger.info(f"Processing Registry event: {e}")
-        consumer.on_event(e)
-    return {}
+            logger.info(f"Unhandled Registry event: {registry_event}")
+            return
+        logger.info(f"Processing Registry event: {registry_event}")
+        try:
+            consumer.on_event(registry_event)
+        except Exception:
+            service_repository.session.rollback()
+            raise
+
+    get_remaining_time = getattr(context, "get_remaining_time_in_millis", None)
+
+    def should_stop() -> bool:
+        return get_remaining_time is not None and get_remaining_time() < REGISTRY_EVENT_TIME_MARGIN_MS
+
+    return process_sqs_batch(event, parse_record, get_entity_key_from_event, process, should_stop)
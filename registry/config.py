@@ -30,6 +30,15 @@ IPFS_URL = {
     "port": "80",
 }
 
+# Content addressed cache of storage provider files: in-process LRU of max_bytes,
+# optionally backed by a local directory and/or an S3 bucket shared by all services
+METADATA_CACHE = {
+    "max_bytes": 32 * 1024 * 1024,
+    "directory": "",
+    "s3_bucket": "",
+    "s3_prefix": "metadata-cache/",
+}
+
 EMAILS = {
     "PUBLISHER_PORTAL_SUPPORT_MAIL": "",
     "ORG_APPROVERS_DLIST": "",
@@ -21,6 +21,10 @@ TEST_COMMON_CNTRCT_PATH = os.path.abspath(
 TEST_REG_CNTRCT_PATH = os.path.join(TEST_COMMON_CNTRCT_PATH, "abi", REGISTRY_FILE_NAME)
 TEST_REG_ADDR_PATH = os.path.join(TEST_COMMON_CNTRCT_PATH, "networks", REGISTRY_FILE_NAME)
 
+# Publishing a service can take tens of seconds, so the registry event consumer stops taking
+# messages this long before its timeout and hands the rest back to SQS
+REGISTRY_EVENT_TIME_MARGIN_MS = 60000
+
 
 class OrganizationStatus(Enum):
     ONBOARDING = "ONBOARDING"
@@ -1,2 +1,3 @@
 SRVC_STATUS_GRPC_TIMEOUT = 10
-LIMIT = 10
\ No newline at end of file
+LIMIT = 300
+MAX_CONCURRENT_PROBES = 100
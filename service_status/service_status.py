@@ -1,24 +1,60 @@
 import json
 import re
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from opensearchpy import OpenSearch
-import grpc
 from grpc_health.v1 import health_pb2 as heartb_pb2
 from grpc_health.v1 import health_pb2_grpc as heartb_pb2_grpc
 
 from common.boto_utils import BotoUtils
+from common.grpc_channel_pool import get_daemon_channel_pool
 from common.logger import get_logger
 from common.utils import Utils
-from resources.certificates.root_certificate import certificate
 from service_status.config import REGION_NAME, NOTIFICATION_ARN, NETWORKS, NETWORK_ID, HOST, AUTH, \
     MAXIMUM_INTERVAL_IN_HOUR, MINIMUM_INTERVAL_IN_HOUR, NETWORK_NAME, BASE_URL_TO_RESET_SERVICE_HEALTH
-from service_status.constant import SRVC_STATUS_GRPC_TIMEOUT, LIMIT
+from service_status.constant import SRVC_STATUS_GRPC_TIMEOUT, LIMIT, MAX_CONCURRENT_PROBES
 
 logger = get_logger(__name__)
 boto_util = BotoUtils(region_name=REGION_NAME)
 util = Utils()
 
+_opensearch_client = None
+_created_opensearch_indices = set()
+
+
+def get_opensearch_client():
+    """
+    Returns an OpenSearch client shared by all invocations of a warm container.
+    """
+    global _opensearch_client
+    if _opensearch_client is None:
+        _opensearch_client = OpenSearch(
+            http_compress=True,
+            hosts=[{'host': HOST, 'port': 443}],
+            http_auth=AUTH,
+            use_ssl=True,
+            verify_certs=True,
+            ssl_assert_hostname=False,
+            ssl_show_warn=False,
+        )
+    return _opensearch_client
+
+
+def ensure_opensearch_index(client, index_name):
+    if index_name in _created_opensearch_indices:
+        return
+    if not client.indices.exists(index_name):
+        index_body = {
+            'settings': {
+                'index': {
+                    'number_of_shards': 1
+                }
+            }
+        }
+        client.indices.create(index_name, body=index_body)
+    _created_opensearch_indices.add(index_name)
+
 
 class ServiceStatus:
     def __init__(self, repo, net_id):
@@ -27,15 +63,11 @@ class ServiceStatus:
         self.rex_for_pb_ip = "^(http://)*(https://)*127.0.0.1|^(http://)*(https://)*localhost|^(http://)*(https://)*192.|^(http://)*(https://)*172.|^(http://)*(https://)*10."
         self.obj_util = Utils()
         self.net_id = net_id
+        self.opensearch_documents = []
 
     def _get_service_status(self, url, secure=True):
         try:
-            if secure:
-                channel = grpc.secure_channel(
-                    url, grpc.ssl_channel_credentials(root_certificates=certificate))
-            else:
-                channel = grpc.insecure_channel(url)
-
+            channel = get_daemon_channel_pool().get_channel(url, secure)
             stub = heartb_pb2_grpc.HealthStub(channel)
             response = stub.Check(heartb_pb2.HealthCheckRequest(
                 service=""), timeout=SRVC_STATUS_GRPC_TIMEOUT)
@@ -46,17 +78,44 @@ class ServiceStatus:
         except Exception as e:
             logger.info(f"error in making grpc call::url: {url}, |error: {e}")
             logger.info(f"error : {e.args}")
-            return 0, e.args[0].details, e.args[0].debug_error_string
+            if e.args and hasattr(e.args[0], "details"):
+                return 0, e.args[0].details, e.args[0].debug_error_string
+            return 0, repr(e), repr(e)
 
-    def _ping_url(self, url):
+    def _get_probe_target(self, url):
         search_count = re.subn(self.rex_for_pb_ip, "", url)[1]
-        if search_count == 0:
-            secure = True
-            if url[:4].lower() == "http" and url[:5].lower() != "https":
-                secure = False
-            url = self.obj_util.remove_http_https_prefix(url=url)
-            return self._get_service_status(url=url, secure=secure)
-        return 0, "", ""
+        if search_count != 0:
+            return None
+        secure = True
+        if url[:4].lower() == "http" and url[:5].lower() != "https":
+            secure = False
+        return self.obj_util.remove_http_https_prefix(url=url).rstrip("/").lower(), secure
+
+    def _ping_url(self, url):
+        target = self._get_probe_target(url)
+        if target is None:
+            return 0, "", ""
+        return self._get_service_status(url=target[0], secure=target[1])
+
+    def _probe_endpoints(self, endpoints):
+        """
+        Checks the given endpoints concurrently. Endpoints pointing to the same host are probed only once.
+        Returns a dict of endpoint -> (status, error_details, debug_error_string).
+        """
+        targets = {endpoint: self._get_probe_target(endpoint) for endpoint in set(endpoints)}
+        unique_targets = list({target for target in targets.values() if target is not None})
+        target_results = {}
+        if unique_targets:
+            max_workers = min(MAX_CONCURRENT_PROBES, len(unique_targets))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                statuses = executor.map(lambda target: self._get_service_status(url=target[0], secure=target[1]),
+                                        unique_targets)
+                target_results = dict(zip(unique_targets, statuses))
+        logger.info(f"Probed {len(unique_targets)} unique targets for {len(targets)} endpoints")
+        return {
+            endpoint: target_results[target] if target is not None else (0, "", "")
+            for endpoint, target in targets.items()
+        }
 
     def _get_service_endpoint_data(self):
         query = "SELECT row_id, org_id, service_id, endpoint, is_available, failed_status_count FROM service_endpoint WHERE " \
@@ -67,101 +126,164 @@ class ServiceStatus:
             logger.info("Unable to find services.")
         return result
 
-    def _update_service_status_parameters(self, status, next_check_timestamp, failed_status_count, row_id):
-        update_query = "UPDATE service_endpoint SET is_available = %s, last_check_timestamp = current_timestamp, " \
-                       "next_check_timestamp = %s, failed_status_count = %s WHERE row_id = %s "
-        response = self.repo.execute(update_query, [status, next_check_timestamp, failed_status_count, row_id])
-        return response
-    
-    def _update_service_failed_status_count(self, failed_status_count, row_id):
-        update_query = "UPDATE service_endpoint SET failed_status_count = %s WHERE row_id = %s "
-        response = self.repo.execute(update_query, [failed_status_count, row_id])
+    def _update_service_status_parameters(self, status_updates):
+        """
+        Applies all (row_id, status, next_check_timestamp, failed_status_count) updates with one multi-row UPDATE.
+        """
+        row_ids = [row_id for row_id, _, _, _ in status_updates]
+        case_clause = " ".join(["WHEN %s THEN %s"] * len(status_updates))
+        update_query = f"UPDATE service_endpoint SET " \
+                       f"is_available = CASE row_id {case_clause} END, " \
+                       f"next_check_timestamp = CASE row_id {case_clause} END, " \
+                       f"failed_status_count = CASE row_id {case_clause} END, " \
+                       f"last_check_timestamp = current_timestamp " \
+                       f"WHERE row_id IN ({', '.join(['%s'] * len(row_ids))})"
+        params = []
+        for value_index in (1, 2, 3):
+            for status_update in status_updates:
+                params.extend([status_update[0], status_update[value_index]])
+        params.extend(row_ids)
+        response = self.repo.execute(update_query, params)
         return response
 
-    def _send_logs_to_opensearch(self, service_id, debug_error_string, org_id, endpoint):
-        client = OpenSearch(
-            http_compress = True,
-            hosts = [{'host': HOST, 'port': 443}],
-            http_auth = AUTH,
-            use_ssl = True,
-            verify_certs = True,
-            ssl_assert_hostname = False,
-            ssl_show_warn = False,
-        )
-        timestamp = dt.datetime.now(dt.UTC)
-        index_name = f"services-logs-{NETWORKS[NETWORK_ID]['name']}-{timestamp.strftime('%Y.%m.%d')}"
-        if not client.indices.exists(index_name):
-            index_body = {
-                'settings': {
-                    'index': {
-                        'number_of_shards': 1
-                    }
-                }
-            }
-            response = client.indices.create(index_name, body=index_body)
-        document = {
-            '@timestamp': timestamp,
+    def _buffer_log_for_opensearch(self, service_id, debug_error_string, org_id, endpoint):
+        self.opensearch_documents.append({
+            '@timestamp': dt.datetime.now(dt.UTC),
             'Log': debug_error_string,
             'Service': service_id,
             'Organization': org_id,
             'Endpoint': endpoint
-        }
-        response = client.index(
-            index = index_name,
-            body = document,
-            refresh = True
-        )    
-        return response
+        })
 
-    def _update_service_status_stats(self, org_id, service_id, old_status, status):
-        previous_state = "UP" if (old_status == 1) else "DOWN"
-        current_state = "UP" if (status == 1) else "DOWN"
+    def _send_logs_to_opensearch(self):
+        """
+        Sends all buffered failure logs with a single bulk request.
+        """
+        if not self.opensearch_documents:
+            return None
+        client = get_opensearch_client()
+        index_name = f"services-logs-{NETWORKS[NETWORK_ID]['name']}-{dt.datetime.now(dt.UTC).strftime('%Y.%m.%d')}"
+        try:
+            ensure_opensearch_index(client, index_name)
+            bulk_body = []
+            for document in self.opensearch_documents:
+                bulk_body.append({"index": {"_index": index_name}})
+                bulk_body.append(document)
+            response = client.bulk(body=bulk_body)
+            if response.get("errors"):
+                logger.info(f"Some logs were not indexed in opensearch, index: {index_name}")
+        except Exception as e:
+            logger.info(f"error in sending logs to opensearch, |error: {e}")
+            return None
+        self.opensearch_documents = []
+        return response
 
+    def _update_service_status_stats(self, status_changes):
+        """
+        Inserts one service_status_stats row per (org_id, service_id, old_status, status) change.
+        """
+        current_time = dt.datetime.now(dt.UTC)
+        params = []
+        for org_id, service_id, old_status, status in status_changes:
+            previous_state = "UP" if (old_status == 1) else "DOWN"
+            current_state = "UP" if (status == 1) else "DOWN"
+            params.extend([org_id, service_id, previous_state, current_state, current_time, current_time])
         try:
             insert_query = "insert into service_status_stats " \
                            "(org_id, service_id, previous_state, current_state, row_created, row_updated) " \
-                           "values (%s, %s, %s, %s, %s, %s)"
-            self.repo.execute(insert_query, [org_id, service_id, previous_state, current_state,
-                                             dt.datetime.now(dt.UTC), dt.datetime.now(dt.UTC)])
+                           f"values {', '.join(['(%s, %s, %s, %s, %s, %s)'] * len(status_changes))}"
+            self.repo.execute(insert_query, params)
         except Exception as e:
             logger.info(f"error in inserting service status stats, |error: {e}")
-        return
+
+    def _update_service_catalog_availability(self, status_changes):
+        """
+        Recomputes is_available of the contract_api service_catalog rows whose endpoints changed state.
+        """
+        services = list({(org_id, service_id) for org_id, service_id, _, _ in status_changes})
+        update_query = "UPDATE service_catalog SET is_available = (" \
+                       "SELECT COALESCE(MAX(se.is_available), FALSE) FROM service_endpoint se " \
+                       "WHERE se.service_row_id = service_catalog.service_row_id) " \
+                       f"WHERE (org_id, service_id) IN ({', '.join(['(%s, %s)'] * len(services))})"
+        params = [value for service in services for value in service]
+        try:
+            self.repo.execute(update_query, params)
+        except Exception as e:
+            logger.info(f"error in updating service catalog availability, |error: {e}")
+
+    def _flush_service_status_results(self, status_updates, status_changes):
+        """
+        Writes back the accumulated health check results in a single transaction.
+        The stats and the service catalog availability are best-effort and written after the commit,
+        so a failure there does not discard the status updates of the whole cycle.
+        """
+        if not status_updates:
+            return 0
+        self.repo.auto_commit = False
+        try:
+            self.repo.begin_transaction()
+            query_data = self._update_service_status_parameters(status_updates)
+            self.repo.commit_transaction()
+        except Exception as e:
+            self.repo.rollback_transaction()
+            logger.info(f"error in updating service status, |error: {e}")
+            raise e
+        finally:
+            self.repo.auto_commit = True
+        if status_changes:
+            self._update_service_status_stats(status_changes)
+            self._update_service_catalog_availability(status_changes)
+        return query_data[0]
 
     def update_service_status(self):
         service_endpoint_data = self._get_service_endpoint_data()
-        rows_updated = 0
         logger.info(f"number of rows to update: {len(service_endpoint_data)}")
+        probe_results = self._probe_endpoints([record["endpoint"] for record in service_endpoint_data])
+        status_updates = []
+        status_changes = []
+        failed_records = []
         for record in service_endpoint_data:
-            status, error_details, debug_error_string = self._ping_url(record["endpoint"])
-            logger.info(f"error_details: {error_details}")
-            logger.info(f"debug_error_string: {debug_error_string}")
-            old_status = record["is_available"]
-            logger.info(f"Service to check: row_id={record['row_id']}, status={status}, old_status={old_status}")
-            logger.info(f"Service endpoint: {record['endpoint']}")
-            failed_status_count = self._calculate_failed_status_count(
-                current_status=status, old_status=old_status,
-                old_failed_status_count=record["failed_status_count"])
-            next_check_timestamp = self._calculate_next_check_timestamp(failed_status_count=failed_status_count)
-            query_data = self._update_service_status_parameters(status=status,
-                                                                next_check_timestamp=next_check_timestamp,
-                                                                failed_status_count=failed_status_count,
-                                                                row_id=record["row_id"])
-            if old_status != status:
-                self._update_service_status_stats(record["org_id"], record["service_id"], old_status, status)
-                if status == 1:
-                    query_data = self._update_service_failed_status_count(failed_status_count=0, row_id=record["row_id"])
-
+            status, error_details, debug_error_string = probe_results[record["endpoint"]]
+            status_update, status_change = self._process_probe_result(record, status, error_details,
+                                                                      debug_error_string)
+            status_updates.append(status_update)
+            if status_change is not None:
+                status_changes.append(status_change)
             if status == 0:
-                org_id = record["org_id"]
-                service_id = record["service_id"]
-                recipients = self._get_service_provider_email(org_id=org_id, service_id=service_id)
-                self._send_logs_to_opensearch(service_id=service_id, debug_error_string=debug_error_string, org_id=org_id, endpoint=record["endpoint"])
-                if failed_status_count <= 10:
-                    self._send_notification(org_id=org_id, service_id=service_id, recipients=recipients,
-                                            endpoint=record["endpoint"], error_details=error_details,
-                                            debug_error_string=debug_error_string)
-            rows_updated = rows_updated + query_data[0]
+                failed_records.append((record, status_update[3], error_details, debug_error_string))
+        rows_updated = self._flush_service_status_results(status_updates, status_changes)
         logger.info(f"no of rows updated: {rows_updated}")
+        for record, failed_status_count, error_details, debug_error_string in failed_records:
+            self._report_failed_service(record, failed_status_count, error_details, debug_error_string)
+        self._send_logs_to_opensearch()
+
+    def _process_probe_result(self, record, status, error_details, debug_error_string):
+        logger.info(f"error_details: {error_details}")
+        logger.info(f"debug_error_string: {debug_error_string}")
+        old_status = record["is_available"]
+        logger.info(f"Service to check: row_id={record['row_id']}, status={status}, old_status={old_status}")
+        logger.info(f"Service endpoint: {record['endpoint']}")
+        failed_status_count = self._calculate_failed_status_count(
+            current_status=status, old_status=old_status,
+            old_failed_status_count=record["failed_status_count"])
+        next_check_timestamp = self._calculate_next_check_timestamp(failed_status_count=failed_status_count)
+        status_change = None
+        if old_status != status:
+            status_change = (record["org_id"], record["service_id"], old_status, status)
+            if status == 1:
+                failed_status_count = 0
+        return (record["row_id"], status, next_check_timestamp, failed_status_count), status_change
+
+    def _report_failed_service(self, record, failed_status_count, error_details, debug_error_string):
+        org_id = record["org_id"]
+        service_id = record["service_id"]
+        recipients = self._get_service_provider_email(org_id=org_id, service_id=service_id)
+        self._buffer_log_for_opensearch(service_id=service_id, debug_error_string=debug_error_string,
+                                        org_id=org_id, endpoint=record["endpoint"])
+        if failed_status_count <= 10:
+            self._send_notification(org_id=org_id, service_id=service_id, recipients=recipients,
+                                    endpoint=record["endpoint"], error_details=error_details,
+                                    debug_error_string=debug_error_string)
 
     def _calculate_failed_status_count(self, current_status, old_status, old_failed_status_count):
         if current_status == old_status == 0:
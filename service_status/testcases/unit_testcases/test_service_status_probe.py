@@ -0,0 +1,106 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from service_status.service_status import ServiceStatus
+
+
+class TestServiceStatusProbe(TestCase):
+    def setUp(self):
+        self.service_status = ServiceStatus(repo=MagicMock(), net_id=0)
+
+    @patch("service_status.service_status.ServiceStatus._get_service_status")
+    def test_probe_endpoints_deduplicates_hosts(self, mock_get_service_status):
+        mock_get_service_status.return_value = (1, "", "")
+        endpoints = [
+            "https://example.com:7000",
+            "https://EXAMPLE.com:7000/",
+            "example.com:7000",
+            "http://example.com:7001",
+            "http://127.0.0.1:7000"
+        ]
+        response = self.service_status._probe_endpoints(endpoints)
+        self.assertEqual(mock_get_service_status.call_count, 2)
+        mock_get_service_status.assert_any_call(url="example.com:7000", secure=True)
+        mock_get_service_status.assert_any_call(url="example.com:7001", secure=False)
+        self.assertEqual(response["https://EXAMPLE.com:7000/"], (1, "", ""))
+        self.assertEqual(response["http://127.0.0.1:7000"], (0, "", ""))
+
+    @patch("service_status.service_status.ServiceStatus._get_service_status")
+    def test_probe_endpoints_empty(self, mock_get_service_status):
+        self.assertEqual(self.service_status._probe_endpoints([]), {})
+        mock_get_service_status.assert_not_called()
+
+    @patch("service_status.service_status.ServiceStatus._report_failed_service")
+    @patch("service_status.service_status.ServiceStatus._probe_endpoints")
+    @patch("service_status.service_status.ServiceStatus._get_service_endpoint_data")
+    def test_update_service_status_flushes_in_one_transaction(self, mock_get_service_endpoint_data,
+                                                              mock_probe_endpoints, mock_report_failed_service):
+        mock_get_service_endpoint_data.return_value = [
+            {"row_id": 1, "org_id": "org", "service_id": "svc_1", "endpoint": "https://a.io:7000",
+             "is_available": 0, "failed_status_count": 3},
+            {"row_id": 2, "org_id": "org", "service_id": "svc_2", "endpoint": "https://b.io:7000",
+             "is_available": 1, "failed_status_count": 1}
+        ]
+        mock_probe_endpoints.return_value = {"https://a.io:7000": (1, "", ""), "https://b.io:7000": (0, "", "down")}
+        self.service_status.repo.execute.side_effect = [[2, {"last_row_id": 0}], [2, {"last_row_id": 0}],
+                                                        [2, {"last_row_id": 0}]]
+        self.service_status.update_service_status()
+
+        self.assertEqual(self.service_status.repo.execute.call_count, 3)
+        update_query, update_params = self.service_status.repo.execute.call_args_list[0][0]
+        self.assertIn("CASE row_id", update_query)
+        self.assertEqual(update_params[:4], [1, 1, 2, 0])
+        self.assertEqual(update_params[8:], [1, 0, 2, 1, 1, 2])
+        insert_query, insert_params = self.service_status.repo.execute.call_args_list[1][0]
+        self.assertIn("service_status_stats", insert_query)
+        self.assertEqual(insert_params[:4], ["org", "svc_1", "DOWN", "UP"])
+        self.assertEqual(insert_params[6:10], ["org", "svc_2", "UP", "DOWN"])
+        catalog_query, catalog_params = self.service_status.repo.execute.call_args_list[2][0]
+        self.assertIn("UPDATE service_catalog", catalog_query)
+        self.assertCountEqual(zip(catalog_params[::2], catalog_params[1::2]), [("org", "svc_1"), ("org", "svc_2")])
+        self.service_status.repo.commit_transaction.assert_called_once()
+        self.assertTrue(self.service_status.repo.auto_commit)
+        mock_report_failed_service.assert_called_once()
+
+    @patch("service_status.service_status.ServiceStatus._report_failed_service")
+    @patch("service_status.service_status.ServiceStatus._probe_endpoints")
+    @patch("service_status.service_status.ServiceStatus._get_service_endpoint_data")
+    def test_update_service_status_keeps_status_when_stats_insert_fails(self, mock_get_service_endpoint_data,
+                                                                        mock_probe_endpoints,
+                                                                        mock_report_failed_service):
+        mock_get_service_endpoint_data.return_value = [
+            {"row_id": 1, "org_id": "org", "service_id": "svc_1", "endpoint": "https://a.io:7000",
+             "is_available": 1, "failed_status_count": 1}
+        ]
+        mock_probe_endpoints.return_value = {"https://a.io:7000": (0, "", "down")}
+        self.service_status.repo.execute.side_effect = [[1, {"last_row_id": 0}], Exception("stats insert failed"),
+                                                        [1, {"last_row_id": 0}]]
+        self.service_status.update_service_status()
+
+        self.assertEqual(self.service_status.repo.execute.call_count, 3)
+        self.service_status.repo.commit_transaction.assert_called_once()
+        self.service_status.repo.rollback_transaction.assert_not_called()
+        self.assertIn("UPDATE service_catalog", self.service_status.repo.execute.call_args_list[2][0][0])
+        mock_report_failed_service.assert_called_once()
+
+    @patch("service_status.service_status._created_opensearch_indices", new_callable=set)
+    @patch("service_status.service_status.get_opensearch_client")
+    def test_send_logs_to_opensearch_uses_one_bulk_request(self, mock_get_opensearch_client, _):
+        client = MagicMock()
+        client.indices.exists.return_value = False
+        client.bulk.return_value = {"errors": False}
+        mock_get_opensearch_client.return_value = client
+        for index in range(50):
+            self.service_status._buffer_log_for_opensearch(service_id=f"svc_{index}", debug_error_string="down",
+                                                           org_id="org", endpoint="https://a.io:7000")
+        self.service_status._send_logs_to_opensearch()
+        self.service_status._buffer_log_for_opensearch(service_id="svc", debug_error_string="down",
+                                                       org_id="org", endpoint="https://a.io:7000")
+        self.service_status._send_logs_to_opensearch()
+
+        self.assertEqual(client.indices.exists.call_count, 1)
+        self.assertEqual(client.indices.create.call_count, 1)
+        self.assertEqual(client.bulk.call_count, 2)
+        self.assertEqual(len(client.bulk.call_args_list[0][1]["body"]), 100)
+        client.index.assert_not_called()
+        self.assertEqual(self.service_status.opensearch_documents, [])
@@ -9,6 +9,8 @@ from signer.application.schemas import (
     GetSignatureForOpenChannelForThirdPartyRequest,
     GetSignatureForRegularCallRequest,
     GetSignatureForStateServiceRequest,
+    GetSignaturesForRegularCallsRequest,
+    GetSignaturesForStateServiceRequest,
 )
 from signer.application.service import SignerService
 
@@ -67,6 +69,36 @@ def get_regular_call_signature_handler(event, context):
     )
 
 
+@exception_handler(logger=logger)
+def get_regular_call_signatures_batch_handler(event, context):
+    req_ctx = RequestContext(event)
+
+    request = GetSignaturesForRegularCallsRequest.validate_event(event)
+
+    response = SignerService().get_signatures_for_regular_calls(req_ctx=req_ctx, request=request)
+
+    return generate_lambda_response(
+        StatusCode.OK,
+        {"status": "success", "data": response},
+        cors_enabled=True,
+    )
+
+
+@exception_handler(logger=logger)
+def get_state_service_signatures_batch_handler(event, context):
+    req_ctx = RequestContext(event)
+
+    request = GetSignaturesForStateServiceRequest.validate_event(event)
+
+    response = SignerService().get_signatures_for_state_service(req_ctx=req_ctx, request=request)
+
+    return generate_lambda_response(
+        StatusCode.OK,
+        {"status": "success", "data": response},
+        cors_enabled=True,
+    )
+
+
 @exception_handler(logger=logger)
 def get_open_channel_for_third_party_signature_handler(event, context):
     req_ctx = RequestContext(event)
@@ -2,7 +2,9 @@ import json
 
 from common.constant import PayloadAssertionError, RequestPayloadType
 from common.exceptions import BadRequestException
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, Field, ValidationError
+
+MAX_SIGNATURE_BATCH_SIZE = 500
 
 
 class GetFreeCallSignatureRequest(BaseModel):
@@ -121,3 +123,63 @@ class GetSignatureForOpenChannelForThirdPartyRequest(BaseModel):
             raise BadRequestException(message=str(e))
         except Exception:
             raise BadRequestException(message="Error while parsing payload")
+
+
+class RegularCallItem(BaseModel):
+    channel_id: int
+    nonce: int
+    amount: int
+
+
+class GetSignaturesForRegularCallsRequest(BaseModel):
+    calls: list[RegularCallItem] = Field(min_length=1, max_length=MAX_SIGNATURE_BATCH_SIZE)
+
+    @classmethod
+    def validate_event(cls, event: dict) -> "GetSignaturesForRegularCallsRequest":
+        try:
+            assert event.get(RequestPayloadType.BODY) is not None, (
+                PayloadAssertionError.MISSING_BODY
+            )
+            body = json.loads(event[RequestPayloadType.BODY])
+            return cls.model_validate(body)
+
+        except ValidationError as e:
+            formatted_errors = [
+                {"field": ".".join(str(loc) for loc in err["loc"]), "message": err["msg"]}
+                for err in e.errors()
+            ]
+            raise BadRequestException(
+                message="Validation failed for request body.",
+                details={"validation_erros": formatted_errors},
+            )
+        except AssertionError as e:
+            raise BadRequestException(message=str(e))
+        except Exception:
+            raise BadRequestException(message="Error while parsing payload")
+
+
+class GetSignaturesForStateServiceRequest(BaseModel):
+    channel_ids: list[int] = Field(min_length=1, max_length=MAX_SIGNATURE_BATCH_SIZE)
+
+    @classmethod
+    def validate_event(cls, event: dict) -> "GetSignaturesForStateServiceRequest":
+        try:
+            assert event.get(RequestPayloadType.BODY) is not None, (
+                PayloadAssertionError.MISSING_BODY
+            )
+            body = json.loads(event[RequestPayloadType.BODY])
+            return cls.model_validate(body)
+
+        except ValidationError as e:
+            formatted_errors = [
+                {"field": ".".join(str(loc) for loc in err["loc"]), "message": err["msg"]}
+                for err in e.errors()
+            ]
+            raise BadRequestException(
+                message="Validation failed for request body.",
+                details={"validation_erros": formatted_errors},
+            )
+        except AssertionError as e:
+            raise BadRequestException(message=str(e))
+        except Exception:
+            raise BadRequestException(message="Error while parsing payload")
@@ -1,11 +1,12 @@
-from common.blockchain_util import BlockChainUtil
-from common.constant import ProviderType, TokenSymbol
+from common.constant import TokenSymbol
 from common.request_context import RequestContext
 from signer.application.schemas import (
     GetFreeCallSignatureRequest,
     GetSignatureForOpenChannelForThirdPartyRequest,
     GetSignatureForRegularCallRequest,
     GetSignatureForStateServiceRequest,
+    GetSignaturesForRegularCallsRequest,
+    GetSignaturesForStateServiceRequest,
 )
 from signer.exceptions import DaemonUnavailable, ZeroFreeCallsAvailable
 from signer.infrastructure.contract_api_client import ContractAPIClient
@@ -13,16 +14,13 @@ from signer.infrastructure.daemon_client import DaemonClient, GetFreeCallTokenEr
 from signer.infrastructure.repositories.free_call_token_repository import (
     FreeCallTokenInfoRepository,
 )
-from signer.infrastructure.signers import Signer
+from signer.infrastructure.signers import get_block_number_oracle, get_signer
 from signer.settings import settings
 
 
 class SignerService:
     def __init__(self):
-        self.obj_blockchain_utils = BlockChainUtil(
-            provider_type=ProviderType.http.value,
-            provider=settings.network.networks[settings.network.id].http_provider,
-        )
+        self.block_number_oracle = get_block_number_oracle()
         self.contract_api_client = ContractAPIClient()
         self.daemon_client = DaemonClient()
         self.free_call_token_repository = FreeCallTokenInfoRepository()
@@ -36,9 +34,9 @@ class SignerService:
         self, req_ctx: RequestContext, request: GetFreeCallSignatureRequest
     ):
         token_name = self.__get_token_from_origin(req_ctx.origin)
-        signer = Signer(token_name)
+        signer = get_signer(token_name)
 
-        current_block = self.obj_blockchain_utils.get_current_block_no()
+        current_block = self.block_number_oracle.get_block_number()
 
         free_call_token_info = self.free_call_token_repository.get_free_call_token_info_by_username(
             username=req_ctx.username,
@@ -121,7 +119,7 @@ class SignerService:
         self, req_ctx: RequestContext, request: GetSignatureForStateServiceRequest
     ):
         token_name = self.__get_token_from_origin(req_ctx.origin)
-        signer = Signer(token_name)
+        signer = get_signer(token_name)
 
         return signer.signature_for_state_service(
             username=req_ctx.username, channel_id=request.channel_id
@@ -131,7 +129,7 @@ class SignerService:
         self, req_ctx: RequestContext, request: GetSignatureForRegularCallRequest
     ):
         token_name = self.__get_token_from_origin(req_ctx.origin)
-        signer = Signer(token_name)
+        signer = get_signer(token_name)
 
         return signer.signature_for_regular_call(
             username=req_ctx.username,
@@ -140,11 +138,32 @@ class SignerService:
             amount=request.amount,
         )
 
+    def get_signatures_for_regular_calls(
+        self, req_ctx: RequestContext, request: GetSignaturesForRegularCallsRequest
+    ):
+        token_name = self.__get_token_from_origin(req_ctx.origin)
+        signer = get_signer(token_name)
+
+        return signer.signatures_for_regular_calls(
+            username=req_ctx.username,
+            calls=[(call.channel_id, call.nonce, call.amount) for call in request.calls],
+        )
+
+    def get_signatures_for_state_service(
+        self, req_ctx: RequestContext, request: GetSignaturesForStateServiceRequest
+    ):
+        token_name = self.__get_token_from_origin(req_ctx.origin)
+        signer = get_signer(token_name)
+
+        return signer.signatures_for_state_service(
+            username=req_ctx.username, channel_ids=request.channel_ids
+        )
+
     def get_signature_for_open_channel_for_third_party(
         self, req_ctx: RequestContext, request: GetSignatureForOpenChannelForThirdPartyRequest
     ):
         token_name = self.__get_token_from_origin(origin=req_ctx.origin)
-        signer = Signer(token_name)
+        signer = get_signer(token_name)
 
         return signer.signature_for_open_channel_for_third_party(
             recipient=request.recipient,
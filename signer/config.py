@@ -1,4 +1,4 @@
-from typing import Dict, TypedDict
+from typing import Dict, NotRequired, TypedDict
 
 
 class NetworkConfigDict(TypedDict):
@@ -26,6 +26,9 @@ class SignerConfigDict(TypedDict):
     key: str
     address: str
     expiration_block_count: int
+    block_number_max_staleness_seconds: NotRequired[int]
+    block_number_max_staleness_blocks: NotRequired[int]
+    block_time_seconds: NotRequired[int]
 
 
 class AWSConfigDict(TypedDict):
@@ -64,6 +67,9 @@ SIGNER: SignerConfigDict = {
     "key": "5d66dccb32b03871f30533fe410d2e5998d607a579fb7bc2d991cd2148e3ec69",
     "address": "0xBBE343b9BEf87Fb687cA83A014324d5E52cc3754",
     "expiration_block_count": 100,
+    "block_number_max_staleness_seconds": 12,
+    "block_number_max_staleness_blocks": 1,
+    "block_time_seconds": 12,
 }
 
 AWS: AWSConfigDict = {
@@ -1,8 +1,6 @@
-from urllib.parse import urlparse
-
 import grpc
+from common.grpc_channel_pool import DAEMON_GRPC_TIMEOUT_SECONDS, GrpcChannelPool, get_daemon_channel_pool
 from common.logger import get_logger
-from resources.certificates.root_certificate import certificate
 from signer.stubs import state_service_pb2, state_service_pb2_grpc
 
 logger = get_logger(__name__)
@@ -17,26 +15,8 @@ class GetFreeCallTokenError(Exception):
 
 
 class DaemonClient:
-    def __make_endpoint_channel(self, daemon_endpoint: str):
-        endpoint_object = urlparse(daemon_endpoint)
-        if endpoint_object.hostname is None:
-            raise ValueError("Invalid daemon endpoint: {}".format(daemon_endpoint))
-
-        if endpoint_object.port is not None:
-            channel_endpoint = endpoint_object.hostname + ":" + str(endpoint_object.port)
-        else:
-            channel_endpoint = endpoint_object.hostname
-
-        if endpoint_object.scheme == "http":
-            return grpc.insecure_channel(channel_endpoint)
-        elif endpoint_object.scheme == "https":
-            return grpc.secure_channel(
-                channel_endpoint, grpc.ssl_channel_credentials(root_certificates=certificate)
-            )
-        else:
-            raise ValueError(
-                "Unsupported scheme in service metadata ('{}')".format(endpoint_object.scheme)
-            )
+    def __init__(self, channel_pool: GrpcChannelPool | None = None):
+        self._channel_pool = get_daemon_channel_pool() if channel_pool is None else channel_pool
 
     def get_free_calls_available(
         self,
@@ -55,10 +35,10 @@ class DaemonClient:
             current_block=current_block_number,
         )
 
-        endpoint_channel = self.__make_endpoint_channel(daemon_endpoint)
+        endpoint_channel = self._channel_pool.get_daemon_channel(daemon_endpoint)
 
         stub = state_service_pb2_grpc.FreeCallStateServiceStub(endpoint_channel)
-        response = stub.GetFreeCallsAvailable(request)
+        response = stub.GetFreeCallsAvailable(request, timeout=DAEMON_GRPC_TIMEOUT_SECONDS)
 
         logger.debug("Daemon get free calls available response: ", str(response))
 
@@ -82,10 +62,10 @@ class DaemonClient:
                 token_lifetime_in_blocks=token_lifetime_in_blocks,
             )
 
-            endpoint_channel = self.__make_endpoint_channel(daemon_endpoint)
+            endpoint_channel = self._channel_pool.get_daemon_channel(daemon_endpoint)
 
             stub = state_service_pb2_grpc.FreeCallStateServiceStub(endpoint_channel)
-            response = stub.GetFreeCallToken(request)
+            response = stub.GetFreeCallToken(request, timeout=DAEMON_GRPC_TIMEOUT_SECONDS)
 
             return response.token, response.token_expiration_block
         except grpc.RpcError as e:
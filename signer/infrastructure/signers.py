@@ -1,4 +1,6 @@
-from common.blockchain_util import BlockChainUtil
+from typing import Dict, Optional
+
+from common.blockchain_util import BlockChainUtil, BlockNumberOracle
 from common.constant import ProviderType, TokenSymbol
 from common.logger import get_logger
 from signer.constant import MPE_ADDR_PATH
@@ -7,6 +9,30 @@ from web3 import Web3
 
 logger = get_logger(__name__)
 
+_signers: Dict[TokenSymbol, "Signer"] = {}
+_block_number_oracle: Optional[BlockNumberOracle] = None
+
+
+def get_block_number_oracle() -> BlockNumberOracle:
+    global _block_number_oracle
+    if _block_number_oracle is None:
+        _block_number_oracle = BlockNumberOracle(
+            blockchain_util=BlockChainUtil(
+                provider_type=ProviderType.http.value,
+                provider=settings.network.networks[settings.network.id].http_provider,
+            ),
+            max_staleness_seconds=settings.signer.block_number_max_staleness_seconds,
+            max_staleness_blocks=settings.signer.block_number_max_staleness_blocks,
+            block_time_seconds=settings.signer.block_time_seconds,
+        )
+    return _block_number_oracle
+
+
+def get_signer(token_name: TokenSymbol = TokenSymbol.FET) -> "Signer":
+    if token_name not in _signers:
+        _signers[token_name] = Signer(token_name)
+    return _signers[token_name]
+
 
 class Signer:
     def __init__(self, token_name: TokenSymbol = TokenSymbol.FET):
@@ -21,7 +47,11 @@ class Signer:
             token_name=token_name.value,
             stage=settings.stage,
         )
-        self.current_block_no = self.obj_blockchain_utils.get_current_block_no()
+        self.block_number_oracle = get_block_number_oracle()
+
+    @property
+    def current_block_no(self) -> int:
+        return self.block_number_oracle.get_block_number()
 
     def generate_signature_to_get_free_call_token(
         self,
@@ -80,54 +110,92 @@ class Signer:
         Method to generate signature for regular call.
         """
         try:
-            data_types = ["string", "address", "uint256", "uint256", "uint256"]
-            values = [
-                "__MPE_claim_message",
-                self.mpe_address,
-                channel_id,
-                nonce,
-                amount,
+            return self.__sign_regular_call(channel_id, nonce, amount, self.current_block_no)
+        except Exception as e:
+            logger.error(repr(e))
+            raise Exception("Unable to generate signature for daemon call for username")
+
+    def signatures_for_regular_calls(self, username, calls):
+        """
+        Method to generate signatures for a batch of (channel_id, nonce, amount) regular calls
+        against a single block snapshot. Signatures are returned in the order of the calls.
+        """
+        try:
+            current_block_no = self.current_block_no
+            return [
+                self.__sign_regular_call(channel_id, nonce, amount, current_block_no)
+                for channel_id, nonce, amount in calls
             ]
-            signature = self.obj_blockchain_utils.generate_signature(
-                data_types=data_types, values=values, signer_key=settings.signer.key
-            )
-            return {
-                "snet-payment-channel-signature-bin": signature,
-                "snet-payment-type": "escrow",
-                "snet-payment-channel-id": channel_id,
-                "snet-payment-channel-nonce": nonce,
-                "snet-payment-channel-amount": amount,
-                "snet-current-block-number": self.current_block_no,
-            }
         except Exception as e:
             logger.error(repr(e))
             raise Exception("Unable to generate signature for daemon call for username")
 
+    def __sign_regular_call(self, channel_id, nonce, amount, current_block_no):
+        data_types = ["string", "address", "uint256", "uint256", "uint256"]
+        values = [
+            "__MPE_claim_message",
+            self.mpe_address,
+            channel_id,
+            nonce,
+            amount,
+        ]
+        signature = self.obj_blockchain_utils.generate_signature(
+            data_types=data_types, values=values, signer_key=settings.signer.key
+        )
+        return {
+            "snet-payment-channel-signature-bin": signature,
+            "snet-payment-type": "escrow",
+            "snet-payment-channel-id": channel_id,
+            "snet-payment-channel-nonce": nonce,
+            "snet-payment-channel-amount": amount,
+            "snet-current-block-number": current_block_no,
+        }
+
     def signature_for_state_service(self, username, channel_id):
         """
         Method to generate signature for state service.
         """
         try:
-            data_types = ["string", "address", "uint256", "uint256"]
-            values = [
-                "__get_channel_state",
-                self.mpe_address,
-                channel_id,
-                self.current_block_no,
-            ]
-            signature = self.obj_blockchain_utils.generate_signature(
-                data_types=data_types, values=values, signer_key=settings.signer.key
+            return self.__sign_state_service(channel_id, self.current_block_no)
+        except Exception as e:
+            logger.error(repr(e))
+            raise Exception(
+                "Unable to generate signature for daemon call for username %s", username
             )
-            return {
-                "signature": signature,
-                "snet-current-block-number": self.current_block_no,
-            }
+
+    def signatures_for_state_service(self, username, channel_ids):
+        """
+        Method to generate state service signatures for a batch of channels
+        against a single block snapshot. Signatures are returned in the order of the channels.
+        """
+        try:
+            current_block_no = self.current_block_no
+            return [
+                self.__sign_state_service(channel_id, current_block_no)
+                for channel_id in channel_ids
+            ]
         except Exception as e:
             logger.error(repr(e))
             raise Exception(
                 "Unable to generate signature for daemon call for username %s", username
             )
 
+    def __sign_state_service(self, channel_id, current_block_no):
+        data_types = ["string", "address", "uint256", "uint256"]
+        values = [
+            "__get_channel_state",
+            self.mpe_address,
+            channel_id,
+            current_block_no,
+        ]
+        signature = self.obj_blockchain_utils.generate_signature(
+            data_types=data_types, values=values, signer_key=settings.signer.key
+        )
+        return {
+            "signature": signature,
+            "snet-current-block-number": current_block_no,
+        }
+
     def signature_for_open_channel_for_third_party(
         self,
         recipient,
@@ -27,6 +27,9 @@ class SignerConfig(BaseModel):
     key: str
     address: str
     expiration_block_count: int
+    block_number_max_staleness_seconds: int = 12
+    block_number_max_staleness_blocks: int = 1
+    block_time_seconds: int = 12
 
 
 class LambdaARNConfig(BaseModel):
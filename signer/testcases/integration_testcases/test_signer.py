@@ -3,6 +3,7 @@ import unittest
 from unittest.mock import patch
 
 from signer.application import handlers
+from signer.infrastructure import signers
 
 
 class TestSignUPAPI(unittest.TestCase):
@@ -109,3 +110,114 @@ class TestSignUPAPI(unittest.TestCase):
             response_body["data"]["signature"]
             == "6057e2706d63351e774eaf56616afa7c138129b27b0dfd121457761d4267c3b82f2b98ae088f6e5d4737fae8beba95c7203d33c07baaeccbb8eea5a6c361ae841b"
         )
+
+    @patch("common.blockchain_util.BlockChainUtil.get_current_block_no")
+    @patch("common.blockchain_util.BlockChainUtil.read_contract_address")
+    @patch("boto3.client")
+    def test_signature_reuses_signer_and_block_number(
+        self, mock_boto_client, mock_read_contract_address, mock_current_block_no
+    ):
+        signers._signers.clear()
+        signers._block_number_oracle = None
+        signature_for_regular_call = {
+            "body": '{"channel_id": 1, "nonce": 6487832, "amount": 1}',
+            "requestContext": {
+                "stage": "ropsten",
+                "authorizer": {"claims": {"email": "dummy@dummy.com", "sub": "123"}},
+            },
+            "headers": {"origin": "testnet.marketplace"},
+        }
+        mock_read_contract_address.return_value = "0x8FB1dC8df86b388C7e00689d1eCb533A160B4D0C"
+        mock_current_block_no.return_value = 6521925
+        for _ in range(3):
+            response = handlers.get_regular_call_signature_handler(
+                event=signature_for_regular_call, context=None
+            )
+            assert response["statusCode"] == 200
+        assert mock_read_contract_address.call_count == 1
+        assert mock_current_block_no.call_count == 1
+
+    @patch("common.blockchain_util.BlockChainUtil.get_current_block_no")
+    @patch("common.blockchain_util.BlockChainUtil.read_contract_address")
+    @patch("boto3.client")
+    def test_signatures_for_regular_calls_batch(
+        self, mock_boto_client, mock_read_contract_address, mock_current_block_no
+    ):
+        signers._signers.clear()
+        signers._block_number_oracle = None
+        signatures_for_regular_calls = {
+            "body": json.dumps({
+                "calls": [
+                    {"channel_id": 1, "nonce": 6487832, "amount": 1},
+                    {"channel_id": 2, "nonce": 6487832, "amount": 10},
+                ]
+            }),
+            "requestContext": {
+                "stage": "ropsten",
+                "authorizer": {"claims": {"email": "dummy@dummy.com", "sub": "123"}},
+            },
+            "headers": {"origin": "testnet.marketplace"},
+        }
+        mock_current_block_no.return_value = 6521925
+        mock_read_contract_address.return_value = "0x8FB1dC8df86b388C7e00689d1eCb533A160B4D0C"
+        response = handlers.get_regular_call_signatures_batch_handler(
+            event=signatures_for_regular_calls, context=None
+        )
+        assert response["statusCode"] == 200
+        response_body = json.loads(response["body"])
+        assert response_body["status"] == "success"
+        assert len(response_body["data"]) == 2
+        assert (
+            response_body["data"][0]["snet-payment-channel-signature-bin"]
+            == "505dec3d328eced279a2953e7ba614936a239fb558c80615ff1c97115f8b76ea0530dc47acab7bca8c1dd4563f0299d9b1f61933902919097d82eb0eeb12cb501c"
+        )
+        assert response_body["data"][1]["snet-payment-channel-id"] == 2
+        assert response_body["data"][1]["snet-payment-channel-amount"] == 10
+        assert mock_current_block_no.call_count == 1
+
+    @patch("common.blockchain_util.BlockChainUtil.get_current_block_no")
+    @patch("common.blockchain_util.BlockChainUtil.read_contract_address")
+    @patch("boto3.client")
+    def test_signatures_for_state_service_batch(
+        self, mock_boto_client, mock_read_contract_address, mock_current_block_no
+    ):
+        signers._signers.clear()
+        signers._block_number_oracle = None
+        signatures_for_state_service = {
+            "body": '{"channel_ids": [1, 2, 3]}',
+            "requestContext": {
+                "stage": "ropsten",
+                "authorizer": {"claims": {"email": "dummy@dummy.com", "sub": "123"}},
+            },
+            "headers": {"origin": "testnet.marketplace-api"}
+        }
+        mock_read_contract_address.return_value = "0x8FB1dC8df86b388C7e00689d1eCb533A160B4D0C"
+        mock_current_block_no.return_value = 6521925
+        response = handlers.get_state_service_signatures_batch_handler(
+            event=signatures_for_state_service, context=None
+        )
+        assert response["statusCode"] == 200
+        response_body = json.loads(response["body"])
+        assert len(response_body["data"]) == 3
+        assert (
+            response_body["data"][0]["signature"]
+            == "f4fad486513c6e514869a2af9423de3c1e03c9953b4cd79c4d78f7f8f54da1a01812d7c58120c038ead631e2462ab788746972cad46f4e7f2f1bd79b863b54681c"
+        )
+        assert all(
+            item["snet-current-block-number"] == mock_current_block_no.return_value
+            for item in response_body["data"]
+        )
+
+    def test_signatures_batch_rejects_empty_request(self):
+        signatures_for_state_service = {
+            "body": '{"channel_ids": []}',
+            "requestContext": {
+                "stage": "ropsten",
+                "authorizer": {"claims": {"email": "dummy@dummy.com", "sub": "123"}},
+            },
+            "headers": {"origin": "testnet.marketplace-api"}
+        }
+        response = handlers.get_state_service_signatures_batch_handler(
+            event=signatures_for_state_service, context=None
+        )
+        assert response["statusCode"] == 400
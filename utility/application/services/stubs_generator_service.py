@@ -3,6 +3,8 @@ import os
 import tempfile
 import uuid
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from importlib.resources import files
 
@@ -55,6 +57,9 @@ class StubsGeneratorService:
             f"input_s3_file_key: {input_s3_file_key}, temp_proto_file_path: {temp_proto_file_path}"
         )
 
+        # Seconds spent in every stage, reported at the end to spot slow compilers
+        timings = {}
+        stage_started_at = time.monotonic()
         # Clear temp files from s3
         BotoUtils.clear_s3_files(bucket=input_bucket_name, key=temp_proto_file_path)
         self._download_extract_and_upload_proto_files(
@@ -64,6 +69,7 @@ class StubsGeneratorService:
             download_file_path=input_file_path,
             upload_file_path=temp_proto_file_path,
         )
+        timings["extract_proto"] = round(time.monotonic() - stage_started_at, 3)
 
         # Compile lambdas --> move stubs to temp file
         temp_output_path = (
@@ -77,29 +83,19 @@ class StubsGeneratorService:
                 "service_id": service_id,
             }
         )
-        response = {}
-        for environment in settings.compile_proto.SUPPORTED_ENVIRONMENT:
-            if environment in "python":
-                response = boto_utils.invoke_lambda(
-                    invocation_type="RequestResponse",
-                    payload=lambda_payload,
-                    lambda_function_arn=settings.compile_proto.ARN.PYTHON_PROTO_LAMBDA_ARN,
-                )
-            elif environment in "nodejs":
-                response = boto_utils.invoke_lambda(
-                    invocation_type="RequestResponse",
-                    payload=lambda_payload,
-                    lambda_function_arn=settings.compile_proto.ARN.NODEJS_PROTO_LAMBDA_ARN,
-                )
+        responses = self._invoke_proto_compilers(lambda_payload, timings)
+        for environment, response in responses.items():
             if response.get("statusCode", {}) != 200:
                 raise Exception(
-                    f"Invalid proto file found on given path :: {input_s3_path} :: response :: {response}"
+                    f"Invalid proto file found on given path :: {input_s3_path} :: "
+                    f"environment :: {environment} :: response :: {response}"
                 )
 
-        logger.info(f"Getting response from proto compilation lambda :: {response}")
+        logger.info(f"Getting response from proto compilation lambdas :: {responses}")
 
         # Move objects from temp folder to output if success
         # if no output path only remove temp extracted proto
+        stage_started_at = time.monotonic()
         if output_s3_path:
             boto_utils.move_s3_objects(
                 source_bucket=input_bucket_name,
@@ -117,8 +113,43 @@ class StubsGeneratorService:
             )
         else:
             BotoUtils.clear_s3_files(bucket=input_bucket_name, key=temp_proto_file_path)
+        timings["move_stubs"] = round(time.monotonic() - stage_started_at, 3)
+        logger.info(f"Proto compilation timings :: org_id: {org_id}, service_id: {service_id} :: {timings}")
         return {}
 
+    @staticmethod
+    def _invoke_proto_compilers(lambda_payload: str, timings: dict) -> dict:
+        """
+        Invokes the compiler lambda of every supported environment in parallel and waits for all of them.
+        Returns the response of every environment and adds its duration to timings.
+        """
+        compiler_arns = {
+            "python": settings.compile_proto.ARN.PYTHON_PROTO_LAMBDA_ARN,
+            "nodejs": settings.compile_proto.ARN.NODEJS_PROTO_LAMBDA_ARN,
+        }
+        environments = []
+        for environment in settings.compile_proto.SUPPORTED_ENVIRONMENT:
+            if environment in compiler_arns:
+                environments.append(environment)
+            else:
+                logger.warning(f"No proto compiler for environment :: {environment}")
+        if not environments:
+            return {}
+
+        def compile_proto(environment):
+            started_at = time.monotonic()
+            response = boto_utils.invoke_lambda(
+                invocation_type="RequestResponse",
+                payload=lambda_payload,
+                lambda_function_arn=compiler_arns[environment],
+            )
+            timings[f"compile_{environment}"] = round(time.monotonic() - started_at, 3)
+            return response
+
+        with ThreadPoolExecutor(max_workers=len(environments)) as executor:
+            responses = executor.map(compile_proto, environments)
+            return dict(zip(environments, responses))
+
     def generate_python_stubs(self, request: StubsGenerationRequest):
         input_s3_path = request.input_s3_path
         output_s3_path = request.output_s3_path
@@ -0,0 +1,66 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+from utility.application.services.stubs_generator_service import StubsGeneratorService
+from utility.settings import settings
+
+STUBS_GENERATOR_SERVICE = "utility.application.services.stubs_generator_service"
+
+
+class TestInvokeProtoCompilers(unittest.TestCase):
+    def setUp(self):
+        patchers = [
+            patch.object(
+                settings.compile_proto, "SUPPORTED_ENVIRONMENT", ["python", "nodejs", "java"]
+            ),
+            patch.object(settings.compile_proto.ARN, "PYTHON_PROTO_LAMBDA_ARN", "python_arn"),
+            patch.object(settings.compile_proto.ARN, "NODEJS_PROTO_LAMBDA_ARN", "nodejs_arn"),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    @patch(f"{STUBS_GENERATOR_SERVICE}.boto_utils.invoke_lambda")
+    def test_compilers_are_invoked_in_parallel_per_environment(self, invoke_lambda):
+        # Both compilers have to be running at the same time to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def compile_proto(invocation_type, payload, lambda_function_arn):
+            barrier.wait()
+            return {"statusCode": 200, "body": lambda_function_arn}
+
+        invoke_lambda.side_effect = compile_proto
+        timings = {}
+
+        responses = StubsGeneratorService._invoke_proto_compilers('{"org_id": "org"}', timings)
+
+        self.assertEqual(responses, {
+            "python": {"statusCode": 200, "body": "python_arn"},
+            "nodejs": {"statusCode": 200, "body": "nodejs_arn"},
+        })
+        self.assertEqual(set(timings), {"compile_python", "compile_nodejs"})
+        payloads = [call.kwargs["payload"] for call in invoke_lambda.call_args_list]
+        self.assertEqual(payloads, ['{"org_id": "org"}'] * 2)
+
+    @patch(f"{STUBS_GENERATOR_SERVICE}.boto_utils.invoke_lambda")
+    def test_failed_compiler_response_is_returned(self, invoke_lambda):
+        invoke_lambda.side_effect = lambda invocation_type, payload, lambda_function_arn: (
+            {"statusCode": 500} if lambda_function_arn == "nodejs_arn" else {"statusCode": 200}
+        )
+
+        responses = StubsGeneratorService._invoke_proto_compilers("{}", {})
+
+        self.assertEqual(responses, {"python": {"statusCode": 200}, "nodejs": {"statusCode": 500}})
+
+    @patch(f"{STUBS_GENERATOR_SERVICE}.boto_utils.invoke_lambda")
+    def test_no_supported_environment(self, invoke_lambda):
+        with patch.object(settings.compile_proto, "SUPPORTED_ENVIRONMENT", ["java"]):
+            responses = StubsGeneratorService._invoke_proto_compilers("{}", {})
+
+        self.assertEqual(responses, {})
+        invoke_lambda.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()